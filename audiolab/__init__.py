@@ -15,25 +15,55 @@
 from __future__ import annotations
 
 from base64 import b64encode
+from importlib import import_module
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
 
 import numpy as np
 
-from audiolab.av import (
-    AudioCache,
-    clip,
-    from_ndarray,
-    get_dtype,
-    get_format,
-    split_audio_frame,
-    to_ndarray,
-)
-from audiolab.av.typing import Dtype
-from audiolab.pipe import AudioPipe
-from audiolab.reader import Reader, StreamReader, aformat, info, load_audio
-from audiolab.writer import Writer, save_audio
+if TYPE_CHECKING:
+    from audiolab.av import AudioCache, from_ndarray, get_dtype, get_format, split_audio_frame, to_ndarray
+    from audiolab.av.typing import Dtype
+    from audiolab.pipe import AudioPipe
+    from audiolab.reader import Reader, StreamReader, aformat, info, load_audio, load_audio_batch
+    from audiolab.writer import Writer, save_audio
+
+# The public names are resolved on first access (PEP 562), so that `import audiolab` does not pull in PyAV,
+# soundfile and the other heavy dependencies of the subpackages until they are needed.
+_lazy_attrs = {
+    "AudioCache": "audiolab.av",
+    "from_ndarray": "audiolab.av",
+    "get_dtype": "audiolab.av",
+    "get_format": "audiolab.av",
+    "split_audio_frame": "audiolab.av",
+    "to_ndarray": "audiolab.av",
+    "AudioPipe": "audiolab.pipe",
+    "Reader": "audiolab.reader",
+    "StreamReader": "audiolab.reader",
+    "aformat": "audiolab.reader",
+    "info": "audiolab.reader",
+    "load_audio": "audiolab.reader",
+    "load_audio_batch": "audiolab.reader",
+    "Writer": "audiolab.writer",
+    "save_audio": "audiolab.writer",
+}
+_lazy_submodules = ("aio", "av", "cli", "pipe", "reader", "writer")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attrs:
+        value = getattr(import_module(_lazy_attrs[name]), name)
+    elif name in _lazy_submodules:
+        value = import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attrs) | set(_lazy_submodules))
 
 
 def encode(
@@ -57,6 +87,10 @@ def encode(
     Returns:
         The audio as a PCM bytestring and the sample rate of the audio.
     """
+    from audiolab.av import clip
+    from audiolab.reader import load_audio
+    from audiolab.writer import save_audio
+
     if isinstance(audio, (str, Path)):
         audio, rate = load_audio(audio, dtype=dtype, rate=rate, to_mono=to_mono)
 
@@ -85,6 +119,7 @@ __all__ = [
     "get_format",
     "info",
     "load_audio",
+    "load_audio_batch",
     "save_audio",
     "split_audio_frame",
     "to_ndarray",
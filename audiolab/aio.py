@@ -0,0 +1,213 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import Any, AsyncIterable, AsyncIterator, Callable, List, Optional
+
+import numpy as np
+
+from audiolab import reader, writer
+from audiolab.av.lhotse import load_url
+from audiolab.av.typing import AudioFrame, Dtype
+
+# The blocking work of the awaitables runs on two managed thread pools instead of the event loop: decoding and
+# encoding (PyAV and libsndfile release the GIL) on a pool bounded by the number of CPUs, and the network I/O of
+# URLs on a larger pool, so that slow downloads do not hold the decoding workers.
+_executors = {}
+_max_workers = {"decode": min(32, os.cpu_count() or 1), "io": 64}
+_lock = Lock()
+
+
+def setup(max_workers: Optional[int] = None, max_io_workers: Optional[int] = None):
+    """
+    Size the thread pools, the running tasks of the previous pools are completed.
+
+    Args:
+        max_workers: The maximum number of threads decoding and encoding, the number of CPUs (at most 32) by default.
+        max_io_workers: The maximum number of threads fetching URLs, 64 by default.
+    """
+    with _lock:
+        if max_workers is not None:
+            _max_workers["decode"] = max_workers
+        if max_io_workers is not None:
+            _max_workers["io"] = max_io_workers
+        for executor in _executors.values():
+            executor.shutdown(wait=False)
+        _executors.clear()
+
+
+def get_executor(kind: str = "decode") -> ThreadPoolExecutor:
+    with _lock:
+        if kind not in _executors:
+            _executors[kind] = ThreadPoolExecutor(_max_workers[kind], thread_name_prefix=f"audiolab-aio-{kind}")
+        return _executors[kind]
+
+
+def shutdown(wait: bool = True):
+    with _lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait)
+        _executors.clear()
+
+
+async def run(func: Callable, *args, kind: str = "decode", **kwargs) -> Any:
+    """
+    Run a blocking function on the thread pool of `kind` ("decode" or "io") without blocking the event loop.
+    """
+    return await asyncio.get_running_loop().run_in_executor(get_executor(kind), partial(func, *args, **kwargs))
+
+
+def is_url(file: Any) -> bool:
+    return isinstance(file, str) and "://" in file
+
+
+async def fetch(file: Any, **kwargs) -> Any:
+    # download the whole remote files on the I/O pool, the partial reads are fetched by the range requests of Reader
+    if is_url(file) and kwargs.get("offset", 0) == 0 and kwargs.get("duration") is None:
+        return await run(load_url, file, kwargs.get("cache_url", False), kind="io")
+    return file
+
+
+async def info(file: Any, **kwargs):
+    """
+    Get the information of an audio file, see `audiolab.info`.
+    """
+    # the headers of remote files are fetched by range requests, which wait on the network
+    return await run(reader.info, file, kind="io" if is_url(file) else "decode", **kwargs)
+
+
+async def load_audio(file: Any, **kwargs) -> AudioFrame:
+    """
+    Load an audio file, see `audiolab.load_audio`. Use `Reader` to iterate over the frames of the audio.
+    """
+    if kwargs.get("frame_size") is not None:
+        raise ValueError("aio.load_audio loads the whole audio, use aio.Reader to iterate over the frames")
+    if kwargs.get("cache", False) is False:
+        # the decoded audio cache is keyed by the URL, so the hits are not fetched
+        file = await fetch(file, **kwargs)
+    return await run(reader.load_audio, file, kind="io" if is_url(file) else "decode", **kwargs)
+
+
+async def save_audio(file: Any, frame: np.ndarray, rate: int, dtype: Optional[Dtype] = None, format: str = "WAV"):
+    """
+    Save an audio to a file, see `audiolab.save_audio`.
+    """
+    await run(writer.save_audio, file, frame, rate, dtype, format)
+
+
+class Reader:
+    """
+    Asynchronous iterator over the audio frames of `audiolab.Reader`, which decodes on the thread pool.
+
+    Example:
+        async for frame, rate in aio.Reader("audio.flac", frame_size=16000):
+            ...
+    """
+
+    _end = object()
+
+    def __init__(self, file: Any, **kwargs):
+        """
+        Create a Reader object.
+
+        Args:
+            file: The input audio file, audio url, path to audio file, bytes of audio data, etc.
+            kwargs: The arguments of `audiolab.Reader`.
+        """
+        self.file = file
+        self.kwargs = kwargs
+        self.reader = None
+        self.iterator = None
+
+    async def open(self):
+        """
+        Open the audio file (fetching the whole remote file if needed), which is done by the first iteration otherwise.
+
+        Returns:
+            The `audiolab.Reader` object.
+        """
+        if self.reader is None:
+            file = await fetch(self.file, **self.kwargs)
+            self.reader = await run(reader.Reader, file, kind="io" if is_url(file) else "decode", **self.kwargs)
+            self.iterator = iter(self.reader)
+        return self.reader
+
+    def __aiter__(self) -> AsyncIterator[AudioFrame]:
+        return self
+
+    async def __anext__(self) -> AudioFrame:
+        await self.open()
+        frame = await run(next, self.iterator, Reader._end, kind="io" if is_url(self.file) else "decode")
+        if frame is Reader._end:
+            raise StopAsyncIteration
+        return frame
+
+
+class StreamReader:
+    """
+    Asynchronous `audiolab.StreamReader`, which decodes the pushed bytes on the thread pool.
+
+    Example:
+        stream_reader = aio.StreamReader(dtype=np.float32, rate=16000)
+        async for frame, rate in stream_reader.decode(websocket_chunks):
+            ...
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Create a StreamReader object.
+
+        Args:
+            kwargs: The arguments of `audiolab.StreamReader`.
+        """
+        self.stream_reader = reader.StreamReader(**kwargs)
+        # the pushes and pulls of a stream are decoded in order, one at a time
+        self.lock = asyncio.Lock()
+
+    async def push(self, data: bytes, partial: bool = False) -> List[AudioFrame]:
+        """
+        Push the bytes of the audio stream.
+
+        Args:
+            data: The bytes of the audio stream.
+            partial: Whether to decode the partial frames at the end of the stream.
+        Returns:
+            The audio frames decoded so far.
+        """
+        async with self.lock:
+            self.stream_reader.push(data)
+            return await run(lambda: list(self.stream_reader.pull(partial=partial)))
+
+    async def flush(self) -> List[AudioFrame]:
+        """
+        Decode the remaining audio frames at the end of the stream.
+        """
+        return await self.push(b"", partial=True)
+
+    async def decode(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[AudioFrame]:
+        """
+        Decode an asynchronous iterable of bytes (e.g. the messages of a websocket) into audio frames.
+        """
+        async for chunk in chunks:
+            for frame in await self.push(chunk):
+                yield frame
+        for frame in await self.flush():
+            yield frame
+
+    def reset(self):
+        self.stream_reader.reset()
@@ -12,19 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import av
 import numpy as np
 
-from audiolab.av import filter
-from audiolab.av.codec import Decodec, Encodec, canonical_names, decodecs, encodecs
-from audiolab.av.container import ContainerFormat, container_formats, extension_formats
+from audiolab.av import codec, container, filter
+from audiolab.av.container import extension_formats
 from audiolab.av.format import AudioFormat, audio_formats, get_codecs, get_dtype, get_format
 from audiolab.av.frame import clip, from_ndarray, split_audio_frame, to_ndarray
 from audiolab.av.graph import Graph
 from audiolab.av.layout import AudioLayout, audio_layouts, standard_channel_layouts
-from audiolab.av.lhotse import AudioCache, load_url
+from audiolab.av.lhotse import AudioCache, HTTPSession, get_audio_cache, load_url
+from audiolab.av.remote import RemoteFile
 
 
 def aformat(
@@ -46,6 +46,15 @@ def aformat(
     return filter.aformat(**kwargs)
 
 
+def __getattr__(name: str) -> Any:
+    # The codec and container registries are built on first access, see `audiolab.av.codec`.
+    if name in ("Decodec", "Encodec", "canonical_names", "decodecs", "encodecs"):
+        return getattr(codec, name)
+    if name in ("ContainerFormat", "container_formats"):
+        return getattr(container, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "AudioCache",
     "AudioFormat",
@@ -55,6 +64,8 @@ __all__ = [
     "Encodec",
     "Filter",
     "Graph",
+    "HTTPSession",
+    "RemoteFile",
     "aformat",
     "audio_formats",
     "audio_layouts",
@@ -65,6 +76,7 @@ __all__ = [
     "encodecs",
     "extension_formats",
     "from_ndarray",
+    "get_audio_cache",
     "get_codecs",
     "get_dtype",
     "get_format",
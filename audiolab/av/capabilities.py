@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+
+import av
+from av import codecs_available
+from av.codec.codec import UnknownCodecError
+
+from audiolab.av.utils import atomic_open, get_cache_dir, get_logger
+
+logger = get_logger(__name__)
+
+"""
+Capability index of the PyAV/FFmpeg build: the audio codecs with their sample formats and the container
+formats with their extensions. It is deterministic for a given build, so it is probed once and persisted
+in the cache directory, keyed by the versions of PyAV and the FFmpeg libraries.
+
+{
+    "codecs": {
+        "r": {codec_name: {"canonical_name": canonical_name, "formats": [format_name, ...]}, ...},
+        "w": {codec_name: {"canonical_name": canonical_name, "formats": [format_name, ...]}, ...},
+    },
+    "containers": {format_name: [extension, ...], ...},
+}
+"""
+INDEX_VERSION = 1
+
+
+def get_index_path() -> Path:
+    versions = json.dumps({"index": INDEX_VERSION, **av.library_versions}, sort_keys=True)
+    digest = hashlib.sha1(versions.encode()).hexdigest()[:12]
+    return get_cache_dir("capabilities", f"pyav-{av.__version__}-ffmpeg-{digest}.json")
+
+
+def probe_capabilities() -> Dict[str, Any]:
+    codecs = {"r": {}, "w": {}}
+    for name in codecs_available:
+        for mode in ("r", "w"):
+            try:
+                codec = av.Codec(name, mode)
+            except UnknownCodecError:
+                continue
+            if codec.type != "audio" or codec.audio_formats is None or codec.name in codecs[mode]:
+                continue
+            codecs[mode][codec.name] = {
+                "canonical_name": codec.canonical_name,
+                "formats": sorted(format.name for format in codec.audio_formats),
+            }
+
+    containers = {}
+    for name in av.formats_available:
+        containers[name] = sorted(av.ContainerFormat(name).extensions)
+    return {"codecs": codecs, "containers": containers}
+
+
+@lru_cache(maxsize=None)
+def get_capabilities() -> Dict[str, Any]:
+    """
+    Load the capability index of the PyAV/FFmpeg build, probing FFmpeg only if it is not persisted yet.
+    """
+    path = get_index_path()
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    capabilities = probe_capabilities()
+    try:
+        # the processes probing concurrently never read a partial index
+        with atomic_open(path, "w") as f:
+            json.dump(capabilities, f)
+    except OSError as e:
+        logger.debug("Failed to save the capability index to %s: %s", path, e)
+    return capabilities
@@ -13,13 +13,14 @@
 # limitations under the License.
 
 from collections import defaultdict
-from typing import Dict, Set
+from functools import cached_property
+from threading import Lock
+from typing import Any, Dict, Set
 
 import av
 import numpy as np
-from av import codecs_available
-from av.codec.codec import UnknownCodecError
 
+from audiolab.av.capabilities import get_capabilities
 from audiolab.av.format import format_dtypes
 from audiolab.av.typing import CodecEnum
 from audiolab.av.utils import get_template
@@ -33,45 +34,67 @@ $ ffmpeg -encoders
 
 class CodecManager:
     def __init__(self):
-        self.canonical_names: Dict[str, Set[str]] = defaultdict(set)
-        self.decodecs: Dict[str, av.Codec] = {}
-        self.encodecs: Dict[str, av.Codec] = {}
-
-        for codec in codecs_available:
-            try:
-                decoder_codec = av.Codec(codec)
-                if decoder_codec.type != "audio":
-                    continue
-                if decoder_codec.audio_formats is not None:
-                    canonical_name = decoder_codec.canonical_name
-                    codec_name = decoder_codec.name
-                    self.canonical_names[canonical_name].add(codec_name)
-                    if codec_name not in self.decodecs:
-                        self.decodecs[codec_name] = decoder_codec
-
-                encoder_codec = av.Codec(codec, "w")
-                if encoder_codec.audio_formats is not None:
-                    canonical_name = encoder_codec.canonical_name
-                    codec_name = encoder_codec.name
-                    self.canonical_names[canonical_name].add(codec_name)
-                    if codec_name not in self.encodecs:
-                        self.encodecs[codec_name] = encoder_codec
-            except UnknownCodecError:
-                pass
-
-        self.Decodec = CodecEnum("Decodec", self.decodecs)
-        self.Encodec = CodecEnum("Encodec", self.encodecs)
-
-        template = get_template("codec")
-        for name, codec in self.decodecs.items():
-            getattr(self.Decodec, name).__doc__ = template.render(codec=codec, format_dtypes=format_dtypes, np=np)
-        for name, codec in self.encodecs.items():
-            getattr(self.Encodec, name).__doc__ = template.render(codec=codec, format_dtypes=format_dtypes, np=np)
+        self._canonical_names: Dict[str, Set[str]] = defaultdict(set)
+        self._decodecs: Dict[str, av.Codec] = {}
+        self._encodecs: Dict[str, av.Codec] = {}
+        self._initialized: bool = False
+        self._lock: Lock = Lock()
+
+    def _generate_codec_data(self) -> None:
+        codecs = get_capabilities()["codecs"]
+        for mode, _codecs in (("r", self._decodecs), ("w", self._encodecs)):
+            for codec_name, codec in codecs[mode].items():
+                self._canonical_names[codec["canonical_name"]].add(codec_name)
+                _codecs[codec_name] = av.Codec(codec_name, mode)
+
+    def _initialize_codecs(self) -> None:
+        with self._lock:
+            if self._initialized:
+                return
+            self._generate_codec_data()
+            self._initialized = True
+
+    @cached_property
+    def template(self):
+        return get_template("codec")
+
+    def render(self, codec: av.Codec) -> str:
+        return self.template.render(codec=codec, format_dtypes=format_dtypes, np=np)
+
+    @property
+    def canonical_names(self) -> Dict[str, Set[str]]:
+        self._initialize_codecs()
+        return self._canonical_names
+
+    @property
+    def decodecs(self) -> Dict[str, av.Codec]:
+        self._initialize_codecs()
+        return self._decodecs
+
+    @property
+    def encodecs(self) -> Dict[str, av.Codec]:
+        self._initialize_codecs()
+        return self._encodecs
+
+    @cached_property
+    def Decodec(self) -> CodecEnum:
+        Decodec = CodecEnum("Decodec", self.decodecs)
+        # docstrings are rendered on first access of `Decodec.<name>.__doc__`
+        Decodec.lazy_doc(self.render)
+        return Decodec
+
+    @cached_property
+    def Encodec(self) -> CodecEnum:
+        Encodec = CodecEnum("Encodec", self.encodecs)
+        Encodec.lazy_doc(self.render)
+        return Encodec
 
 
 _codec_manager = CodecManager()
-canonical_names = _codec_manager.canonical_names
-decodecs = _codec_manager.decodecs
-encodecs = _codec_manager.encodecs
-Decodec = _codec_manager.Decodec
-Encodec = _codec_manager.Encodec
+
+
+def __getattr__(name: str) -> Any:
+    # canonical_names, decodecs, encodecs, Decodec and Encodec are built on first access
+    if name in ("canonical_names", "decodecs", "encodecs", "Decodec", "Encodec"):
+        return getattr(_codec_manager, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,25 +13,41 @@
 # limitations under the License.
 
 from collections import defaultdict
-from typing import Dict, Set
+from functools import lru_cache
+from typing import Any, Dict, Set
 
 import av
 
+from audiolab.av.capabilities import get_capabilities
 from audiolab.av.typing import ContainerFormatEnum
 from audiolab.av.utils import get_template
 
 """
 $ ffmpeg -formats
 """
-container_formats: Dict[str, av.ContainerFormat] = {}
 extension_formats: Dict[str, Set[str]] = defaultdict(set)
-for name in av.formats_available:
-    container_formats[name] = av.ContainerFormat(name)
-    for extension in container_formats[name].extensions:
+for name, extensions in get_capabilities()["containers"].items():
+    for extension in extensions:
         extension_formats[extension].add(name)
-ContainerFormat = ContainerFormatEnum("ContainerFormat", container_formats)
 
 
-template = get_template("container")
-for name, format in container_formats.items():
-    getattr(ContainerFormat, name).__doc__ = template.render(format=format)
+@lru_cache(maxsize=None)
+def get_container_formats() -> Dict[str, av.ContainerFormat]:
+    return {name: av.ContainerFormat(name) for name in get_capabilities()["containers"]}
+
+
+@lru_cache(maxsize=None)
+def get_container_format_enum() -> ContainerFormatEnum:
+    ContainerFormat = ContainerFormatEnum("ContainerFormat", get_container_formats())
+    template = get_template("container")
+    ContainerFormat.lazy_doc(lambda format: template.render(format=format))
+    return ContainerFormat
+
+
+def __getattr__(name: str) -> Any:
+    # container_formats and ContainerFormat are built on first access
+    if name == "container_formats":
+        return get_container_formats()
+    if name == "ContainerFormat":
+        return get_container_format_enum()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
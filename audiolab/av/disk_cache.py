@@ -0,0 +1,198 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from audiolab.av.utils import atomic_open, get_cache_dir, get_logger
+
+logger = get_logger(__name__)
+
+CACHE_VERSION = 1
+# the fraction of the byte budget kept by an eviction, so that the next insertions do not evict again
+EVICTION_RATIO = 0.9
+# the interval (in seconds) between two scans of the bytes of the values, which the other processes insert too
+SCAN_INTERVAL = 60
+
+
+def get_hash(data: Union[str, bytes]) -> str:
+    return hashlib.sha256(data.encode() if isinstance(data, str) else data).hexdigest()
+
+
+class DiskCache:
+    """
+    Persistent cache of 'bytes' objects in a directory, shared by the processes (and nodes) which use it.
+
+    The values are content-addressed files (`objects/<sha256 of the bytes>`), which deduplicates the same audio
+    under different keys, and each key is a small file holding the hash of its value (`keys/<sha256 of the key>`).
+    Both are written atomically (temporary file and rename), so concurrent readers never see a partial file,
+    and a file deleted by another process is a cache miss.
+    The modification time of the values is their last access, the least recently used values are evicted when
+    the values take more than `max_bytes`, along with the keys left without values.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_bytes: int = 10 * 1024**3):
+        """
+        Create a DiskCache object.
+
+        Args:
+            path: The directory of the cache, `$AUDIOLAB_CACHE_DIR/audio-v1` by default.
+            max_bytes: The maximum number of bytes of the cached values.
+        """
+        self.path = get_cache_dir(f"audio-v{CACHE_VERSION}") if path is None else Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # the bytes of the values, scanned periodically and updated by the insertions of this process in between
+        self._num_bytes = None
+        self._scanned = None
+
+    def key_path(self, key: str) -> Path:
+        digest = get_hash(key)
+        return self.path / "keys" / digest[:2] / digest
+
+    def object_path(self, digest: str) -> Path:
+        return self.path / "objects" / digest[:2] / digest
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get the cached value of a key.
+
+        Args:
+            key: The key (e.g. the URL of an audio file).
+        Returns:
+            The cached bytes, or None if the key is not cached.
+        """
+        key_path = self.key_path(key)
+        try:
+            digest = key_path.read_text().strip()
+        except OSError:
+            return None
+        path = self.object_path(digest)
+        try:
+            value = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            # the value is evicted, and the key is dangling
+            self.remove(key_path)
+            return None
+        if get_hash(value) != digest:
+            logger.debug("Discarding the corrupted cache file %s", path)
+            self.remove(path)
+            return None
+        return value
+
+    def put(self, key: str, value: bytes):
+        """
+        Cache the value of a key, evicting the least recently used values if the cache is full.
+
+        Args:
+            key: The key (e.g. the URL of an audio file).
+            value: The bytes to cache.
+        """
+        if len(value) > self.max_bytes:
+            return
+        key_path = self.key_path(key)
+        try:
+            # the key is cached already (e.g. by another process), which skips hashing the value again
+            path = self.object_path(key_path.read_text().strip())
+            if path.stat().st_size == len(value):
+                os.utime(path)
+                return
+        except OSError:
+            pass
+        digest = get_hash(value)
+        path = self.object_path(digest)
+        try:
+            if path.exists():
+                os.utime(path)
+                num_bytes = 0
+            else:
+                with atomic_open(path) as f:
+                    f.write(value)
+                num_bytes = len(value)
+            with atomic_open(key_path, "w") as f:
+                f.write(digest)
+        except OSError as e:
+            logger.debug("Failed to write the disk cache %s: %s", self.path, e)
+            return
+        with self._lock:
+            if self._scanned is None or time.monotonic() - self._scanned > SCAN_INTERVAL:
+                self._num_bytes = self.scan()[1]
+            else:
+                self._num_bytes += num_bytes
+            if self._num_bytes > self.max_bytes:
+                self.evict()
+
+    def scan(self):
+        # the (mtime, size, path) of the values and their total bytes
+        self._scanned = time.monotonic()
+        files, num_bytes = [], 0
+        for directory in (self.path / "objects").glob("*"):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+                        num_bytes += stat.st_size
+            except OSError:
+                continue
+        return files, num_bytes
+
+    def evict(self):
+        # rescan, since the other processes insert and evict too
+        files, num_bytes = self.scan()
+        target = self.max_bytes * EVICTION_RATIO
+        for _, size, path in sorted(files):
+            if num_bytes <= target:
+                break
+            if self.remove(path):
+                num_bytes -= size
+        self._num_bytes = num_bytes
+        # the keys are written after their values, so the keys without values are dangling
+        for path in (self.path / "keys").glob("*/*"):
+            try:
+                digest = path.read_text().strip()
+            except OSError:
+                continue
+            if not self.object_path(digest).exists():
+                self.remove(path)
+
+    @staticmethod
+    def remove(path: Union[str, Path]) -> bool:
+        # the keys of a removed value are dangling, which are cache misses and removed by `get` and `evict`
+        try:
+            os.unlink(path)
+            return True
+        except OSError:
+            return False
+
+    def clear(self):
+        with self._lock:
+            for directory in ("keys", "objects"):
+                for path in (self.path / directory).glob("*/*"):
+                    self.remove(path)
+            self._num_bytes = 0
+
+    @property
+    def num_bytes(self) -> int:
+        return self.scan()[1]
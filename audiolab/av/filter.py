@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Callable, Dict, List
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional
 
 from av import filter
 from av.option import OptionType
@@ -24,56 +25,82 @@ $ ffmpeg -filters
 """
 
 
+# Callable which builds the filter description `(name, args, kwargs)` for `Graph`.
+# The docstring is rendered from the filter options on first access of `__doc__`.
+class FilterFunction:
+    def __init__(self, name: str, manager: "FilterManager"):
+        self.__name__ = name
+        self.__qualname__ = name
+        self._manager = manager
+
+    def __call__(self, args=None, **kwargs):
+        return (self.__name__, None if args is None else str(args), {k: str(v) for k, v in kwargs.items()})
+
+    def __repr__(self) -> str:
+        return f"<filter {self.__name__}>"
+
+    @cached_property
+    def __doc__(self) -> str:
+        data = self._manager._generate_filter_data(self.__name__)
+        return get_template("filter").render(
+            name=data["name"], description=data["description"], options=data["options"]
+        )
+
+
 class FilterManager:
     def __init__(self):
         self._filter_data: Dict[str, Dict[str, Any]] = {}
         self._initialized: bool = False
 
-    def _generate_filter_data(self) -> None:
-        for name in filter.filters_available:
-            options = []
-            _filter = filter.Filter(name)
-            if _filter.options is not None:
-                for opt in _filter.options:
-                    try:
-                        opt_type = opt.type
-                    except ValueError:
-                        opt_type = OptionType.STRING
-                    options.append(
-                        {
-                            "name": opt.name,
-                            "type": opt_type,
-                            "default": opt.default,
-                            "help": opt.help if opt.name != "temp" else "set temperature °C",
-                        }
-                    )
-            self._filter_data[name] = {"name": _filter.name, "description": _filter.description, "options": options}
-
-    def _create_filter_function(self, name: str):
-        def filter_func(args=None, **kwargs):
-            return (name, None if args is None else str(args), {k: str(v) for k, v in kwargs.items()})
-
-        filter_func.__name__ = name
+    def _generate_filter_data(self, name: str) -> Dict[str, Any]:
+        if name in self._filter_data:
+            return self._filter_data[name]
+        options = []
+        _filter = filter.Filter(name)
+        if _filter.options is not None:
+            for opt in _filter.options:
+                try:
+                    opt_type = opt.type
+                except ValueError:
+                    opt_type = OptionType.STRING
+                options.append(
+                    {
+                        "name": opt.name,
+                        "type": opt_type,
+                        "default": opt.default,
+                        "help": opt.help if opt.name != "temp" else "set temperature °C",
+                    }
+                )
+        self._filter_data[name] = {"name": _filter.name, "description": _filter.description, "options": options}
+        return self._filter_data[name]
+
+    def _create_filter_function(self, name: str) -> FilterFunction:
+        filter_func = FilterFunction(name, self)
+        globals()[name] = filter_func
         return filter_func
 
     def _initialize_filters(self) -> None:
+        # build the full catalog, only needed to list or document all the filters
         if self._initialized:
             return
 
-        self._generate_filter_data()
         for name in filter.filters_available:
-            filter_func = self._create_filter_function(name)
-            data = self._filter_data[name]
-            filter_func.__doc__ = get_template("filter").render(
-                name=data["name"], description=data["description"], options=data["options"]
-            )
-            globals()[name] = filter_func
-
+            self.get_filter(name)
         self._initialized = True
 
+    def get_filter(self, name: str) -> Optional[FilterFunction]:
+        if name not in filter.filters_available:
+            return None
+        filter_func = globals().get(name)
+        if not isinstance(filter_func, FilterFunction):
+            filter_func = self._create_filter_function(name)
+        return filter_func
+
     def __getattr__(self, name: str) -> Callable:
-        self._initialize_filters()
-        return globals().get(name, None)
+        filter_func = self.get_filter(name)
+        if filter_func is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        return filter_func
 
     @property
     def filters(self) -> List[str]:
@@ -86,3 +113,8 @@ filters = _filter_manager.filters
 
 def __getattr__(name: str) -> Callable:
     return getattr(_filter_manager, name)
+
+
+def __dir__() -> List[str]:
+    _filter_manager._initialize_filters()
+    return sorted(globals())
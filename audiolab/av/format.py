@@ -17,10 +17,9 @@ from typing import Dict, Iterator, Literal, Optional, Set
 
 import av
 import numpy as np
-from av import Codec, codecs_available
-from av.codec.codec import UnknownCodecError
 
 from audiolab.av import typing
+from audiolab.av.capabilities import get_capabilities
 from audiolab.av.utils import get_template
 
 """
@@ -47,20 +46,10 @@ AudioFormat = typing.AudioFormatEnum("AudioFormat", audio_formats)
 
 @lru_cache(maxsize=None)
 def get_codecs(format: typing.AudioFormat, mode: Literal["r", "w"] = "r") -> Set[str]:
-    codecs = set()
     if isinstance(format, av.AudioFormat):
         format = format.name
-    for codec in codecs_available:
-        try:
-            codec = Codec(codec, mode)
-            formats = codec.audio_formats
-            if codec.type != "audio" or formats is None:
-                continue
-            if format in set(format.name for format in formats):
-                codecs.add(codec.name)
-        except UnknownCodecError:
-            pass
-    return codecs
+    codecs = get_capabilities()["codecs"][mode]
+    return set(name for name, codec in codecs.items() if format in codec["formats"])
 
 
 @lru_cache(maxsize=None)
@@ -91,11 +80,11 @@ def get_format(
     return AudioFormat[dtype].value
 
 
-template = get_template("format")
-for name, format in audio_formats.items():
-    decodecs = get_codecs(name, "r")
-    encodecs = get_codecs(name, "w")
-    dtype = get_dtype(name)
-    getattr(AudioFormat, name).__doc__ = template.render(
-        format=format, decodecs=decodecs, encodecs=encodecs, dtype=dtype
-    )
+def render_doc(format: av.AudioFormat) -> str:
+    decodecs = [av.Codec(codec, "r") for codec in get_codecs(format.name, "r")]
+    encodecs = [av.Codec(codec, "w") for codec in get_codecs(format.name, "w")]
+    dtype = get_dtype(format.name)
+    return get_template("format").render(format=format, decodecs=decodecs, encodecs=encodecs, dtype=dtype)
+
+
+AudioFormat.lazy_doc(render_doc)
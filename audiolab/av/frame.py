@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from fractions import Fraction
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 import av
 import numpy as np
@@ -83,7 +83,20 @@ def from_ndarray(
     return frame
 
 
-def to_ndarray(frame: av.AudioFrame) -> np.ndarray:
+def to_ndarray(frame: av.AudioFrame, out: Optional[np.ndarray] = None) -> np.ndarray:
+    if out is not None:
+        # copy the planes of the frame into out[:, :frame.samples] without intermediate ndarrays
+        dtype = get_dtype(frame.format)
+        samples = frame.samples
+        if frame.format.is_packed:
+            nb_channels = frame.layout.nb_channels
+            plane = np.frombuffer(frame.planes[0], dtype, samples * nb_channels)
+            out[:, :samples] = plane.reshape(samples, nb_channels).T
+        else:
+            for idx, plane in enumerate(frame.planes):
+                out[idx, :samples] = np.frombuffer(plane, dtype, samples)
+        return out[:, :samples]
+
     # packed: [num_channels, num_samples]
     # planar: [1, num_channels * num_samples]
     ndarray = frame.to_ndarray()
@@ -121,3 +134,41 @@ def pad(frame: np.ndarray, frame_size: int, fill_value: float = 0) -> np.ndarray
         return np.pad(frame, (0, pad_needed), constant_values=fill_value)
     else:
         return np.pad(frame, ((0, 0), (0, pad_needed)), constant_values=fill_value)
+
+
+def unpack_int24(buffer: Union[bytes, np.ndarray], dtype: Dtype = np.int32) -> np.ndarray:
+    """
+    Unpack little-endian packed 24-bit PCM samples.
+
+    Args:
+        buffer: The packed samples, 3 bytes per sample (e.g. the bytes of a WAV file, or a memory map of them).
+        dtype: int32 for the samples in the upper bytes of int32 (full scale, as decoded by FFmpeg and libsndfile),
+            or a float dtype for the samples in [-1.0, 1.0).
+    Returns:
+        The 1-D ndarray of the samples.
+    """
+    buffer = np.frombuffer(buffer, np.uint8)
+    num_samples = buffer.size // 3
+    # one padding byte in front, so that the int32 read at every 3 bytes holds a sample in its upper bytes
+    padded = np.empty(num_samples * 3 + 1, np.uint8)
+    padded[0] = 0
+    padded[1:] = buffer[: num_samples * 3]
+    samples = np.ndarray((num_samples,), "<i4", padded, 0, (3,))
+    dtype = np.dtype(dtype)
+    if dtype.kind == "f":
+        ndarray = np.right_shift(samples, 8).astype(dtype)
+        return np.multiply(ndarray, 1 / 0x800000, out=ndarray)
+    return np.bitwise_and(samples, np.int32(-256), dtype=dtype)
+
+
+def pack_int24(ndarray: np.ndarray) -> np.ndarray:
+    """
+    Pack int32 samples (full scale) into little-endian 24-bit PCM samples, dropping their lowest bytes.
+
+    Args:
+        ndarray: The int32 samples.
+    Returns:
+        The uint8 ndarray of shape (*ndarray.shape, 3).
+    """
+    ndarray = np.ascontiguousarray(ndarray, "<i4")
+    return np.ascontiguousarray(ndarray.view(np.uint8).reshape(*ndarray.shape, 4)[..., 1:])
@@ -14,93 +14,232 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import OrderedDict
+from functools import lru_cache
 from io import BytesIO
-from threading import Lock
-from typing import Callable, Dict, Optional
-
-from smart_open import open as sm_open
+from threading import Lock, local
+from typing import Any, Callable, Dict, Optional, Union
 
+from audiolab.av.disk_cache import DiskCache
 from audiolab.av.utils import get_logger
 
 logger = get_logger(__name__)
 
 
+class SharedMethod:
+    """
+    Descriptor of a method which is called on the shared AudioCache (see `get_audio_cache`) when it is accessed on
+    the class, as the classmethods of the previous versions (e.g. `AudioCache.clear_cache()`).
+    """
+
+    def __init__(self, func: Callable):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: Optional["AudioCache"], owner: Optional[type] = None) -> Callable:
+        return self.func.__get__(get_audio_cache() if instance is None else instance, owner)
+
+
 class AudioCache:
     """
     Cache of 'bytes' objects with audio data.
     It is used to cache the "command" type audio inputs.
 
-    The cache size is limited to max 100 elements and 500MB of audio.
+    The cache size is limited to max 100 elements and 500MB of audio by default.
+    The least recently used elements are removed first, and the elements larger than
+    `max_element_memory` are not admitted, so that a single large audio does not flush the cache.
 
-    A global dict `__cache_dict` (static member variable of class AudioCache)
-    is holding the wavs as 'bytes' arrays.
+    A dict `cache_dict` (ordered from the least to the most recently used) is holding the wavs as 'bytes' arrays.
     The key is the 'source' identifier (i.e. the command for loading the data).
 
     Thread-safety is ensured by a threading.Lock guard.
+
+    The optional disk tier (see AudioCache.setup_disk_cache) persists the values across restarts
+    and shares them between the processes, the memory is checked first, then the disk.
+
+    The methods called on the class (e.g. `AudioCache.try_cache(url)`) use the shared `get_audio_cache()`.
     """
 
-    max_cache_memory: int = 500 * 1e6  # 500 MB
-    max_cache_elements: int = 100  # 100 audio files
+    def __init__(
+        self,
+        max_cache_memory: int = 500 * 1e6,
+        max_cache_elements: int = 100,
+        max_element_memory: Optional[int] = None,
+        disk_cache: Optional[DiskCache] = None,
+    ):
+        """
+        Create an AudioCache object.
 
-    __cache_dict: Dict[str, bytes] = {}
-    __cache_memory: int = 0
-    __lock: Lock = Lock()
+        Args:
+            max_cache_memory: The maximum number of bytes in memory, 500 MB by default.
+            max_cache_elements: The maximum number of audio files in memory, 100 by default.
+            max_element_memory: The maximum number of bytes of an admitted audio file, 1/4 of max_cache_memory
+                by default.
+            disk_cache: The disk tier of the cache.
+        """
+        self.max_cache_memory = max_cache_memory
+        self.max_cache_elements = max_cache_elements
+        self.max_element_memory = max_cache_memory / 4 if max_element_memory is None else max_element_memory
+        self.disk_cache = disk_cache
 
-    @classmethod
-    def try_cache(cls, key: str) -> Optional[bytes]:
+        self.cache_dict: OrderedDict[str, bytes] = OrderedDict()
+        self._cache_memory = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @SharedMethod
+    def setup_disk_cache(self, path: Optional[str] = None, max_bytes: int = 10 * 1024**3) -> DiskCache:
         """
-        Test if 'key' is in the chache. If yes return the bytes array,
+        Enable the disk tier of the cache.
+
+        Args:
+            path: The directory of the cache, `$AUDIOLAB_CACHE_DIR/audio-v1` by default.
+            max_bytes: The maximum number of bytes on the disk, the least recently used files are evicted first.
+        Returns:
+            The disk cache.
+        """
+        self.disk_cache = DiskCache(path, max_bytes)
+        return self.disk_cache
+
+    @SharedMethod
+    def try_cache(self, key: str) -> Optional[bytes]:
+        """
+        Test if 'key' is in the chache. If yes return the bytes array (and mark it as the most recently used),
         otherwise return None.
         """
 
-        with cls.__lock:
-            if key in cls.__cache_dict:
-                return cls.__cache_dict[key]
+        with self._lock:
+            value = self.cache_dict.get(key)
+            if value is not None:
+                self.cache_dict.move_to_end(key)
+                self.hits += 1
+                return value
+        if self.disk_cache is not None:
+            value = self.disk_cache.get(key)
+            if value is not None:
+                # promote to the memory
+                self.add_to_cache(key, value, disk=False)
+        with self._lock:
+            if value is None:
+                self.misses += 1
             else:
-                return None
+                self.hits += 1
+        return value
 
-    @classmethod
-    def add_to_cache(cls, key: str, value: bytes):
+    @SharedMethod
+    def add_to_cache(self, key: str, value: bytes, disk: bool = True):
         """
         Add the new (key,value) pair to cache.
         Possibly free some elements before adding the new pair.
-        The oldest elements are removed first.
+        The least recently used elements are removed first.
         """
 
-        if len(value) > cls.max_cache_memory:
+        if disk and self.disk_cache is not None:
+            self.disk_cache.put(key, value)
+        if len(value) > min(self.max_element_memory, self.max_cache_memory):
             return
 
-        with cls.__lock:
+        with self._lock:
+            removed_value = self.cache_dict.pop(key, None)
+            if removed_value is not None:
+                self._cache_memory -= len(removed_value)
             # limit cache elements and memory
-            while (
-                len(cls.__cache_dict) >= cls.max_cache_elements
-                or len(value) + cls.__cache_memory > cls.max_cache_memory
+            while len(self.cache_dict) > 0 and (
+                len(self.cache_dict) >= self.max_cache_elements
+                or len(value) + self._cache_memory > self.max_cache_memory
             ):
-                # remove oldest elements from cache
-                # (dict pairs are sorted according to insertion order)
-                removed_key = next(iter(cls.__cache_dict))
-                removed_value = cls.__cache_dict.pop(removed_key)
-                cls.__cache_memory -= len(removed_value)
+                _, removed_value = self.cache_dict.popitem(last=False)
+                self._cache_memory -= len(removed_value)
+                self.evictions += 1
 
             # store the new (key,value) pair
-            cls.__cache_dict[key] = value
-            cls.__cache_memory += len(value)
+            self.cache_dict[key] = value
+            self._cache_memory += len(value)
 
     @property
-    def cache_memory(cls) -> int:
+    def cache_memory(self) -> int:
         """
         Return size of AudioCache values in bytes.
         """
-        return cls.__cache_memory
+        return self._cache_memory
 
-    @classmethod
-    def clear_cache(cls) -> None:
+    @SharedMethod
+    def clear_cache(self) -> None:
         """
-        Clear the cache, remove the data.
+        Clear the cache in memory, remove the data.
         """
+        with self._lock:
+            self.cache_dict.clear()
+            self._cache_memory = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes": self._cache_memory,
+                "entries": len(self.cache_dict),
+            }
+
+
+@lru_cache(maxsize=None)
+def get_audio_cache() -> AudioCache:
+    return AudioCache()
+
+
+class HTTPSession:
+    """
+    Shared pool of keep-alive HTTP(S) connections for all the remote I/O (SmartOpen and RemoteFile).
+
+    The connection pool (a `requests` HTTPAdapter over a thread-safe urllib3 PoolManager) is shared by all threads,
+    while each thread gets its own `requests.Session` mounting it, since sessions are not thread-safe.
+    So a connection (and its TLS handshake) is reused by the next request to the same host.
+
+    The HTTPSession.setup method sizes the pool, it is called with the defaults on first use otherwise.
+    """
+
+    pool_connections: int = 16  # the number of hosts to keep connections to
+    pool_maxsize: int = 64  # the number of connections kept to each host, at least the number of threads
+    adapter: Optional[Any] = None
+
+    __local = local()
+    __lock: Lock = Lock()
+
+    @classmethod
+    def setup(cls, pool_connections: int = 16, pool_maxsize: int = 64, max_retries: int = 0):
+        from requests.adapters import HTTPAdapter
+
         with cls.__lock:
-            cls.__cache_dict.clear()
-            cls.__cache_memory = 0
+            cls.pool_connections = pool_connections
+            cls.pool_maxsize = pool_maxsize
+            cls.adapter = HTTPAdapter(pool_connections, pool_maxsize, max_retries)
+            # drop the sessions of the threads, which mount the previous adapter
+            cls.__local = local()
+
+    @classmethod
+    def get(cls):
+        """
+        Get the session of the current thread, which mounts the shared connection pool.
+        """
+        if cls.adapter is None:
+            with cls.__lock:
+                if cls.adapter is None:
+                    from requests.adapters import HTTPAdapter
+
+                    cls.adapter = HTTPAdapter(cls.pool_connections, cls.pool_maxsize)
+        thread_local = cls.__local
+        session = getattr(thread_local, "session", None)
+        if session is None:
+            import requests
+
+            session = requests.Session()
+            session.mount("http://", cls.adapter)
+            session.mount("https://", cls.adapter)
+            thread_local.session = session
+        return session
 
 
 class SmartOpen:
@@ -131,6 +270,8 @@ class SmartOpen:
                 transport_params,
             )
         cls.transport_params = transport_params
+        from smart_open import open as sm_open
+
         cls.smart_open = sm_open
 
     @classmethod
@@ -138,6 +279,10 @@ class SmartOpen:
         if cls.smart_open is None:
             cls.setup(transport_params=transport_params)
         transport_params = transport_params if transport_params else cls.transport_params
+        if isinstance(uri, str) and uri.startswith(("http://", "https://")):
+            # the shared keep-alive connections instead of a new connection per call
+            transport_params = dict(transport_params or {})
+            transport_params.setdefault("session", HTTPSession.get())
         return cls.smart_open(
             uri,
             mode=mode,
@@ -146,20 +291,23 @@ class SmartOpen:
         )
 
 
-def load_url(url: str, cache: bool = False) -> BytesIO:
+def load_url(url: str, cache: Union[bool, AudioCache] = False) -> BytesIO:
     """
     Load an audio file from a URL.
 
     Args:
         url (str): The URL of the audio file.
-        cache (bool): Whether to cache the audio file.
+        cache (bool or AudioCache): Whether to cache the audio file (in the shared `get_audio_cache()`), or the
+            cache, in the memory and in the disk tier if it is enabled (see AudioCache.setup_disk_cache).
     Returns:
         The audio bytes.
     """
-    audio_bytes = AudioCache.try_cache(url) if cache else None
+    if isinstance(cache, bool):
+        cache = get_audio_cache() if cache else None
+    audio_bytes = cache.try_cache(url) if cache is not None else None
     if audio_bytes is None:
         with SmartOpen.open(url, "rb") as f:
             audio_bytes = f.read()
-        if cache:
-            AudioCache.add_to_cache(url, audio_bytes)
+        if cache is not None:
+            cache.add_to_cache(url, audio_bytes)
     return BytesIO(audio_bytes)
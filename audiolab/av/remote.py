@@ -0,0 +1,182 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import re
+from collections import OrderedDict
+from typing import Any, Optional
+
+from audiolab.av.lhotse import SmartOpen
+from audiolab.av.utils import get_logger
+
+logger = get_logger(__name__)
+
+_content_range = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+def is_http_url(file: Any) -> bool:
+    return isinstance(file, str) and file.startswith(("http://", "https://"))
+
+
+class RemoteFile(io.RawIOBase):
+    """
+    Seekable read-only file object over an HTTP(S) URL, which fetches fixed-size blocks with range requests
+    opened by SmartOpen, so that only the bytes around the read positions are transferred. The requests share the
+    keep-alive connections of `HTTPSession`.
+
+    The recently read blocks are cached (least recently used first out), and the sequential reads double the
+    number of blocks fetched per request (read-ahead) up to `max_read_ahead`, while a seek resets it to 1.
+    If the server ignores the range requests, the whole file is transferred by the first request and cached.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        block_size: int = 64 * 1024,
+        max_blocks: int = 256,
+        max_read_ahead: int = 16,
+        transport_params: Optional[dict] = None,
+    ):
+        """
+        Create a RemoteFile object.
+
+        Args:
+            url: The HTTP(S) URL of the file.
+            block_size: The number of bytes of each block.
+            max_blocks: The maximum number of cached blocks.
+            max_read_ahead: The maximum number of blocks fetched per request on sequential reads.
+            transport_params: The transport parameters of smart_open, `SmartOpen.transport_params` by default.
+        """
+        self.url = url
+        self.name = url
+        self.block_size = block_size
+        self.max_blocks = max(max_blocks, max_read_ahead)
+        self.max_read_ahead = max_read_ahead
+        self.transport_params = transport_params
+        self.blocks = OrderedDict()
+        self.pos = 0
+        self.read_ahead = 1
+        self.last_block = None
+        # the number of requests and bytes transferred
+        self.num_requests = 0
+        self.num_bytes = 0
+        self.size = None
+        # the first block (headers of most formats) tells the size of the file
+        self.fetch(0)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self.pos + offset
+        elif whence == io.SEEK_END:
+            pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}, should be 0, 1 or 2)")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self.pos = pos
+        return self.pos
+
+    def request(self, start: int, end: int) -> bytes:
+        # requests is not a dependency of audiolab but of smart_open's http transport, so it is imported on use
+        # (as by HTTPSession and SmartOpen), which keeps audiolab importable without it
+        import requests
+
+        if SmartOpen.smart_open is None:
+            # the first call of SmartOpen.open keeps its transport_params as the defaults, without the range
+            SmartOpen.setup()
+        # transport_params of smart_open's http transport, with a bounded range instead of an open-ended one
+        transport_params = dict((self.transport_params or SmartOpen.transport_params) or {})
+        headers = dict(transport_params.get("headers") or {"Accept-Encoding": "identity"})
+        headers["Range"] = f"bytes={start}-{end - 1}"
+        transport_params["headers"] = headers
+        try:
+            with SmartOpen.open(self.url, "rb", transport_params=transport_params, compression="disable") as f:
+                response = f.response
+                data = f.read()
+        except requests.HTTPError as e:
+            # 416: the range starts at the end of the file (e.g. an empty file)
+            if e.response is None or e.response.status_code != 416:
+                raise e
+            self.size = start
+            return b""
+        self.num_requests += 1
+        self.num_bytes += len(data)
+        # the redirects are followed once, the next requests go to the final URL
+        self.url = response.url
+        if response.status_code == 206:
+            match = _content_range.match(response.headers.get("Content-Range", ""))
+            if match is not None and match.group(3) != "*":
+                self.size = int(match.group(3))
+            elif len(data) < end - start:
+                self.size = start + len(data)
+            return data
+        # 200: the server does not support range requests, and the whole file is transferred
+        logger.debug("%s does not support range requests, caching the whole file", self.url)
+        self.size = len(data)
+        self.max_blocks = max(self.max_blocks, -(-self.size // self.block_size))
+        for idx in range(0, self.size, self.block_size):
+            self.blocks[idx // self.block_size] = data[idx : idx + self.block_size]
+        return data[start:end]
+
+    def fetch(self, block: int, num_needed: int = 1) -> bytes:
+        if block in self.blocks:
+            self.blocks.move_to_end(block)
+            return self.blocks[block]
+        # double the read-ahead on sequential reads, reset it on random reads
+        if self.last_block is not None and block == self.last_block + 1:
+            self.read_ahead = min(self.read_ahead * 2, self.max_read_ahead)
+        else:
+            self.read_ahead = 1
+        # the blocks needed by the current read in one request, and the read-ahead blocks
+        num_blocks = 1
+        max_num_blocks = min(max(num_needed, self.read_ahead), self.max_blocks)
+        while num_blocks < max_num_blocks and block + num_blocks not in self.blocks:
+            num_blocks += 1
+        if self.size is not None:
+            num_blocks = max(min(num_blocks, -(-self.size // self.block_size) - block), 1)
+        self.last_block = block + num_blocks - 1
+
+        start = block * self.block_size
+        data = self.request(start, start + num_blocks * self.block_size)
+        if block not in self.blocks:
+            for idx in range(num_blocks):
+                self.blocks[block + idx] = data[idx * self.block_size : (idx + 1) * self.block_size]
+        while len(self.blocks) > self.max_blocks:
+            self.blocks.popitem(last=False)
+        return self.blocks.get(block, b"")
+
+    def readinto(self, buffer: Any) -> int:
+        buffer = memoryview(buffer).cast("B")
+        num_bytes = 0
+        while num_bytes < len(buffer) and (self.size is None or self.pos < self.size):
+            block, offset = divmod(self.pos, self.block_size)
+            num_needed = -(-(offset + len(buffer) - num_bytes) // self.block_size)
+            data = self.fetch(block, num_needed)[offset : offset + len(buffer) - num_bytes]
+            if len(data) == 0:
+                break
+            buffer[num_bytes : num_bytes + len(data)] = data
+            num_bytes += len(data)
+            self.pos += len(data)
+        return num_bytes
@@ -13,12 +13,30 @@
 # limitations under the License.
 
 from enum import Enum
-from typing import Dict, Tuple, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import av
 import numpy as np
 
 
+class LazyDoc:
+    """
+    Descriptor which renders the docstring of an enum member on first access of `__doc__`.
+    """
+
+    def __init__(self, render: Callable[[Any], str], doc: Optional[str] = None):
+        self.render = render
+        self.doc = doc
+        self.docs: Dict[str, str] = {}
+
+    def __get__(self, instance: Optional[Enum], owner: Optional[type] = None) -> Optional[str]:
+        if instance is None:
+            return self.doc
+        if instance.name not in self.docs:
+            self.docs[instance.name] = self.render(instance.value)
+        return self.docs[instance.name]
+
+
 class BaseEnum(Enum):
     def __new__(cls, value):
         obj = object.__new__(cls)
@@ -28,6 +46,10 @@ class BaseEnum(Enum):
     def __getattr__(self, attr):
         return getattr(self.value, attr)
 
+    @classmethod
+    def lazy_doc(cls, render: Callable[[Any], str]):
+        cls.__doc__ = LazyDoc(render, cls.__doc__)
+
 
 class AudioFormatEnum(BaseEnum):
     pass
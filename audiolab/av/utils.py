@@ -13,15 +13,18 @@
 # limitations under the License.
 
 import logging
+import os
 import sys
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
 from importlib.resources import files
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Union
 
 import numpy as np
-from jinja2 import Environment, FileSystemLoader
 from numpy.random import randint, uniform
 
-loader = FileSystemLoader(files("audiolab.av").joinpath("templates"))
-
 
 def generate_ndarray(nb_channels: int, samples: int, dtype: np.dtype, always_2d: bool = True) -> np.ndarray:
     if np.dtype(dtype).kind in ("i", "u"):
@@ -31,8 +34,79 @@ def generate_ndarray(nb_channels: int, samples: int, dtype: np.dtype, always_2d:
     return ndarray if always_2d else ndarray.squeeze()
 
 
+def generate_audio(
+    file: Any,
+    codec: str,
+    ndarray: np.ndarray,
+    rate: int,
+    format: Optional[str] = None,
+    container_format: Optional[str] = None,
+    frame_size: int = 1024,
+):
+    """
+    Encode an audio of shape (num_channels, num_samples) with PyAV, e.g. the fixtures of the tests and benchmarks.
+
+    Args:
+        file: The path to the audio file, or a file object.
+        codec: The name of the encoder (e.g. "flac", "libmp3lame", "libopus", "aac").
+        ndarray: The audio, mono or stereo.
+        rate: The sample rate of the audio.
+        format: The sample format of the encoded frames, the first one supported by the encoder if None.
+        container_format: The container format, guessed from the extension of the path if None.
+        frame_size: The number of samples of each frame sent to the encoder.
+    """
+    # imported on use, audiolab.av.frame imports this module
+    import av
+
+    from audiolab.av.frame import from_ndarray
+
+    layout = "mono" if ndarray.shape[0] == 1 else "stereo"
+    with av.open(file, "w", format=container_format) as container:
+        stream = container.add_stream(codec, rate=rate, layout=layout)
+        format = stream.codec_context.codec.audio_formats[0].name if format is None else format
+        for pts in range(0, ndarray.shape[1], frame_size):
+            frame = from_ndarray(ndarray[:, pts : pts + frame_size], format, layout, rate, pts=pts)
+            container.mux(stream.encode(frame))
+        container.mux(stream.encode(None))
+
+
+@contextmanager
+def atomic_open(path: Union[str, Path], mode: str = "wb") -> Iterator[IO]:
+    """
+    Open a temporary file next to `path` for writing, and rename it to `path` on success,
+    so that concurrent readers never see a partially written file.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_cache_dir(*names: str) -> Path:
+    """
+    Get the cache directory of audiolab, `$AUDIOLAB_CACHE_DIR` or `$XDG_CACHE_HOME/audiolab` (`~/.cache/audiolab`).
+    """
+    cache_dir = os.environ.get("AUDIOLAB_CACHE_DIR")
+    if cache_dir is None:
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "audiolab"
+    return Path(cache_dir).joinpath(*names)
+
+
+@lru_cache(maxsize=None)
+def get_environment():
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(loader=FileSystemLoader(files("audiolab.av").joinpath("templates")))
+
+
 def get_template(name: str) -> str:
-    return Environment(loader=loader).get_template(f"{name}.txt")
+    return get_environment().get_template(f"{name}.txt")
 
 
 def get_logger(name, level=logging.INFO):
@@ -30,6 +30,17 @@ from audiolab.reader.info import Info
     is_flag=True,
     help="Forced decoding the audio file to get the duration",
 )
+@click.option(
+    "-F",
+    "--fast",
+    is_flag=True,
+    help="Parse the headers only (WAV, FLAC, MP3, Ogg), without comments",
+)
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Cache the information of local files between runs",
+)
 @click.option("-t", "--show-file-type", is_flag=True, help="Show detected file-type")
 @click.option("-r", "--show-sample-rate", is_flag=True, help="Show sample-rate")
 @click.option("-c", "--show-channels", is_flag=True, help="Show number of channels")
@@ -79,6 +90,8 @@ from audiolab.reader.info import Info
 def main(
     audio_files: Any,
     forced_decoding: bool = False,
+    fast: bool = False,
+    cache: bool = False,
     show_file_type: bool = False,
     show_sample_rate: bool = False,
     show_channels: bool = False,
@@ -128,7 +141,7 @@ def main(
     # Process each audio file
     for audio_file in audio_files:
         # ffmpeg -i audio.flac -f wav - | > audio.wav
-        info = audiolab.info(audio_file, forced_decoding, backends=[pyav])
+        info = audiolab.info(audio_file, forced_decoding, backends=[pyav], fast=fast, cache=cache)
         # If no specific options are selected, show all information (default behavior)
         if not show_any:
             print(info)
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Iterator, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Iterator, List, Literal, Optional, Tuple, Union
 
 import numpy as np
 from soundfile import LibsndfileError
@@ -22,11 +23,25 @@ from audiolab.av.graph import Graph
 from audiolab.av.typing import UINT32_MAX, AudioFrame
 from audiolab.reader.backend import Backend
 from audiolab.reader.info import Info
+from audiolab.reader.info_cache import InfoCache, get_info_cache
+from audiolab.reader.pcm_cache import PCMCache, get_pcm_cache
+from audiolab.reader.shm_cache import SharedPCMCache
 from audiolab.reader.reader import Reader
+from audiolab.reader.sniff import sniff_backends
 from audiolab.reader.stream_reader import StreamReader
 
+# the arguments of `load_audio` which change the decoded audio, besides the source (see `PCMCache.get_key`)
+PCM_CACHE_FIELDS = ("offset", "duration", "filters", "dtype", "rate", "to_mono", "backends", "seek_index")
 
-def info(file: Any, forced_decoding: bool = False, backends: Optional[List[Backend]] = None) -> Info:
+
+def info(
+    file: Any,
+    forced_decoding: bool = False,
+    backends: Optional[List[Backend]] = None,
+    threads: Optional[int] = None,
+    fast: bool = False,
+    cache: Union[bool, InfoCache] = False,
+) -> Info:
     """
     Get the information of an audio file.
 
@@ -34,13 +49,49 @@ def info(file: Any, forced_decoding: bool = False, backends: Optional[List[Backe
         file: The input audio file, audio url, path to audio file, bytes of audio data, etc.
         forced_decoding: Whether to forced decoding the audio file to get the duration.
         backends: The list of backends to use to get the information.
+        threads: The number of threads to decode with the PyAV backend (0 for auto), FFmpeg's default if None.
+        fast: Whether to parse the headers of WAV/RF64, FLAC, MP3 and Ogg files only (without tags),
+            falling back to the backends if the parsing fails.
+        cache: Whether to cache the information of local files (in `$AUDIOLAB_CACHE_DIR` by default), or the cache.
     Returns:
         The information of the audio file.
     """
-    return Info(file, forced_decoding=forced_decoding, backends=backends)
+    if fast and not forced_decoding:
+        backends = ["header", *(sniff_backends(file) if backends is None else backends)]
+    if isinstance(cache, bool):
+        cache = get_info_cache() if cache else None
+    return Info(file, forced_decoding=forced_decoding, backends=backends, threads=threads, cache=cache)
+
 
+def load_audio(
+    file: Any, cache: Union[bool, PCMCache, SharedPCMCache] = False, **kwargs
+) -> Union[Iterator[AudioFrame], AudioFrame]:
+    """
+    Load an audio file, or iterate over its frames if `frame_size` is set.
+
+    Args:
+        file: The input audio file, audio url, path to audio file, bytes of audio data, etc.
+        cache: Whether to cache the decoded audios of local files and URLs (in the shared `get_pcm_cache()`), or
+            the cache (e.g. `SharedPCMCache` to share them between processes). The hits are read-only and skip the
+            decoding, without opening the file.
+        kwargs: The arguments of `Reader`.
+    Returns:
+        The audio and the sample rate, or the iterator of the audio frames.
+    """
+    if isinstance(cache, bool):
+        cache = get_pcm_cache() if cache else None
+    if cache is not None and kwargs.get("frame_size") is None and kwargs.get("fill_value") is None:
+        key = PCMCache.get_key(file, **{name: kwargs[name] for name in PCM_CACHE_FIELDS if name in kwargs})
+        if key is not None:
+            value = cache.get(key)
+            if value is None:
+                # cache the canonical layout, formatted for each call
+                value = cache.put(key, *load_audio(file, **{**kwargs, "always_2d": True, "channels_last": False}))
+            audio, rate = value
+            if kwargs.get("channels_last", False):
+                audio = audio.T
+            return (audio if kwargs.get("always_2d", True) else audio.squeeze()), rate
 
-def load_audio(file: Any, **kwargs) -> Union[Iterator[AudioFrame], AudioFrame]:
     reader = Reader(file, **kwargs)
     if reader.frame_size < UINT32_MAX:
         return iter(reader)
@@ -53,4 +104,85 @@ def load_audio(file: Any, **kwargs) -> Union[Iterator[AudioFrame], AudioFrame]:
             return np.array([]), reader.rate
 
 
-__all__ = ["Graph", "Reader", "StreamReader", "aformat", "load_audio"]
+def _load_audio(file: Any, kwargs: dict) -> Union[Tuple[np.ndarray, int], Exception]:
+    try:
+        return load_audio(file, **kwargs)
+    except Exception as e:
+        return e
+
+
+def load_audio_batch(
+    files: List[Any],
+    num_workers: Optional[int] = None,
+    executor: Literal["thread", "process"] = "thread",
+    padded: bool = False,
+    fill_value: float = 0,
+    **kwargs,
+) -> Union[
+    List[Union[Tuple[np.ndarray, int], Exception]],
+    Tuple[np.ndarray, np.ndarray, Optional[int], List[Optional[Exception]]],
+]:
+    """
+    Load a batch of audio files concurrently.
+
+    Args:
+        files: The audio files, audio urls, paths to audio files, bytes of audio data, etc.
+        num_workers: The number of workers, the default of the executor if None.
+        executor: Decode the files in a pool of threads or processes.
+        padded: Whether to return a single padded array of shape (batch, channels, max_len).
+        fill_value: The fill value to pad the audios to the max length.
+        kwargs: The arguments of `load_audio` (e.g. offset, duration, dtype, rate, to_mono), except frame_size.
+    Returns:
+        If not padded, the list of (audio, rate) in the order of the files, or the exception raised by each file.
+        If padded, the padded audios, the lengths of the audios, the sample rate and the exceptions (None if the
+        file is loaded). The failed files have a length of 0, including the files whose sample rate or number of
+        channels differ from the first loaded file.
+    """
+    if kwargs.get("frame_size") is not None:
+        raise ValueError("load_audio_batch loads the whole audios, frame_size is not supported")
+    files = list(files)
+    if padded:
+        kwargs["always_2d"] = True
+    pool = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    with pool(num_workers) as pool:
+        results = list(pool.map(_load_audio, files, [kwargs] * len(files)))
+    if not padded:
+        return results
+
+    errors = [result if isinstance(result, Exception) else None for result in results]
+    loaded = [idx for idx, error in enumerate(errors) if error is None]
+    if len(loaded) == 0:
+        return np.zeros((len(files), 0, 0)), np.zeros(len(files), int), None, errors
+    # the audios which can't be stacked with the first loaded one fail, instead of the whole batch
+    channels, rate = results[loaded[0]][0].shape[0], results[loaded[0]][1]
+    for idx in loaded:
+        audio, _rate = results[idx]
+        if _rate != rate:
+            errors[idx] = ValueError(f"The sample rate {_rate} is not {rate}, set `rate` to resample the audios")
+        elif audio.shape[0] != channels:
+            errors[idx] = ValueError(
+                f"The number of channels {audio.shape[0]} is not {channels}, set `to_mono` to downmix the audios"
+            )
+    loaded = [idx for idx in loaded if errors[idx] is None]
+
+    lengths = np.zeros(len(files), int)
+    for idx in loaded:
+        lengths[idx] = results[idx][0].shape[-1]
+    dtype = np.result_type(*[results[idx][0].dtype for idx in loaded])
+    batch = np.full((len(files), channels, lengths.max()), fill_value, dtype)
+    for idx in loaded:
+        batch[idx, :, : lengths[idx]] = results[idx][0]
+    return batch, lengths, rate, errors
+
+
+__all__ = [
+    "Graph",
+    "PCMCache",
+    "Reader",
+    "SharedPCMCache",
+    "StreamReader",
+    "aformat",
+    "get_pcm_cache",
+    "load_audio",
+    "load_audio_batch",
+]
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 from audiolab.reader.backend.backend import Backend
+from audiolab.reader.backend.header import Header as header
+from audiolab.reader.backend.memmap import MemMap as memmap
 from audiolab.reader.backend.pyav import PyAV as pyav
 from audiolab.reader.backend.soundfile import SoundFile as soundfile
 from audiolab.reader.backend.wave import Wave as wave
 
-__all__ = ["Backend", "pyav", "soundfile", "wave"]
+__all__ = ["Backend", "header", "memmap", "pyav", "soundfile", "wave"]
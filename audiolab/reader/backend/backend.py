@@ -20,10 +20,14 @@ from typing import Any, Iterator, Optional
 import numpy as np
 
 from audiolab.av import standard_channel_layouts
+from audiolab.av.remote import RemoteFile
 from audiolab.av.typing import UINT32_MAX, Seconds
 
 
 class Backend:
+    # the number of frames read at a time by `read_into`, which bounds the temporary buffers
+    chunk_size: int = 65536
+
     def __init__(self, file: Any, frame_size: Optional[int] = None, forced_decoding: bool = False):
         self.file = file
         self.frame_size = UINT32_MAX if frame_size is None else min(frame_size, UINT32_MAX)
@@ -52,6 +56,8 @@ class Backend:
 
     @cached_property
     def name(self) -> str:
+        if isinstance(self.file, RemoteFile):
+            return self.file.name
         return "<none>" if isinstance(self.file, BytesIO) else self.file
 
     @cached_property
@@ -61,6 +67,8 @@ class Backend:
                 return os.stat(self.file).st_size
         elif isinstance(self.file, BytesIO):
             return len(self.file.getbuffer())
+        elif isinstance(self.file, RemoteFile):
+            return self.file.size
         return None
 
     def load_audio(self, offset: Seconds = 0, duration: Optional[Seconds] = None) -> Iterator[np.ndarray]:
@@ -73,3 +81,10 @@ class Backend:
                 break
             frames -= ndarray.shape[1]
             yield ndarray
+
+    def read_into(self, out: np.ndarray) -> int:
+        ndarray = self.read(min(out.shape[1], self.frame_size, self.chunk_size))
+        if ndarray is None:
+            return 0
+        out[:, : ndarray.shape[1]] = ndarray
+        return ndarray.shape[1]
@@ -0,0 +1,284 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import struct
+from functools import cached_property, lru_cache
+from typing import Any, BinaryIO, Optional
+
+import numpy as np
+
+from audiolab.av.typing import Seconds
+from audiolab.reader.backend.backend import Backend
+from audiolab.reader.backend.memmap import _format_bits_to_codec, _format_bits_to_dtype, parse_header
+
+# the number of bytes read from the head (and the tail for Ogg) of the file
+PROBE_SIZE = 65536
+
+# bit rates (kbps) indexed by [MPEG-1][layer][bitrate index], layer 1 for Layer I
+_mpeg_bit_rates = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# sample rates indexed by the version bits: MPEG-2.5, reserved, MPEG-2, MPEG-1
+_mpeg_sample_rates = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+
+@lru_cache(maxsize=None)
+def get_codec_name(name: str) -> str:
+    from av.codec import Codec
+
+    return Codec(name).long_name
+
+
+def skip_id3v2(head: bytes) -> int:
+    # ID3v2 tags (prepended to MP3, sometimes to FLAC) have a 10 bytes header with a syncsafe size
+    if head[:3] != b"ID3" or len(head) < 10:
+        return 0
+    size = 0
+    for byte in head[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    return 10 + size + (10 if head[5] & 0x10 else 0)
+
+
+def parse_mpeg_frame_header(head: bytes, pos: int) -> Optional[dict]:
+    if pos + 4 > len(head) or head[pos] != 0xFF or head[pos + 1] & 0xE0 != 0xE0:
+        return None
+    version = (head[pos + 1] >> 3) & 0x03
+    layer = 4 - ((head[pos + 1] >> 1) & 0x03)
+    bit_rate_index = head[pos + 2] >> 4
+    sample_rate_index = (head[pos + 2] >> 2) & 0x03
+    if version == 1 or layer == 4 or bit_rate_index in (0, 15) or sample_rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bit_rate = _mpeg_bit_rates[(mpeg1, layer)][bit_rate_index] * 1000
+    sample_rate = _mpeg_sample_rates[version][sample_rate_index]
+    padding = (head[pos + 2] >> 1) & 0x01
+    if layer == 1:
+        samples_per_frame = 384
+        frame_size = (12 * bit_rate // sample_rate + padding) * 4
+    else:
+        samples_per_frame = 1152 if mpeg1 or layer == 2 else 576
+        frame_size = samples_per_frame // 8 * bit_rate // sample_rate + padding
+    return {
+        "mpeg1": mpeg1,
+        "layer": layer,
+        "bit_rate": bit_rate,
+        "sample_rate": sample_rate,
+        "num_channels": 1 if head[pos + 3] >> 6 == 3 else 2,
+        "samples_per_frame": samples_per_frame,
+        "frame_size": frame_size,
+    }
+
+
+class Header(Backend):
+    """
+    Metadata-only backend which parses the headers of WAV/RF64, FLAC, MP3 and Ogg (Opus/Vorbis) files
+    from the first (and for Ogg, the last) few KB without opening a decoder.
+    Tags are not parsed, and reading audio frames is not supported.
+    """
+
+    def __init__(self, file: Any, frame_size: Optional[int] = None, forced_decoding: bool = False):
+        if forced_decoding:
+            raise ValueError("Header backend does not support forced decoding")
+        super().__init__(file, frame_size, forced_decoding)
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as f:
+                self.parse(f)
+        else:
+            pos = file.tell()
+            try:
+                self.parse(file)
+            finally:
+                file.seek(pos)
+
+    def parse(self, f: BinaryIO):
+        # the encoder delay and padding of MP3 (from the LAME tag), which are trimmed by the decoder
+        self.trimmed_samples = 0
+        start = f.tell()
+        self.file_size = f.seek(0, os.SEEK_END) - start
+        f.seek(start)
+        head = f.read(PROBE_SIZE)
+        if head[:4] in (b"RIFF", b"RF64", b"BW64"):
+            f.seek(start)
+            self.parse_wav(f)
+        elif head[:4] == b"OggS":
+            f.seek(max(start + self.file_size - PROBE_SIZE, start))
+            self.parse_ogg(head, f.read(PROBE_SIZE))
+        else:
+            base = skip_id3v2(head)
+            if base > 0:
+                # large tags (e.g. with cover art) are skipped instead of read
+                f.seek(start + base)
+                head = f.read(PROBE_SIZE)
+            if head[:4] == b"fLaC":
+                self.parse_flac(head, 4)
+            else:
+                self.parse_mpeg(head, base)
+
+    def parse_wav(self, f: BinaryIO):
+        format_tag, channels, rate, bits, block_align, _, size = parse_header(f)
+        if (format_tag, bits) not in _format_bits_to_codec or block_align != channels * bits // 8:
+            raise ValueError(f"Unsupported WAV format: format tag {format_tag:#x}, {bits} bits per sample")
+        self._codec = _format_bits_to_codec[(format_tag, bits)]
+        self._dtype = _format_bits_to_dtype[(format_tag, bits)]
+        self._format = "wav"
+        self._bits_per_sample = bits
+        self._num_channels = channels
+        self._sample_rate = rate
+        self._num_frames = size // block_align
+
+    def parse_flac(self, head: bytes, pos: int):
+        # the first metadata block is always STREAMINFO
+        if len(head) < pos + 38 or head[pos] & 0x7F != 0:
+            raise ValueError("FLAC stream without STREAMINFO")
+        info = int.from_bytes(head[pos + 14 : pos + 22], "big")
+        self._sample_rate = info >> 44
+        self._num_channels = ((info >> 41) & 0x07) + 1
+        self._bits_per_sample = ((info >> 36) & 0x1F) + 1
+        num_frames = info & 0xFFFFFFFFF
+        if self._sample_rate == 0:
+            raise ValueError("Invalid FLAC STREAMINFO")
+        self._codec = "flac"
+        self._dtype = np.dtype(np.int16 if self._bits_per_sample <= 16 else np.int32)
+        self._format = "flac"
+        # 0 if the total number of samples is unknown
+        self._num_frames = num_frames if num_frames > 0 else None
+
+    def parse_mpeg(self, head: bytes, base: int):
+        # the first frame header followed by another one, to skip junk and false syncs
+        pos = 0
+        while True:
+            pos = head.find(b"\xff", pos)
+            if pos < 0 or pos + 4 > len(head):
+                raise ValueError("No MPEG audio frame found")
+            header = parse_mpeg_frame_header(head, pos)
+            if header is not None:
+                next_pos = pos + header["frame_size"]
+                if next_pos + 4 > len(head) or parse_mpeg_frame_header(head, next_pos) is not None:
+                    break
+            pos += 1
+
+        self._codec = ("mp1", "mp2", "mp3")[header["layer"] - 1]
+        self._dtype = np.dtype(np.float32)
+        self._format = self._codec
+        self._bits_per_sample = 32
+        self._num_channels = header["num_channels"]
+        self._sample_rate = header["sample_rate"]
+        samples_per_frame = header["samples_per_frame"]
+
+        # Xing/Info tag in the side information of the first frame
+        if header["mpeg1"]:
+            xing = pos + 4 + (17 if header["num_channels"] == 1 else 32)
+        else:
+            xing = pos + 4 + (9 if header["num_channels"] == 1 else 17)
+        if head[xing : xing + 4] in (b"Xing", b"Info"):
+            flags = int.from_bytes(head[xing + 4 : xing + 8], "big")
+            if flags & 0x01:
+                num_frames = int.from_bytes(head[xing + 8 : xing + 12], "big") * samples_per_frame
+                # LAME tag (also written by FFmpeg) after the Xing fields: 12 bits encoder delay and 12 bits padding
+                lame = xing + 8 + 4 * (bool(flags & 0x01) + bool(flags & 0x02) + bool(flags & 0x08))
+                lame += 100 if flags & 0x04 else 0
+                if head[lame : lame + 4] in (b"LAME", b"Lavf", b"Lavc"):
+                    delay_padding = int.from_bytes(head[lame + 21 : lame + 24], "big")
+                    self.trimmed_samples = (delay_padding >> 12) + (delay_padding & 0xFFF)
+                    num_frames -= self.trimmed_samples
+                self._num_frames = max(num_frames, 0)
+                return
+        # VBRI tag 32 bytes after the frame header
+        if head[pos + 36 : pos + 40] == b"VBRI":
+            self._num_frames = int.from_bytes(head[pos + 50 : pos + 54], "big") * samples_per_frame
+            return
+        # CBR: estimated from the size of the audio data
+        self._num_frames = int((self.file_size - base - pos) * 8 / header["bit_rate"] * self._sample_rate)
+
+    def parse_ogg(self, head: bytes, tail: bytes):
+        # the first packet of the first page is the identification header
+        num_segments = head[26]
+        packet = head[27 + num_segments :]
+        serial = head[14:18]
+        if packet[:8] == b"OpusHead":
+            self._codec = "opus"
+            self._num_channels = packet[9]
+            pre_skip = struct.unpack("<H", packet[10:12])[0]
+            # Opus is always decoded at 48 kHz
+            self._sample_rate = 48000
+        elif packet[:7] == b"\x01vorbis":
+            self._codec = "vorbis"
+            self._num_channels = packet[11]
+            self._sample_rate = struct.unpack("<I", packet[12:16])[0]
+            pre_skip = 0
+        else:
+            raise ValueError("Unsupported Ogg stream")
+        self._dtype = np.dtype(np.float32)
+        self._format = "ogg"
+        self._bits_per_sample = 32
+
+        # the granule position of the last page of the stream is the number of samples (plus the pre-skip)
+        self._num_frames = None
+        pos = len(tail)
+        while True:
+            pos = tail.rfind(b"OggS", 0, pos)
+            if pos < 0 or pos + 27 > len(tail):
+                break
+            granule = struct.unpack("<q", tail[pos + 6 : pos + 14])[0]
+            if tail[pos + 14 : pos + 18] == serial and granule >= 0:
+                self._num_frames = max(granule - pre_skip, 0)
+                break
+
+    @cached_property
+    def bits_per_sample(self) -> int:
+        return self._bits_per_sample
+
+    @cached_property
+    def codec(self) -> str:
+        return get_codec_name(self._codec)
+
+    @cached_property
+    def duration(self) -> Optional[Seconds]:
+        if self.num_frames is None:
+            return None
+        return Seconds(self.num_frames / self.sample_rate)
+
+    @cached_property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @cached_property
+    def format(self) -> str:
+        return self._format
+
+    @cached_property
+    def num_channels(self) -> int:
+        return self._num_channels
+
+    @cached_property
+    def num_frames(self) -> Optional[int]:
+        return self._num_frames
+
+    @cached_property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @cached_property
+    def seekable(self) -> bool:
+        return True
+
+    @cached_property
+    def size(self) -> Optional[int]:
+        return self.file_size
@@ -0,0 +1,172 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import struct
+from functools import cached_property
+from typing import Any, BinaryIO, Optional, Union
+
+import numpy as np
+from av.codec import Codec
+
+from audiolab.av.frame import unpack_int24
+from audiolab.av.typing import Seconds
+from audiolab.reader.backend.backend import Backend
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_format_bits_to_codec = {
+    (WAVE_FORMAT_PCM, 8): "pcm_u8",
+    (WAVE_FORMAT_PCM, 16): "pcm_s16le",
+    (WAVE_FORMAT_PCM, 24): "pcm_s24le",
+    (WAVE_FORMAT_PCM, 32): "pcm_s32le",
+    (WAVE_FORMAT_IEEE_FLOAT, 32): "pcm_f32le",
+    (WAVE_FORMAT_IEEE_FLOAT, 64): "pcm_f64le",
+}
+_format_bits_to_dtype = {
+    (WAVE_FORMAT_PCM, 8): np.dtype("u1"),
+    (WAVE_FORMAT_PCM, 16): np.dtype("<i2"),
+    (WAVE_FORMAT_PCM, 24): np.dtype("<i4"),
+    (WAVE_FORMAT_PCM, 32): np.dtype("<i4"),
+    (WAVE_FORMAT_IEEE_FLOAT, 32): np.dtype("<f4"),
+    (WAVE_FORMAT_IEEE_FLOAT, 64): np.dtype("<f8"),
+}
+
+
+def parse_header(file: Union[str, os.PathLike, BinaryIO]):
+    """
+    Parse the RIFF/RF64 header of a WAV file.
+
+    Args:
+        file: The path to the WAV file, or a binary file object positioned at the start of the WAV file.
+    Returns:
+        The format tag, number of channels, sample rate, bits per sample, offset and size of the data chunk.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            return parse_header(f)
+
+    riff, _, wave = struct.unpack("<4sI4s", file.read(12))
+    if riff not in (b"RIFF", b"RF64", b"BW64") or wave != b"WAVE":
+        raise ValueError(f"{file} is not a RIFF/RF64 WAV file")
+
+    fmt = None
+    ds64_data_size = None
+    while True:
+        header = file.read(8)
+        if len(header) < 8:
+            raise ValueError(f"{file} has no data chunk")
+        chunk_id, chunk_size = struct.unpack("<4sI", header)
+        if chunk_id == b"ds64":
+            # riff size, data size, sample count (64-bit each)
+            _, ds64_data_size, _ = struct.unpack("<QQQ", file.read(24))
+            file.seek(chunk_size - 24 + chunk_size % 2, os.SEEK_CUR)
+        elif chunk_id == b"fmt ":
+            chunk = file.read(chunk_size + chunk_size % 2)
+            format_tag, channels, rate, _, block_align, bits = struct.unpack("<HHIIHH", chunk[:16])
+            if format_tag == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # the first two bytes of the SubFormat GUID are the format tag
+                format_tag = struct.unpack("<H", chunk[24:26])[0]
+            fmt = (format_tag, channels, rate, bits, block_align)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError(f"{file} has no fmt chunk before the data chunk")
+            offset = file.tell()
+            if chunk_size == 0xFFFFFFFF and ds64_data_size is not None:
+                chunk_size = ds64_data_size
+            # the data chunk of truncated or still-being-written files may be shorter than declared
+            size = min(chunk_size, file.seek(0, os.SEEK_END) - offset)
+            file.seek(offset)
+            return (*fmt, offset, size)
+        else:
+            file.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+
+class MemMap(Backend):
+    """
+    Zero-copy WAV backend: the PCM data chunk is exposed as a copy-on-write `numpy.memmap`,
+    so that reads are strided views over the page cache, which is shared between processes.
+    """
+
+    def __init__(self, file: Any, frame_size: Optional[int] = None, forced_decoding: bool = False):
+        if not isinstance(file, (str, os.PathLike)):
+            raise TypeError("MemMap backend only supports local files")
+        file = os.fspath(file)
+        super().__init__(file, frame_size, forced_decoding)
+        self.format_tag, channels, rate, bits, block_align, offset, size = parse_header(file)
+        if (self.format_tag, bits) not in _format_bits_to_dtype or block_align != channels * bits // 8:
+            raise ValueError(f"Unsupported WAV format: format tag {self.format_tag:#x}, {bits} bits per sample")
+        self._num_channels = channels
+        self._sample_rate = rate
+        self._bits_per_sample = bits
+        num_frames = size // block_align
+        if bits == 24:
+            shape = (num_frames, channels, 3)
+            dtype = np.uint8
+        else:
+            shape = (num_frames, channels)
+            dtype = _format_bits_to_dtype[(self.format_tag, bits)]
+        self.memmap = np.memmap(file, dtype, "c", offset, shape) if num_frames > 0 else np.empty(shape, dtype)
+        self.pos = 0
+
+    @cached_property
+    def bits_per_sample(self) -> int:
+        return self._bits_per_sample
+
+    @cached_property
+    def codec(self) -> str:
+        return Codec(_format_bits_to_codec[(self.format_tag, self.bits_per_sample)]).long_name
+
+    @cached_property
+    def duration(self) -> Optional[Seconds]:
+        return Seconds(self.num_frames / self.sample_rate)
+
+    @cached_property
+    def dtype(self) -> np.dtype:
+        return _format_bits_to_dtype[(self.format_tag, self.bits_per_sample)]
+
+    @cached_property
+    def format(self) -> str:
+        return "WAV"
+
+    @cached_property
+    def num_channels(self) -> int:
+        return self._num_channels
+
+    @cached_property
+    def num_frames(self) -> int:
+        return self.memmap.shape[0]
+
+    @cached_property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @cached_property
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, nframes: int) -> Optional[np.ndarray]:
+        frames = self.memmap[self.pos : self.pos + nframes]
+        if frames.shape[0] == 0:
+            return None
+        self.pos += frames.shape[0]
+        if self.bits_per_sample == 24:
+            frames = unpack_int24(frames).reshape(-1, self.num_channels)
+        # (num_samples, num_channels) => (num_channels, num_samples), a strided view over the memmap
+        return np.asarray(frames).T
+
+    def seek(self, offset: int):
+        self.pos = min(max(offset, 0), self.num_frames)
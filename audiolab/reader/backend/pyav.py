@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from functools import cached_property
+from io import BytesIO
 from typing import Any, Iterator, List, Optional
 
 import av
@@ -26,15 +27,31 @@ from audiolab.av.format import get_dtype
 from audiolab.av.graph import Graph
 from audiolab.av.typing import UINT32_MAX, AudioFormat, AudioFrame, Filter, Seconds
 from audiolab.reader.backend.backend import Backend
+from audiolab.reader.backend.header import Header
+
+# the containers whose packet timestamps are in samples
+_sample_accurate_formats = ("aac", "aiff", "caf", "flac", "mp3", "ogg", "w64", "wav")
 
 
 class PyAV(Backend):
-    def __init__(self, file: Any, frame_size: Optional[int] = None, forced_decoding: bool = False):
+    def __init__(
+        self,
+        file: Any,
+        frame_size: Optional[int] = None,
+        forced_decoding: bool = False,
+        threads: Optional[int] = None,
+    ):
         super().__init__(file, frame_size, forced_decoding)
         self.container = av.open(file, metadata_errors="ignore")
         self.stream = self.container.streams.audio[0]
+        if threads is not None:
+            # frame and slice threading, only used by the codecs that support it (0 for auto)
+            self.stream.codec_context.thread_type = "AUTO"
+            self.stream.codec_context.thread_count = threads
         self.dtype = get_dtype(self.stream.format)
         self.graph = None
+        self.seek_index = None
+        self.frames = None
 
     @cached_property
     def bits_per_sample(self) -> int:
@@ -62,12 +79,14 @@ class PyAV(Backend):
     @cached_property
     def duration(self) -> Optional[Seconds]:
         if self.forced_decoding:
-            num_frames = 0
-            try:
-                for frame in self.container.decode(self.stream):
-                    num_frames += frame.samples
-            except (EOFError, StopIteration):
-                pass
+            num_frames = self.count_samples()
+            if num_frames is None:
+                num_frames = 0
+                try:
+                    for frame in self.decode():
+                        num_frames += frame.samples
+                except (EOFError, StopIteration):
+                    pass
             duration = num_frames / self.stream.rate
         else:
             duration = None
@@ -93,7 +112,7 @@ class PyAV(Backend):
     def num_frames(self) -> Optional[int]:
         if self.duration is None:
             return None
-        return int(self.duration * self.stream.rate)
+        return round(self.duration * self.stream.rate)
 
     @cached_property
     def metadata(self) -> dict:
@@ -118,6 +137,41 @@ class PyAV(Backend):
         byte_seek = Flags.no_byte_seek not in flags
         return generic_index or seek_to_pts or byte_seek
 
+    def count_samples(self) -> Optional[int]:
+        """
+        Count the samples by demuxing only, from the pts and durations of the packets.
+
+        Returns:
+            The number of samples, or None if the packets lack durations or the container does not
+            have sample-accurate timestamps (e.g. Matroska in milliseconds, MP4 with edit lists).
+        """
+        if self.container.format.name.split(",")[0] not in _sample_accurate_formats:
+            return None
+        num_samples = 0
+        for packet in self.container.demux(self.stream):
+            if packet.size == 0:
+                continue
+            if packet.pts is None or not packet.duration:
+                # rewind for decoding
+                self.container.seek(0, stream=self.stream)
+                return None
+            # the samples before 0 (e.g. Opus pre-skip, Vorbis priming) are discarded by the decoder
+            num_samples += max(packet.pts + packet.duration - max(packet.pts, 0), 0)
+        num_samples = round(num_samples * self.stream.time_base * self.stream.rate)
+        if self.container.format.name == "mp3" and self.stream.start_time:
+            # the encoder delay and padding in the LAME tag are trimmed by the decoder
+            pos = self.file.tell() if isinstance(self.file, BytesIO) else None
+            try:
+                if pos is not None:
+                    self.file.seek(0)
+                num_samples -= Header(self.file).trimmed_samples
+            except Exception:
+                return None
+            finally:
+                if pos is not None:
+                    self.file.seek(pos)
+        return num_samples
+
     def build_graph(self, format: AudioFormat, filters: Optional[List[Filter]] = None):
         if self.graph is None:
             self.dtype = get_dtype(format)
@@ -130,7 +184,9 @@ class PyAV(Backend):
                 frame_size=self.frame_size,
             )
 
-    def load_audio(self, offset: Seconds = 0, duration: Optional[Seconds] = None) -> Iterator[AudioFrame]:
+    def load_audio(
+        self, offset: Seconds = 0, duration: Optional[Seconds] = None, return_ndarray: bool = True
+    ) -> Iterator[AudioFrame]:
         offset = int(offset / self.stream.time_base)
         self.seek(offset)
         frames = UINT32_MAX if duration is None else int(duration * self.sample_rate)
@@ -144,19 +200,36 @@ class PyAV(Backend):
                 continue
             frames -= frame.samples
             self.graph.push(frame)
-            yield from self.graph.pull()
+            yield from self.graph.pull(return_ndarray=return_ndarray)
         if self.graph is not None:
-            yield from self.graph.pull(partial=True)
+            yield from self.graph.pull(partial=True, return_ndarray=return_ndarray)
+
+    def decode(self) -> Iterator[AudioFrame]:
+        # one demuxing and decoding generator for all reads, until the next seek
+        if self.frames is None:
+            self.frames = self.container.decode(self.stream)
+        return self.frames
 
     def read(self) -> Optional[AudioFrame]:
         try:
-            return next(self.container.decode(self.stream))
+            return next(self.decode())
         except (EOFError, StopIteration):
             return None
 
     def seek(self, offset: int):
-        if offset > 0:
+        # a fresh decoder is at 0 already, and the non-seekable inputs can't seek
+        if offset > 0 or self.frames is not None:
+            if offset > 0 and self.seek_index is not None:
+                idx = self.seek_index.lookup(offset)
+                try:
+                    self.container.seek(int(self.seek_index.pos[idx]), unsupported_byte_offset=True)
+                    self.frames = self.seek_index.decode(self.container, self.stream, idx)
+                    return
+                except av.FFmpegError:
+                    # the demuxer does not support seeking by bytes (e.g. mov/mp4, which are indexed anyway)
+                    self.seek_index = None
             self.container.seek(offset, stream=self.stream)
+        self.frames = None
 
     def split_frame(self, frame: AudioFrame, offset: int, frames: int):
         offset = max(offset - frame.pts, 0) * frame.time_base * frame.sample_rate
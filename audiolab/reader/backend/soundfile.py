@@ -92,9 +92,14 @@ class SoundFile(Backend):
         if self.forced_decoding:
             num_frames = 0
             pos = self.sf.tell()
+            # count in blocks into one reused buffer instead of reading the whole file into memory
+            out = np.empty((self.chunk_size, self.num_channels), np.int16)
             try:
-                frames = self.sf.read()
-                num_frames = frames.shape[0]
+                while True:
+                    frames = self.sf.read(out=out).shape[0]
+                    if frames == 0:
+                        break
+                    num_frames += frames
             except sf.LibsndfileError:
                 self.sf = sf.SoundFile(self.file)
             self.seek(pos)
@@ -117,11 +122,33 @@ class SoundFile(Backend):
         return self.sf.seekable()
 
     def read(self, nframes: int, dtype: Optional[Dtype] = None) -> Optional[np.ndarray]:
-        if dtype is None:
-            dtype = self.dtype
-        frames = self.sf.read(nframes, dtype=dtype if dtype in _supported_dtypes else np.float64)
-        return np.atleast_2d(clip(frames, dtype).T) if frames.shape[0] > 0 else None
+        dtype = np.dtype(self.dtype if dtype is None else dtype)
+        if dtype in _supported_dtypes:
+            frames = self.sf.read(nframes, dtype=dtype, always_2d=True)
+            if dtype.kind == "f":
+                frames = clip(frames, dtype)
+        elif dtype.kind in ("i", "u") and dtype.itemsize == 1:
+            # 8-bit: the upper bytes of the 16-bit samples, exact for 8-bit files and without float intermediates
+            frames = self.sf.read(nframes, dtype=np.int16, always_2d=True)
+            frames = np.right_shift(frames, 8, out=frames).astype(np.int8)
+            if dtype.kind == "u":
+                frames = np.bitwise_xor(frames.view(np.uint8), 0x80, out=frames.view(np.uint8))
+        else:
+            frames = clip(self.sf.read(nframes, dtype=np.float64, always_2d=True), dtype)
+        # (num_samples, num_channels) => (num_channels, num_samples), a view without copying
+        return frames.T if frames.shape[0] > 0 else None
+
+    def read_into(self, out: np.ndarray) -> int:
+        if out.dtype not in _supported_dtypes or out.dtype != self.dtype:
+            return super().read_into(out)
+        if out.shape[0] == 1 and out.strides[1] == out.itemsize:
+            # mono: libsndfile writes straight into the row of out
+            return self.sf.read(min(out.shape[1], self.frame_size), out.dtype, out=out[0]).shape[0]
+        frames = self.sf.read(min(out.shape[1], self.frame_size, self.chunk_size), out.dtype)
+        out[:, : frames.shape[0]] = frames.T
+        return frames.shape[0]
 
     def seek(self, offset: int):
-        if offset > 0:
+        # rewind to 0 after reads, while the non-seekable inputs are only read from the start
+        if offset > 0 or (self.sf.seekable() and self.sf.tell() > 0):
             self.sf.seek(offset)
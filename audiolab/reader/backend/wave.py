@@ -19,7 +19,8 @@ from typing import Any, Optional
 import numpy as np
 from av.codec import Codec
 
-from audiolab.av.typing import Seconds
+from audiolab.av.frame import clip, unpack_int24
+from audiolab.av.typing import Dtype, Seconds
 from audiolab.reader.backend.backend import Backend
 
 _bits_to_codec = {8: "pcm_u8le", 16: "pcm_s16le", 24: "pcm_s32le", 32: "pcm_s32le"}
@@ -76,23 +77,21 @@ class Wave(Backend):
     def seekable(self) -> bool:
         return True
 
-    def frombuffer(self, buffer: bytes) -> np.ndarray:
-        if self.bits_per_sample == 24:
-            frames = np.frombuffer(buffer, np.uint8)
-            frames = (
-                (frames[2::3].astype(np.int32) << 16)
-                | (frames[1::3].astype(np.int32) << 8)
-                | frames[0::3].astype(np.int32)
-            )
-            frames[frames > 0x7FFFFF] -= 0x1000000
+    def frombuffer(self, buffer: bytes, dtype: Optional[Dtype] = None) -> np.ndarray:
+        dtype = np.dtype(self.dtype if dtype is None else dtype)
+        if self.bits_per_sample == 24 and (dtype == self.dtype or dtype.kind == "f"):
+            # full scale int32 (as decoded by FFmpeg and libsndfile), or float without int32 intermediates
+            frames = unpack_int24(buffer, dtype)
         else:
-            frames = np.frombuffer(buffer, self.dtype)
+            frames = unpack_int24(buffer) if self.bits_per_sample == 24 else np.frombuffer(buffer, self.dtype)
+            frames = clip(frames, dtype)
         return frames.reshape(-1, self.num_channels).T
 
-    def read(self, nframes: int) -> Optional[np.ndarray]:
+    def read(self, nframes: int, dtype: Optional[Dtype] = None) -> Optional[np.ndarray]:
         buffer = self.wave.readframes(nframes)
-        return self.frombuffer(buffer) if len(buffer) > 0 else None
+        return self.frombuffer(buffer, dtype) if len(buffer) > 0 else None
 
     def seek(self, offset: int):
-        if offset > 0:
+        # rewind to 0 after reads, while the non-seekable inputs are only read from the start
+        if offset > 0 or self.wave.tell() > 0:
             self.wave.setpos(offset)
@@ -18,13 +18,18 @@ from typing import Any, List, Optional, Union
 
 import numpy as np
 from av.codec import Codec
-from humanize import naturalsize
 
+from audiolab.av.remote import RemoteFile, is_http_url
 from audiolab.av.typing import Seconds
 from audiolab.av.utils import get_template
-from audiolab.reader.backend import pyav, soundfile, wave
+from audiolab.reader.backend import header, memmap, pyav, soundfile, wave
+from audiolab.reader.info_cache import InfoCache
+from audiolab.reader.sniff import sniff_backends
 
 _backends = {
+    "header": header,
+    "memmap": memmap,
+    "mmap": memmap,
     "av": pyav,
     "pyav": pyav,
     "sf": soundfile,
@@ -40,24 +45,41 @@ class Info:
         frame_size: Optional[int] = None,
         forced_decoding: bool = False,
         backends: Optional[List[str]] = None,
+        threads: Optional[int] = None,
+        cache: Optional[InfoCache] = None,
     ):
+        if is_http_url(file):
+            # range requests of the headers (and the frames to read) instead of downloading the whole file
+            file = RemoteFile(file)
         self.file = file
+        if cache is not None:
+            backend = cache.get(file, forced_decoding, backends)
+            if backend is not None:
+                self.backend = backend
+                return
+
+        requested = backends
         if backends is None:
-            backends = ["soundfile", "pyav"]
+            backends = sniff_backends(file)
 
         for idx, backend in enumerate(backends):
-            pos = file.tell() if isinstance(file, BytesIO) else 0
+            pos = file.tell() if isinstance(file, (BytesIO, RemoteFile)) else 0
             try:
                 backend = _backends.get(backend, pyav)
-                self.backend = backend(file, frame_size, forced_decoding)
+                if backend is pyav:
+                    self.backend = backend(file, frame_size, forced_decoding, threads)
+                else:
+                    self.backend = backend(file, frame_size, forced_decoding)
                 if self.duration is None and not isinstance(self.backend, pyav):
                     continue
                 break
             except Exception as e:
-                if isinstance(file, BytesIO):
+                if isinstance(file, (BytesIO, RemoteFile)):
                     file.seek(pos)
                 if idx == len(backends) - 1:
                     raise e
+        if cache is not None:
+            cache.put(file, self.backend, forced_decoding, requested)
 
     @cached_property
     def bits_per_sample(self) -> int:
@@ -158,6 +180,8 @@ class Info:
     def format_bit_rate(bit_rate: Union[int, None]) -> str:
         if bit_rate is None or bit_rate <= 0:
             return "N/A"
+        from humanize import naturalsize
+
         bit_rate = naturalsize(bit_rate).rstrip("B")
         return Info.rstrip_zeros(bit_rate) + "bps"
 
@@ -180,6 +204,8 @@ class Info:
     @staticmethod
     def format_size(size: int) -> str:
         if size not in (-1, -38, -78, None):
+            from humanize import naturalsize
+
             size = naturalsize(size)
         return Info.rstrip_zeros(size)
 
@@ -0,0 +1,235 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+import numpy as np
+
+from audiolab.av.utils import get_cache_dir, get_logger
+from audiolab.reader.backend import Backend
+
+logger = get_logger(__name__)
+
+CACHE_VERSION = 2
+# the number of insertions between two checks of the number of entries
+EVICTION_INTERVAL = 1024
+# the fields of the backend stored in the cache
+FIELDS = (
+    "bits_per_sample",
+    "bit_rate",
+    "codec",
+    "duration",
+    "dtype",
+    "format",
+    "layout",
+    "metadata",
+    "num_channels",
+    "num_frames",
+    "sample_rate",
+    "seekable",
+    "size",
+)
+
+
+class CachedInfo:
+    """
+    The information of an audio file restored from the info cache, without opening the file.
+    It holds the fields of the backend which has probed the file, and can't read the audio.
+    """
+
+    def __init__(self, file: Any, fields: dict):
+        self.file = file
+        # the cached files are local paths, which are their names
+        self.name = file
+        self.__dict__.update(fields)
+        self.dtype = np.dtype(self.dtype)
+
+
+class InfoCache:
+    """
+    Persistent cache of the information of local audio files in a SQLite database,
+    keyed by the real path, size and modification time of the files and the requested backends.
+    The least recently used entries are evicted when there are more than `max_entries`.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_entries: int = 1_000_000):
+        """
+        Create an InfoCache object.
+
+        Args:
+            path: The path to the database, `$AUDIOLAB_CACHE_DIR/info-v2.sqlite` by default.
+            max_entries: The maximum number of entries.
+        """
+        self.path = get_cache_dir(f"info-v{CACHE_VERSION}.sqlite") if path is None else Path(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._insertions = 0
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    def connect(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared with forked processes
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS info (path TEXT, backends TEXT, size INTEGER, mtime_ns INTEGER, "
+                "forced_decoding INTEGER, fields TEXT, accessed REAL, PRIMARY KEY (path, backends))"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS info_accessed ON info (accessed)")
+            self._pid = os.getpid()
+            self._insertions = 0
+        return self._connection
+
+    def evict(self, connection: sqlite3.Connection):
+        num_entries = connection.execute("SELECT COUNT(*) FROM info").fetchone()[0]
+        if num_entries > self.max_entries:
+            num_evicted = num_entries - self.max_entries
+            connection.execute(
+                "DELETE FROM info WHERE rowid IN (SELECT rowid FROM info ORDER BY accessed LIMIT ?)", (num_evicted,)
+            )
+            self.evictions += num_evicted
+
+    @staticmethod
+    def get_key(file: Any) -> Optional[tuple]:
+        if not isinstance(file, (str, os.PathLike)) or "://" in os.fspath(file):
+            return None
+        try:
+            stat = os.stat(file)
+        except OSError:
+            return None
+        return os.path.realpath(file), stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def get_backends(backends: Optional[List[Union[str, type]]] = None) -> str:
+        # the backends report different fields (e.g. the header backend has no tags, PyAV and soundfile name the
+        # formats and codecs differently), the default ones are sniffed from the content of the file
+        if backends is None:
+            return ""
+        return ",".join(backend if isinstance(backend, str) else backend.__name__ for backend in backends)
+
+    def get(
+        self, file: Any, forced_decoding: bool = False, backends: Optional[List[Union[str, type]]] = None
+    ) -> Optional[CachedInfo]:
+        """
+        Get the cached information of a local file.
+
+        Args:
+            file: The path to the audio file.
+            forced_decoding: Whether the duration must have been got by forced decoding.
+            backends: The backends requested to get the information, which must be the ones of the entry.
+        Returns:
+            The cached information, or None if the file is not cached or has been modified.
+        """
+        key = InfoCache.get_key(file)
+        if key is None:
+            return None
+        with self._lock:
+            try:
+                connection = self.connect()
+                backends = InfoCache.get_backends(backends)
+                row = connection.execute(
+                    "SELECT fields FROM info WHERE path = ? AND backends = ? AND size = ? AND mtime_ns = ? "
+                    "AND forced_decoding >= ?",
+                    (key[0], backends, *key[1:], int(forced_decoding)),
+                ).fetchone()
+                if row is not None:
+                    with connection:
+                        connection.execute(
+                            "UPDATE info SET accessed = ? WHERE path = ? AND backends = ?",
+                            (time.time(), key[0], backends),
+                        )
+            except (OSError, sqlite3.Error) as e:
+                logger.debug("Failed to read the info cache %s: %s", self.path, e)
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return CachedInfo(file, json.loads(row[0]))
+
+    def put(
+        self,
+        file: Any,
+        backend: Backend,
+        forced_decoding: bool = False,
+        backends: Optional[List[Union[str, type]]] = None,
+    ):
+        """
+        Cache the information of a local file.
+
+        Args:
+            file: The path to the audio file.
+            backend: The backend which has probed the file.
+            forced_decoding: Whether the duration has been got by forced decoding.
+            backends: The backends requested to get the information.
+        """
+        key = InfoCache.get_key(file)
+        if key is None:
+            return
+        fields = {field: getattr(backend, field) for field in FIELDS}
+        fields["dtype"] = np.dtype(fields["dtype"]).str
+        fields["duration"] = None if fields["duration"] is None else float(fields["duration"])
+        fields["metadata"] = {str(k): str(v) for k, v in fields["metadata"].items()}
+        with self._lock:
+            try:
+                connection = self.connect()
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO info VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            key[0],
+                            InfoCache.get_backends(backends),
+                            *key[1:],
+                            int(forced_decoding),
+                            json.dumps(fields),
+                            time.time(),
+                        ),
+                    )
+                    # counting the entries is a full scan, so it is amortized over the insertions
+                    if self._insertions % min(EVICTION_INTERVAL, max(self.max_entries // 16, 1)) == 0:
+                        self.evict(connection)
+                    self._insertions += 1
+            except (OSError, sqlite3.Error) as e:
+                logger.debug("Failed to write the info cache %s: %s", self.path, e)
+
+    def clear(self):
+        with self._lock:
+            connection = self.connect()
+            with connection:
+                connection.execute("DELETE FROM info")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.connect().execute("SELECT COUNT(*) FROM info").fetchone()[0]
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self)}
+
+
+@lru_cache(maxsize=None)
+def get_info_cache() -> InfoCache:
+    return InfoCache()
@@ -0,0 +1,149 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Any, List, Optional, Union
+
+import numpy as np
+
+from audiolab.av.typing import Dtype, Filter, Seconds
+from audiolab.reader.info_cache import InfoCache
+
+
+class PCMCache:
+    """
+    In-memory cache of the decoded audios (after the filters, the format conversion and the resampling),
+    keyed by the source and the processing parameters, so that loading the same audio again skips the decoding.
+
+    The sources are the local files, identified by their real path, size and modification time (a modified file is
+    a cache miss), and the URLs. The least recently used audios are evicted when the audios take more than
+    `max_bytes`, and the audios larger than `max_bytes` are not admitted.
+
+    The cached audios are read-only ndarrays shared by all the hits, copy them before modifying them in place.
+    """
+
+    def __init__(self, max_bytes: int = 1024**3):
+        """
+        Create a PCMCache object.
+
+        Args:
+            max_bytes: The maximum number of bytes of the cached audios, 1 GiB by default.
+        """
+        self.max_bytes = max_bytes
+        self.cache_dict: OrderedDict[tuple, tuple] = OrderedDict()
+        self.num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(
+        file: Any,
+        offset: Seconds = 0.0,
+        duration: Optional[Seconds] = None,
+        filters: Optional[List[Filter]] = None,
+        dtype: Optional[Dtype] = None,
+        rate: Optional[int] = None,
+        to_mono: bool = False,
+        backends: Optional[List[str]] = None,
+        seek_index: Union[bool, str, os.PathLike] = False,
+    ) -> Optional[tuple]:
+        """
+        Get the key of an audio and its processing parameters.
+
+        Returns:
+            The key, or None if the source can't be identified (e.g. bytes or file objects, missing files).
+        """
+        if isinstance(file, str) and "://" in file:
+            source = (file,)
+        elif isinstance(file, (str, os.PathLike)):
+            source = InfoCache.get_key(file)
+            if source is None:
+                return None
+        else:
+            return None
+        dtype = None if dtype is None else np.dtype(dtype).str
+        # the backends decode differently (e.g. the padding of MP3), the default ones are sniffed from the content,
+        # which the source identifies
+        backends = None if backends is None else tuple(backends)
+        return (*source, float(offset), duration, repr(filters or []), dtype, rate, to_mono, backends, bool(seek_index))
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        """
+        Get the cached audio of a key, and mark it as the most recently used.
+
+        Returns:
+            The read-only audio of shape (num_channels, num_samples) and the sample rate, or None if not cached.
+        """
+        with self._lock:
+            value = self.cache_dict.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.cache_dict.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, audio: np.ndarray, rate: int) -> tuple:
+        """
+        Cache the audio of a key, evicting the least recently used audios if the cache is full.
+
+        Args:
+            key: The key got by `PCMCache.get_key`.
+            audio: The audio of shape (num_channels, num_samples), which must not be modified afterwards.
+            rate: The sample rate of the audio.
+        Returns:
+            The cached audio and the sample rate.
+        """
+        if audio.nbytes > self.max_bytes:
+            return audio, rate
+        audio.flags.writeable = False
+        with self._lock:
+            value = self.cache_dict.pop(key, None)
+            if value is not None:
+                self.num_bytes -= value[0].nbytes
+            while len(self.cache_dict) > 0 and self.num_bytes + audio.nbytes > self.max_bytes:
+                _, (removed_audio, _) = self.cache_dict.popitem(last=False)
+                self.num_bytes -= removed_audio.nbytes
+                self.evictions += 1
+            self.cache_dict[key] = (audio, rate)
+            self.num_bytes += audio.nbytes
+        return audio, rate
+
+    def clear(self):
+        with self._lock:
+            self.cache_dict.clear()
+            self.num_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.cache_dict)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes": self.num_bytes,
+                "entries": len(self.cache_dict),
+            }
+
+
+@lru_cache(maxsize=None)
+def get_pcm_cache() -> PCMCache:
+    return PCMCache()
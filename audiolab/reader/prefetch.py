@@ -0,0 +1,80 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_end = object()
+
+
+def prefetch(iterable: Iterable[T], size: int, timeout: float = 0.1) -> Iterator[T]:
+    """
+    Iterate over `iterable` on a background thread, at most `size` items ahead of the consumer.
+
+    PyAV and libsndfile release the GIL while decoding, so that decoding overlaps with the work of the consumer.
+    The exceptions raised by `iterable` are re-raised to the consumer, and the background thread is stopped
+    when the returned iterator is closed or garbage collected before it is exhausted.
+
+    Args:
+        iterable: The iterable to prefetch.
+        size: The maximum number of prefetched items.
+        timeout: The interval (in seconds) at which the background thread checks whether to stop.
+    """
+    queue = Queue(maxsize=size)
+    stop = Event()
+
+    def put(item, error=None) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put((item, error), timeout=timeout)
+                return True
+            except Full:
+                pass
+        return False
+
+    def produce():
+        iterator = iter(iterable)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+            put(_end)
+        except BaseException as e:
+            put(None, e)
+        finally:
+            # close the generator on the thread which runs it
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+    thread = Thread(target=produce, name="audiolab-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            try:
+                item, error = queue.get(timeout=timeout)
+            except Empty:
+                if not thread.is_alive() and queue.empty():
+                    return
+                continue
+            if error is not None:
+                raise error
+            if item is _end:
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
@@ -12,17 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import requests
+import os
 from functools import cached_property, partial
 from io import BytesIO
-from typing import Any, Iterator, List, Optional
+from math import ceil, inf
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+import av
+import numpy as np
 
 from audiolab.av import aformat, load_url
-from audiolab.av.frame import pad
+from audiolab.av.lhotse import AudioCache
+from audiolab.av.frame import pad, to_ndarray
 from audiolab.av.graph import Graph
 from audiolab.av.typing import UINT32_MAX, AudioFrame, Dtype, Filter, Seconds
-from audiolab.reader.backend import pyav, soundfile
+from audiolab.reader.backend import header, pyav, soundfile, wave
 from audiolab.reader.info import Info
+from audiolab.reader.prefetch import prefetch
+from audiolab.reader.seek_index import SeekIndex
 
 
 class Reader(Info):
@@ -36,10 +44,14 @@ class Reader(Info):
         rate: Optional[int] = None,
         to_mono: bool = False,
         frame_size: Optional[int] = None,
-        cache_url: bool = False,
+        cache_url: Union[bool, AudioCache] = False,
         always_2d: bool = True,
         fill_value: Optional[float] = None,
         backends: Optional[List[str]] = None,
+        seek_index: Union[bool, str, Path] = False,
+        prefetch: int = 0,
+        threads: Optional[int] = None,
+        channels_last: bool = False,
     ):
         """
         Create a Reader object.
@@ -53,60 +65,90 @@ class Reader(Info):
             rate: The sample rate of the audio frames.
             to_mono: Whether to convert the audio frames to mono.
             frame_size: The frame size of the audio frames.
-            cache_url: Whether to cache the audio file.
+            cache_url: Whether to cache the audio file (in the shared `get_audio_cache()`), or the cache.
             always_2d: Whether to return 2d ndarrays even if the audio frame is mono.
             fill_value: The fill value to pad the audio to the frame size.
             backends: The backends to use.
+            seek_index: Whether to seek compressed local files (MP3, AAC, Ogg, etc.) with a persistent seek index,
+                or the directory of the index files (`$AUDIOLAB_CACHE_DIR/seek_index` by default).
+            prefetch: The number of frames decoded ahead on a background thread, 0 to decode synchronously.
+            threads: The number of threads to decode with the PyAV backend (0 for auto), FFmpeg's default if None.
+            channels_last: Whether to yield the audio frames of shape (num_samples, num_channels), which is the
+                memory layout of libsndfile and packed formats, so that they are not transposed.
         """
+        if backends is not None and any(backend in ("header", header) for backend in backends):
+            raise ValueError("The header backend only reads the information of the audio, not the audio frames")
         if isinstance(file, bytes):
             file = BytesIO(file)
         elif isinstance(file, str) and "://" in file:
-            response = requests.head(file, allow_redirects=False)
-            if response.status_code in [301, 302, 303, 307, 308]:
-                file = response.headers.get("Location")
-            if cache_url:
-                file = load_url(file, cache=True)
+            # the redirects are followed by the requests of the shared HTTP session (see `HTTPSession`)
+            if cache_url is not False:
+                file = load_url(file, cache=cache_url)
             elif offset == 0 and duration is None:
                 file = load_url(file, cache=False)
+            # otherwise, the frames in range are fetched with range requests by RemoteFile (see `Info`)
 
-        super().__init__(file, frame_size, backends=backends)
-        if isinstance(self.backend, soundfile):
+        # without the info cache, the backend must open the file to read the audio
+        super().__init__(file, frame_size, backends=backends, threads=threads)
+        # attached whatever the offset, `segments` seeks to the start of each span
+        if seek_index and isinstance(self.backend, pyav) and isinstance(file, (str, os.PathLike)):
+            cache_dir = None if seek_index is True else seek_index
+            self.backend.seek_index = SeekIndex.get(file, cache_dir)
+        if isinstance(self.backend, (soundfile, wave)):
             self.backend.read = partial(self.backend.read, dtype=dtype)
         self.filters = [] if filters is None else filters
+        # the shape and dtype of the output are only known in advance without custom filters
+        self.has_filters = len(self.filters) > 0
+        self.out_dtype = self.dtype if dtype is None else np.dtype(dtype)
+        self.out_rate = self.rate if rate is None else rate
+        self.out_channels = 1 if to_mono else self.num_channels
         if not self.is_passthrough(dtype, rate, to_mono):
             self.filters.append(aformat(dtype, rate=rate, to_mono=to_mono))
 
         self.graph = None
-        if len(self.filters) > 0:
-            if isinstance(self.backend, pyav):
-                self.backend.build_graph = partial(self.backend.build_graph, filters=self.filters)
-            else:
-                self.graph = Graph(
-                    rate=self.rate,
-                    dtype=self.dtype,
-                    is_planar=self.backend.is_planar,
-                    channels=self.num_channels,
-                    filters=self.filters,
-                    frame_size=self.frame_size,
-                )
+        if len(self.filters) > 0 and isinstance(self.backend, pyav):
+            self.backend.build_graph = partial(self.backend.build_graph, filters=self.filters)
+        self.build_graph()
         self.offset = offset
         self._duration = duration
         self.always_2d = always_2d
         self.fill_value = fill_value
+        self.prefetch = prefetch
+        self.channels_last = channels_last
+        self._remaining = None
+        self._frames = None
+        self._leftover = None
 
     @cached_property
     def frame_size(self) -> int:
         return self.backend.frame_size
 
+    def build_graph(self):
+        if isinstance(self.backend, pyav):
+            # built by the backend from the format of the first decoded frame
+            self.backend.graph = None
+        elif len(self.filters) > 0:
+            self.graph = Graph(
+                rate=self.rate,
+                dtype=self.dtype,
+                is_planar=self.backend.is_planar,
+                channels=self.num_channels,
+                filters=self.filters,
+                frame_size=self.frame_size,
+            )
+
     def __iter__(self) -> Iterator[AudioFrame]:
+        if self.prefetch > 0:
+            return prefetch(self._iter_frames(), self.prefetch)
+        return self._iter_frames()
+
+    def _iter_frames(self) -> Iterator[AudioFrame]:
         for frame in self.backend.load_audio(self.offset, self._duration):
             if self.graph is None:
                 rate = self.rate
                 if isinstance(self.backend, pyav):
                     frame, rate = frame
-                if self.fill_value is not None:
-                    frame = pad(frame, self.frame_size, self.fill_value)
-                yield frame if self.always_2d else frame.squeeze(), rate
+                yield self.format_frame(frame), rate
             else:
                 self.graph.push(frame)
                 yield from self.pull()
@@ -124,6 +166,138 @@ class Reader(Info):
     def pull(self, partial: bool = False) -> AudioFrame:
         for frame in self.graph.pull(partial=partial):
             frame, rate = frame
-            if self.fill_value is not None:
-                frame = pad(frame, self.frame_size, self.fill_value)
-            yield frame if self.always_2d else frame.squeeze(), rate
+            yield self.format_frame(frame), rate
+
+    def format_frame(self, frame: np.ndarray) -> np.ndarray:
+        if self.fill_value is not None:
+            frame = pad(frame, self.frame_size, self.fill_value)
+        if self.channels_last:
+            frame = frame.T
+        return frame if self.always_2d else frame.squeeze()
+
+    def segments(self, ranges: List[Tuple[Seconds, Optional[Seconds]]]) -> Iterator[AudioFrame]:
+        """
+        Read multiple segments of the audio, decoding overlapping and adjacent ranges as one span.
+
+        Args:
+            ranges: The (start, end) of the segments in seconds, end of None for the end of the audio.
+        Returns:
+            The iterator of the audio frames and the sample rate of the segments, in the order of ranges.
+        """
+        ends = [inf if end is None else end for _, end in ranges]
+        spans = []
+        for idx in sorted(range(len(ranges)), key=lambda idx: (ranges[idx][0], ends[idx])):
+            if len(spans) > 0 and ranges[idx][0] <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], ends[idx])
+                spans[-1][2].append(idx)
+            else:
+                spans.append([ranges[idx][0], ends[idx], [idx]])
+
+        segments = {}
+        next_idx = 0
+        for start, end, indices in spans:
+            # the graph can't take frames after being flushed, so it is rebuilt with the same filters
+            self.build_graph()
+            self.offset = start
+            self._duration = None if end == inf else end - start
+            self._remaining = self._frames = self._leftover = None
+            audio, rate = self.read()
+            for idx in indices:
+                begin = int(ranges[idx][0] * rate) - int(start * rate)
+                if ends[idx] == inf:
+                    segments[idx] = audio[..., begin:], rate
+                else:
+                    segments[idx] = audio[..., begin : begin + int((ends[idx] - ranges[idx][0]) * rate)], rate
+            while next_idx in segments:
+                yield segments.pop(next_idx)
+                next_idx += 1
+
+    def read(self, out: Optional[np.ndarray] = None) -> Tuple[np.ndarray, int]:
+        """
+        Read the whole audio at once.
+
+        Args:
+            out: The ndarray of shape (num_channels, num_samples) to read into,
+                allocated from the number of frames in the header if None.
+        Returns:
+            The audio frames (a view of out) and the sample rate.
+        """
+        if out is None:
+            if self.has_filters or self.num_frames is None:
+                frames = []
+                for frame, _ in self._iter_frames():
+                    frames.append(np.atleast_2d(frame.T if self.channels_last and frame.ndim == 2 else frame))
+                out = np.concatenate(frames, axis=1) if len(frames) > 0 else np.array([])
+                return out if self.always_2d else out.squeeze(), self.out_rate
+            num_frames = max(self.num_frames - int(self.offset * self.rate), 0)
+            if self._duration is not None:
+                num_frames = min(num_frames, int(self._duration * self.rate))
+            # leave room for the resampler delay and inaccurate headers, untouched pages are never committed
+            num_frames = ceil(num_frames * self.out_rate / self.rate) + self.backend.chunk_size
+            out = np.empty((self.out_channels, num_frames), self.out_dtype)
+            num_frames = self.read_into(out)
+            while num_frames == out.shape[1]:
+                out = np.concatenate((out, np.empty_like(out)), axis=1)
+                num_frames += self.read_into(out, num_frames)
+        else:
+            num_frames = self.read_into(out)
+        out = out[:, :num_frames]
+        return out if self.always_2d else out.squeeze(), self.out_rate
+
+    def read_into(self, out: np.ndarray, offset: int = 0) -> int:
+        """
+        Read the audio into a preallocated ndarray in place, successive calls continue where the previous one stopped.
+
+        Args:
+            out: The ndarray of shape (num_channels, num_samples) and dtype `out_dtype` to read into.
+            offset: The offset (in samples) of out to start writing at.
+        Returns:
+            The number of samples (per channel) written, 0 at the end of the audio.
+        """
+        out = out[:, offset:]
+        if self.graph is None and not isinstance(self.backend, pyav):
+            # passthrough: the backend writes into out directly
+            if self._remaining is None:
+                self.backend.seek(int(self.offset * self.rate))
+                self._remaining = UINT32_MAX if self._duration is None else int(self._duration * self.rate)
+            num_frames = 0
+            while num_frames < out.shape[1] and self._remaining > 0:
+                frames = self.backend.read_into(out[:, num_frames : num_frames + self._remaining])
+                if frames == 0:
+                    self._remaining = 0
+                    break
+                num_frames += frames
+                self._remaining -= frames
+            return num_frames
+
+        if self._frames is None:
+            self._frames = self._iter_av_frames()
+        num_frames = 0
+        while num_frames < out.shape[1]:
+            if self._leftover is None:
+                frame = next(self._frames, None)
+                if frame is None:
+                    break
+                if frame.samples <= out.shape[1] - num_frames:
+                    num_frames += to_ndarray(frame, out=out[:, num_frames:]).shape[1]
+                    continue
+                self._leftover = to_ndarray(frame)
+            frames = min(self._leftover.shape[1], out.shape[1] - num_frames)
+            out[:, num_frames : num_frames + frames] = self._leftover[:, :frames]
+            self._leftover = self._leftover[:, frames:] if frames < self._leftover.shape[1] else None
+            num_frames += frames
+        return num_frames
+
+    def _iter_av_frames(self) -> Iterator[av.AudioFrame]:
+        # bound the frames buffered in the graph instead of holding the whole audio in one frame
+        frame_size = min(self.frame_size, self.backend.chunk_size)
+        self.backend.frame_size = frame_size
+        if isinstance(self.backend, pyav):
+            yield from self.backend.load_audio(self.offset, self._duration, return_ndarray=False)
+            return
+        self.graph.frame_size = frame_size
+        self.graph.set_audio_frame_size(frame_size)
+        for frame in self.backend.load_audio(self.offset, self._duration):
+            self.graph.push(frame)
+            yield from self.graph.pull(return_ndarray=False)
+        yield from self.graph.pull(partial=True, return_ndarray=False)
@@ -0,0 +1,162 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+from fractions import Fraction
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import av
+import numpy as np
+from av.container import InputContainer
+
+from audiolab.av.typing import AudioFrame, Seconds
+from audiolab.av.utils import atomic_open, get_cache_dir, get_logger
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 1
+
+
+class SeekIndex:
+    """
+    Seek index of the audio packets of a file: the pts (in stream time base) and the byte offset of each packet.
+
+    Formats without a precise index (MP3 without TOC, raw AAC, Ogg) are seeked by bytes to the nearest packet
+    before the offset (minus a preroll for the decoder to converge), and the pts of the demuxed packets are
+    restored from the index, so that the decoded frames can be split at the exact sample.
+    """
+
+    def __init__(self, pts: np.ndarray, pos: np.ndarray, time_base: Fraction):
+        self.pts = pts
+        self.pos = pos
+        self.time_base = time_base
+
+    def __len__(self) -> int:
+        return len(self.pts)
+
+    @classmethod
+    def build(cls, file: Union[str, Path]) -> Optional["SeekIndex"]:
+        """
+        Build the seek index of a file in one demux pass.
+
+        Returns:
+            The seek index, or None if the packets have no byte offsets (e.g. the demuxer does not report them).
+        """
+        with av.open(os.fspath(file), metadata_errors="ignore") as container:
+            stream = container.streams.audio[0]
+            pts, pos = [], []
+            for packet in container.demux(stream):
+                if packet.size == 0:
+                    continue
+                if packet.pos is None or packet.pos < 0 or (len(pos) > 0 and packet.pos < pos[-1]):
+                    return None
+                if packet.pts is None:
+                    if len(pts) == 0 or not packet.duration:
+                        return None
+                    packet_pts = pts[-1] + packet.duration
+                else:
+                    packet_pts = packet.pts
+                pts.append(packet_pts)
+                pos.append(packet.pos)
+            if len(pts) == 0:
+                return None
+            return cls(np.array(pts, np.int64), np.array(pos, np.int64), stream.time_base)
+
+    @staticmethod
+    def get_path(file: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None) -> Path:
+        realpath = os.path.realpath(file)
+        digest = hashlib.sha1(realpath.encode()).hexdigest()[:16]
+        cache_dir = get_cache_dir("seek_index") if cache_dir is None else Path(cache_dir)
+        return cache_dir / f"{Path(realpath).name}.{digest}.npz"
+
+    @staticmethod
+    def get_key(file: Union[str, Path]) -> np.ndarray:
+        stat = os.stat(file)
+        return np.array([INDEX_VERSION, stat.st_size, stat.st_mtime_ns], np.int64)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], key: np.ndarray) -> Optional["SeekIndex"]:
+        try:
+            with np.load(path) as data:
+                if not np.array_equal(data["key"], key):
+                    return None
+                numerator, denominator = data["time_base"]
+                return cls(data["pts"], data["pos"], Fraction(int(numerator), int(denominator)))
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def save(self, path: Union[str, Path], key: np.ndarray):
+        time_base = np.array([self.time_base.numerator, self.time_base.denominator], np.int64)
+        with atomic_open(path) as f:
+            np.savez(f, key=key, pts=self.pts, pos=self.pos, time_base=time_base)
+
+    @classmethod
+    def get(cls, file: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None) -> Optional["SeekIndex"]:
+        """
+        Load the seek index of a local file from the cache directory, or build and cache it.
+
+        Args:
+            file: The path to the audio file.
+            cache_dir: The directory of the index files, `$AUDIOLAB_CACHE_DIR/seek_index` by default.
+        Returns:
+            The seek index, or None if it cannot be built for the file.
+        """
+        path = cls.get_path(file, cache_dir)
+        key = cls.get_key(file)
+        index = cls.load(path, key)
+        if index is None:
+            index = cls.build(file)
+            if index is not None:
+                try:
+                    index.save(path, key)
+                except OSError as e:
+                    logger.debug("Failed to save the seek index to %s: %s", path, e)
+        return index
+
+    def lookup(self, pts: int, preroll: Seconds = 0.1, min_preroll_packets: int = 8) -> int:
+        """
+        Get the index of the packet to seek to, in order to decode from `pts`.
+
+        Args:
+            pts: The target pts in stream time base.
+            preroll: The duration decoded before the target, for the decoder to converge (e.g. 80 ms for Opus).
+            min_preroll_packets: The minimum number of packets decoded before the target (e.g. MP3 bit reservoir).
+        Returns:
+            The index of the first packet at the byte offset to seek to.
+        """
+        idx = max(int(np.searchsorted(self.pts, pts, "right")) - 1, 0)
+        preroll_pts = self.pts[idx] - int(preroll / self.time_base)
+        idx = min(int(np.searchsorted(self.pts, preroll_pts, "right")) - 1, idx - min_preroll_packets)
+        idx = max(idx, 0)
+        # several packets may share a byte offset (e.g. Ogg pages), seek to the first one
+        return int(np.searchsorted(self.pos, self.pos[idx]))
+
+    def decode(self, container: InputContainer, stream: av.AudioStream, idx: int) -> Iterator[AudioFrame]:
+        """
+        Demux and decode the stream after seeking to the byte offset of packet `idx`,
+        restoring the pts of the packets from the index.
+        """
+        for packet in container.demux(stream):
+            if packet.size > 0 and idx is not None:
+                if packet.pos is not None and packet.pos >= 0 and packet.pos != self.pos[min(idx, len(self) - 1)]:
+                    idx = int(np.searchsorted(self.pos, packet.pos))
+                if idx < len(self) and self.pos[idx] == packet.pos:
+                    packet.pts = packet.dts = int(self.pts[idx])
+                    idx += 1
+                else:
+                    # the packet is not in the index, keep the timestamps of the demuxer from now on
+                    idx = None
+            yield from packet.decode()
@@ -0,0 +1,337 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+
+from audiolab.av.disk_cache import get_hash
+from audiolab.av.utils import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_VERSION = 1
+# the directory of the POSIX shared memory segments on Linux, which is a tmpfs
+SHM_DIR = "/dev/shm"
+# the interval in seconds to write the accesses and the releases of the hits to the index
+SYNC_INTERVAL = 1.0
+
+
+def open_segment(name: str, create: bool = False, size: int = 0) -> SharedMemory:
+    # the segments outlive the processes which create or attach them, so the resource tracker must not unlink them
+    try:
+        return SharedMemory(name, create=create, size=size, track=False)
+    except TypeError:
+        # Python < 3.13 has no `track` argument
+        shm = SharedMemory(name, create=create, size=size)
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception as e:
+            logger.debug("Failed to unregister the shared memory %s: %s", name, e)
+        return shm
+
+
+def unlink_segment(name: str):
+    try:
+        # tracked by the resource tracker, which unlink unregisters
+        shm = SharedMemory(name)
+        shm.close()
+        shm.unlink()
+    except OSError:
+        pass
+
+
+def is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class SharedPCMCache:
+    """
+    Cache of the decoded audios in POSIX shared memory, shared by all the processes of a host (e.g. the workers of
+    a data loader), so that each audio is held once in memory instead of once per process.
+
+    Each audio is a shared memory segment named after the key (see `PCMCache.get_key`), and a SQLite index next to
+    the segments (`/dev/shm/audiolab-shm-v1.sqlite` on Linux) holds their shapes, the processes referencing them and
+    their last access. The hits are read-only zero-copy views of the segments, and a process references a segment
+    until its last view is garbage collected. The hits do not write the index but the first reference of a segment
+    by a process, the accesses and the releases are written in batches at most every `SYNC_INTERVAL` seconds, by the
+    insertions and by `flush`.
+
+    The least recently used segments which are not referenced are evicted when the segments take more than
+    `max_bytes`, and the audios are not admitted if the referenced segments fill the budget. The references of dead
+    processes (e.g. crashed workers) and the segments left by interrupted insertions are removed by the insertions,
+    and `clear` removes all the segments.
+
+    It requires POSIX shared memory (Linux and macOS), and raises an OSError on Windows.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, max_bytes: int = 4 * 1024**3):
+        """
+        Create a SharedPCMCache object.
+
+        Args:
+            path: The path to the index, `/dev/shm/audiolab-shm-v1.sqlite` (or in the temporary directory) by default.
+                The processes using the same index share the segments.
+            max_bytes: The maximum number of bytes of the segments, 4 GiB by default.
+        """
+        if os.name == "nt":
+            raise OSError("SharedPCMCache requires POSIX shared memory, which Windows does not provide")
+        if path is None:
+            directory = SHM_DIR if os.path.isdir(SHM_DIR) else tempfile.gettempdir()
+            path = Path(directory) / f"audiolab-shm-v{CACHE_VERSION}.sqlite"
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        # the names of the segments of different indexes do not collide (at most 30 characters on macOS)
+        self.prefix = f"al{get_hash(str(self.path.resolve()))[:8]}_"
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # reentrant, the views may be garbage collected (and released) while the lock is held
+        self._lock = threading.RLock()
+        self._connection = None
+        self._pid = None
+        # the segments attached by this process and the number of their views alive, the segments referenced in the
+        # index by this process, and the accesses and the releases not written to the index yet
+        self._segments: Dict[str, List] = {}
+        self._refs: Set[str] = set()
+        self._accessed: Dict[str, float] = {}
+        self._released: Set[str] = set()
+        self._synced = time.monotonic()
+
+    def connect(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared with forked processes
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS segments (name TEXT PRIMARY KEY, nbytes INTEGER, dtype TEXT, "
+                "shape TEXT, rate INTEGER, accessed REAL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS refs (name TEXT, pid INTEGER, PRIMARY KEY (name, pid))"
+            )
+            self._pid = os.getpid()
+            # the segments attached by the parent process are not referenced by the forked process
+            self._segments = {}
+            self._refs = set()
+            self._accessed = {}
+            self._released = set()
+        return self._connection
+
+    def get_name(self, key: tuple) -> str:
+        return self.prefix + get_hash(repr(key))[:18]
+
+    def attach(self, name: str, dtype: str, shape: tuple) -> np.ndarray:
+        # a view of the segment, which references it until the view (and its own views) are garbage collected
+        if name not in self._segments:
+            self._segments[name] = [open_segment(name), 0]
+        if name not in self._refs:
+            self.connect().execute("INSERT OR IGNORE INTO refs VALUES (?, ?)", (name, os.getpid()))
+            self._refs.add(name)
+        self._released.discard(name)
+        segment = self._segments[name]
+        base = np.frombuffer(segment[0].buf, np.dtype(dtype), count=int(np.prod(shape)))
+        # numpy does not collapse the base of the views past this array, whose memoryview exports the buffer of the
+        # segment, and the finalizer of the memoryview runs once the export is released, so the segment can be closed.
+        # The exiting processes do not release, their references are removed as the references of dead processes.
+        weakref.finalize(base.base, self.release, name, os.getpid()).atexit = False
+        segment[1] += 1
+        audio = base.reshape(shape)
+        audio.flags.writeable = False
+        return audio
+
+    def release(self, name: str, pid: int):
+        with self._lock:
+            if pid != os.getpid() or name not in self._segments:
+                return
+            segment = self._segments[name]
+            segment[1] -= 1
+            if segment[1] > 0:
+                return
+            del self._segments[name]
+            segment[0].close()
+            self._released.add(name)
+
+    def sync(self, connection: sqlite3.Connection):
+        # write the accesses and the releases of this process to the index
+        connection.executemany(
+            "UPDATE segments SET accessed = ? WHERE name = ?", [(t, name) for name, t in self._accessed.items()]
+        )
+        connection.executemany("DELETE FROM refs WHERE name = ? AND pid = ?", [(n, self._pid) for n in self._released])
+        self._refs -= self._released
+        self._accessed.clear()
+        self._released.clear()
+        self._synced = time.monotonic()
+
+    def flush(self):
+        """
+        Write the accesses and the releases of the hits of this process to the index.
+        """
+        with self._lock:
+            try:
+                connection = self.connect()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self.sync(connection)
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                logger.debug("Failed to write the shared memory cache %s: %s", self.path, e)
+
+    def get(self, key: tuple) -> Optional[Tuple[np.ndarray, int]]:
+        """
+        Get the cached audio of a key, and mark it as the most recently used.
+
+        Returns:
+            The read-only view of shape (num_channels, num_samples) and the sample rate, or None if not cached.
+        """
+        name = self.get_name(key)
+        with self._lock:
+            try:
+                connection = self.connect()
+                row = connection.execute("SELECT dtype, shape, rate FROM segments WHERE name = ?", (name,)).fetchone()
+                if row is not None:
+                    audio = self.attach(name, row[0], tuple(json.loads(row[1])))
+            except FileNotFoundError:
+                # the segment is removed (e.g. by a reboot or a manual cleanup), and the entry is dangling
+                self.connect().execute("DELETE FROM segments WHERE name = ?", (name,))
+                row = None
+            except (OSError, sqlite3.Error) as e:
+                logger.debug("Failed to read the shared memory cache %s: %s", self.path, e)
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._accessed[name] = time.time()
+            if time.monotonic() - self._synced >= SYNC_INTERVAL:
+                self.flush()
+        return audio, row[2]
+
+    def put(self, key: tuple, audio: np.ndarray, rate: int) -> Tuple[np.ndarray, int]:
+        """
+        Copy the audio of a key to shared memory, evicting the least recently used segments if the cache is full.
+
+        Args:
+            key: The key got by `PCMCache.get_key`.
+            audio: The audio of shape (num_channels, num_samples).
+            rate: The sample rate of the audio.
+        Returns:
+            The read-only view of the segment and the sample rate, or the audio itself if it is not admitted.
+        """
+        name = self.get_name(key)
+        nbytes = audio.nbytes
+        with self._lock:
+            try:
+                connection = self.connect()
+                # the insertions of all the processes are serialized by the write lock of the database
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self.sync(connection)
+                    if self.evict(connection, nbytes) and nbytes > 0:
+                        shm = open_segment(name, create=True, size=nbytes)
+                        np.frombuffer(shm.buf, audio.dtype, count=audio.size).reshape(audio.shape)[...] = audio
+                        shm.close()
+                        connection.execute(
+                            "INSERT OR REPLACE INTO segments VALUES (?, ?, ?, ?, ?, ?)",
+                            (name, nbytes, audio.dtype.str, json.dumps(audio.shape), rate, time.time()),
+                        )
+                        audio = self.attach(name, audio.dtype.str, audio.shape)
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+            except FileExistsError:
+                # inserted by another process in the meantime
+                pass
+            except (OSError, sqlite3.Error) as e:
+                logger.debug("Failed to write the shared memory cache %s: %s", self.path, e)
+        return audio, rate
+
+    def evict(self, connection: sqlite3.Connection, nbytes: int) -> bool:
+        # remove the references of the dead processes, and the segments of the interrupted insertions
+        for (pid,) in connection.execute("SELECT DISTINCT pid FROM refs").fetchall():
+            if not is_alive(pid):
+                connection.execute("DELETE FROM refs WHERE pid = ?", (pid,))
+        names = {name for (name,) in connection.execute("SELECT name FROM segments")}
+        if os.path.isdir(SHM_DIR):
+            for name in os.listdir(SHM_DIR):
+                if name.startswith(self.prefix) and name not in names:
+                    unlink_segment(name)
+        if nbytes > self.max_bytes:
+            return False
+
+        num_bytes = connection.execute("SELECT COALESCE(SUM(nbytes), 0) FROM segments").fetchone()[0]
+        if num_bytes + nbytes <= self.max_bytes:
+            return True
+        # the views of the referenced segments are alive, so they are kept
+        rows = connection.execute(
+            "SELECT name, nbytes FROM segments WHERE name NOT IN (SELECT name FROM refs) ORDER BY accessed"
+        ).fetchall()
+        for name, size in rows:
+            if num_bytes + nbytes <= self.max_bytes:
+                break
+            unlink_segment(name)
+            connection.execute("DELETE FROM segments WHERE name = ?", (name,))
+            num_bytes -= size
+            self.evictions += 1
+        return num_bytes + nbytes <= self.max_bytes
+
+    def clear(self):
+        """
+        Remove all the segments, the views alive stay valid until they are garbage collected.
+        """
+        with self._lock:
+            connection = self.connect()
+            connection.execute("BEGIN IMMEDIATE")
+            for (name,) in connection.execute("SELECT name FROM segments").fetchall():
+                unlink_segment(name)
+            connection.execute("DELETE FROM segments")
+            connection.execute("COMMIT")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.connect().execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+
+    def stats(self) -> dict:
+        with self._lock:
+            num_bytes, entries = (
+                self.connect().execute("SELECT COALESCE(SUM(nbytes), 0), COUNT(*) FROM segments").fetchone()
+            )
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes": num_bytes,
+            "entries": entries,
+        }
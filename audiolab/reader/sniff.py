@@ -0,0 +1,123 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from functools import lru_cache
+from io import BytesIO
+from typing import Any, List, Optional
+
+from audiolab.av.remote import RemoteFile
+from audiolab.reader.backend.header import parse_mpeg_frame_header, skip_id3v2
+
+# the number of bytes read to sniff the format (after the ID3v2 tag, if any)
+SNIFF_SIZE = 64
+
+# signatures at the start of the file => format names of libsndfile, None for the formats only read by FFmpeg
+_signatures = {
+    b"fLaC": "FLAC",
+    b"OggS": "OGG",
+    b"RF64": "RF64",
+    b"BW64": "RF64",
+    b"FORM": "AIFF",
+    b".snd": "AU",
+    b"caff": "CAF",
+    b"\x1a\x45\xdf\xa3": None,  # Matroska / WebM
+    b"#!AM": None,  # AMR
+    b"MAC ": None,  # Monkey's Audio
+    b"wvpk": None,  # WavPack
+    b"\x30\x26\xb2\x75": None,  # ASF / WMA
+}
+
+
+@lru_cache(maxsize=None)
+def get_soundfile_formats() -> frozenset:
+    import soundfile as sf
+
+    return frozenset(sf.available_formats())
+
+
+def sniff_format(head: bytes) -> Optional[str]:
+    """
+    Sniff the format of an audio file from its first bytes (after the ID3v2 tag, if any).
+
+    Returns:
+        The format name of libsndfile (e.g. "WAV", "FLAC", "MP3"), "" for the formats only read by FFmpeg
+        (e.g. MP4, ADTS AAC, WebM), or None if unknown.
+    """
+    if head[:4] == b"RIFF":
+        return "WAV" if head[8:12] == b"WAVE" else None
+    if head[:4] == b"riff":
+        return "W64"
+    if head[4:8] == b"ftyp":
+        return ""
+    if head[:4] in _signatures:
+        return _signatures[head[:4]] or ""
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xF6 == 0xF0:
+        # ADTS: MPEG sync with layer bits 00
+        return ""
+    if parse_mpeg_frame_header(head, 0) is not None:
+        return "MP3"
+    return None
+
+
+def read_head(file: Any) -> Optional[bytes]:
+    # the first bytes of a local file, BytesIO or RemoteFile after the ID3v2 tag, None for the other inputs
+    if isinstance(file, (str, os.PathLike)):
+        if "://" in os.fspath(file):
+            return None
+        try:
+            with open(file, "rb") as f:
+                head = f.read(SNIFF_SIZE)
+                offset = skip_id3v2(head)
+                if offset > 0:
+                    f.seek(offset)
+                    head = f.read(SNIFF_SIZE)
+                return head
+        except OSError:
+            return None
+    if isinstance(file, BytesIO):
+        with file.getbuffer() as buffer:
+            pos = file.tell()
+            head = bytes(buffer[pos : pos + SNIFF_SIZE])
+            offset = skip_id3v2(head)
+            if offset > 0:
+                head = bytes(buffer[pos + offset : pos + offset + SNIFF_SIZE])
+            return head
+    if isinstance(file, RemoteFile):
+        pos = file.tell()
+        try:
+            head = file.read(SNIFF_SIZE)
+            offset = skip_id3v2(head)
+            if offset > 0:
+                file.seek(pos + offset)
+                head = file.read(SNIFF_SIZE)
+            return head
+        finally:
+            file.seek(pos)
+    return None
+
+
+def sniff_backends(file: Any) -> List[str]:
+    """
+    Get the backends to open an audio file with from its signature, so that the formats which libsndfile
+    cannot read (e.g. MP4, AAC, WebM) are opened by PyAV directly instead of after a failed open.
+
+    Returns:
+        The backends, soundfile then PyAV if the input cannot be sniffed (e.g. a URL or a stream) or is unknown.
+    """
+    head = read_head(file)
+    format = None if head is None else sniff_format(head)
+    if format is None or format in get_soundfile_formats():
+        return ["soundfile", "pyav"]
+    return ["pyav"]
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from io import BytesIO
+import io
+import threading
+import weakref
 from typing import Iterator, List, Optional
 
 import av
@@ -22,8 +24,144 @@ from audiolab.av import aformat
 from audiolab.av.graph import Graph
 from audiolab.av.typing import AudioFormat, AudioFrame, Dtype, Filter
 
+# the demuxer does not read ahead to analyze the stream, which would wait for more bytes before the first frames
+OPTIONS = {"probesize": "32"}
+
+
+class StreamInput(io.RawIOBase):
+    """
+    Non-seekable input of the demuxer, whose reads block until more bytes are fed or the stream is finished.
+    The bytes are dropped once read, so the memory does not grow with the length of the stream, except the bytes read
+    before the first frame is decoded, which are kept to decode the formats which can't be demuxed without seeking.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.condition = threading.Condition()
+        # whether the stream is finished, the demuxer is waiting for more bytes, and the demuxer is done
+        self.eof = False
+        self.waiting = False
+        self.done = False
+        self.num_bytes = 0
+        self.head = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def feed(self, data: bytes):
+        with self.condition:
+            if self.eof:
+                raise ValueError("The stream is finished, no more bytes can be fed")
+            self.buffer += data
+            self.condition.notify_all()
+
+    def finish(self):
+        with self.condition:
+            self.eof = True
+            self.condition.notify_all()
+
+    def read(self, size: int = -1) -> bytes:
+        with self.condition:
+            while len(self.buffer) == 0 and not self.eof:
+                self.waiting = True
+                self.condition.notify_all()
+                self.condition.wait()
+            self.waiting = False
+            size = len(self.buffer) if size is None or size < 0 else size
+            data = bytes(self.buffer[:size])
+            del self.buffer[:size]
+            self.num_bytes += len(data)
+            if self.head is not None:
+                self.head += data
+            return data
+
+    def wait(self):
+        # until the demuxer has consumed all the bytes fed and waits for more, or is done with the finished stream
+        with self.condition:
+            self.condition.wait_for(lambda: self.done or (not self.eof and self.waiting and len(self.buffer) == 0))
+
+
+class StreamDecoder(threading.Thread):
+    """
+    Persistent demuxer, decoder and filter graph of a stream on a thread, which reads the stream input.
+    """
+
+    def __init__(self, filters: Optional[List[Filter]], frame_size: Optional[int]):
+        super().__init__(name="audiolab-stream-reader", daemon=True)
+        self.input = StreamInput()
+        self.filters = filters
+        self.frame_size = frame_size
+        self.codec_context = None
+        self.graph = None
+        self.frames = []
+        self.error = None
+
+    def run(self):
+        try:
+            try:
+                self.decode(self.input)
+            except av.InvalidDataError:
+                if self.graph is not None or self.input.head is None:
+                    raise
+                # the formats which can't be demuxed without seeking (e.g. MP4 whose index is after the audio data)
+                # are decoded from the bytes kept once the stream is finished
+                while len(self.input.read()) > 0:
+                    pass
+                self.decode(io.BytesIO(self.input.head))
+        except av.EOFError:
+            pass
+        except Exception as e:
+            # raised by the pulls, e.g. the invalid data
+            self.error = e
+        finally:
+            with self.input.condition:
+                self.input.done = True
+                self.input.condition.notify_all()
+
+    def decode(self, file: io.RawIOBase):
+        with av.open(file, metadata_encoding="latin1", options=OPTIONS) as container:
+            stream = container.streams.audio[0]
+            self.codec_context = stream.codec_context
+            # the flushing packets at the end of the stream flush the decoder
+            for packet in container.demux(stream):
+                for frame in packet.decode():
+                    if self.graph is None:
+                        self.graph = Graph(stream, filters=self.filters, frame_size=self.frame_size)
+                        self.input.head = None
+                    self.graph.push(frame)
+                    self.add(self.graph.pull())
+            if self.graph is not None:
+                self.add(self.graph.pull(partial=True))
+
+    def add(self, frames: Iterator[AudioFrame]):
+        frames = list(frames)
+        with self.input.condition:
+            self.frames.extend(frames)
+
+    def pull(self, partial: bool = False) -> List[AudioFrame]:
+        if partial:
+            self.input.finish()
+        self.input.wait()
+        with self.input.condition:
+            frames, self.frames = self.frames, []
+        if self.error is not None:
+            raise self.error
+        return frames
+
 
 class StreamReader:
+    """
+    Decode an audio stream pushed in chunks (e.g. the messages of a websocket).
+
+    The demuxer and the decoder persist over the pushes on a thread, and read the pushed bytes from a non-seeking
+    input which blocks until more bytes are pushed, so that each pull only processes the new bytes.
+    The formats which can't be demuxed without seeking (e.g. MP4 and MOV files whose index is after the audio data,
+    without "faststart") are decoded once the stream is finished, and the invalid streams raise at the pulls.
+    """
+
     def __init__(
         self,
         filters: Optional[List[Filter]] = None,
@@ -46,69 +184,46 @@ class StreamReader:
             to_mono: Whether to convert the output audio frames to mono.
             frame_size: The frame size of the audio frames.
         """
-        self._codec_context = None
-        self._graph = None
-        self.bytes_io = BytesIO()
-        self.bytes_per_decode_attempt = 0
         if not all([dtype is None, format is None, rate is None, to_mono is None]):
             filters = filters or []
             filters.append(aformat(dtype, is_planar, format, rate, to_mono))
         self.filters = filters
         self.frame_size = frame_size
-        self.offset = None
-        self.packet = None
+        self.decoder = None
 
     @property
     def codec_context(self) -> Optional[AudioCodecContext]:
-        if self._codec_context is None:
-            if self.packet is None:
-                return None
-            self._codec_context = self.packet.stream.codec_context
-        return self._codec_context
+        return None if self.decoder is None else self.decoder.codec_context
 
     @property
     def graph(self) -> Optional[Graph]:
-        if self._graph is None:
-            if self.packet is None:
-                return None
-            self._graph = Graph(self.packet.stream, filters=self.filters, frame_size=self.frame_size)
-        return self._graph
+        return None if self.decoder is None else self.decoder.graph
 
     def push(self, frame: bytes):
-        self.bytes_io.write(frame)
-        self.bytes_per_decode_attempt += len(frame)
+        if len(frame) == 0:
+            return
+        # a push after the end of a stream starts the next stream
+        if self.decoder is None or self.decoder.input.eof:
+            self.decoder = StreamDecoder(self.filters, self.frame_size)
+            # the decoder thread exits once the stream reader is garbage collected
+            weakref.finalize(self, self.decoder.input.finish)
+            self.decoder.start()
+        self.decoder.input.feed(frame)
 
     def pull(self, partial: bool = False) -> Iterator[AudioFrame]:
-        if partial or self.bytes_per_decode_attempt * 2 >= self.frame_size:
-            self.bytes_per_decode_attempt = 0
-            try:
-                self.bytes_io.seek(0)
-                container = av.open(self.bytes_io, metadata_encoding="latin1")
-                for packet in container.demux():
-                    self.packet = packet
-                    if self.packet.pts is None and not partial:
-                        continue
-                    # o: current frame
-                    # pts: self.offset, frame.pts, packet.pts
-                    # +---+---+---+---+---+
-                    # | x | x | x | o |   |
-                    # +---+---+---+---+---+
-                    #             ↑
-                    #             pts
-                    if self.offset is not None and (self.packet.pts is None or self.offset > self.packet.pts):
-                        continue
-                    for frame in self.codec_context.decode(packet):
-                        self.offset = frame.pts + int(frame.samples / packet.stream.rate / packet.stream.time_base)
-                        self.graph.push(frame)
-                        yield from self.graph.pull()
-                    yield from self.graph.pull(partial=partial)
-            except (av.EOFError, av.InvalidDataError, av.OSError, av.PermissionError):
-                pass
+        """
+        Pull the audio frames decoded from the bytes pushed so far.
+
+        Args:
+            partial: Whether the stream is finished, which flushes the decoder and the partial frames at the end.
+                The next push starts another stream.
+        Returns:
+            The iterator of the audio frames and the sample rate.
+        """
+        if self.decoder is not None:
+            yield from self.decoder.pull(partial)
 
     def reset(self):
-        self._codec_context = None
-        self._graph = None
-        self.bytes_io = BytesIO()
-        self.bytes_per_decode_attempt = 0
-        self.offset = None
-        self.packet = None
+        if self.decoder is not None:
+            self.decoder.input.finish()
+        self.decoder = None
@@ -17,7 +17,7 @@ from typing import Any, Optional
 
 import numpy as np
 
-from audiolab.av.frame import clip
+from audiolab.av.frame import clip, pack_int24
 from audiolab.av.typing import Dtype
 from audiolab.writer.backend.backend import Backend
 
@@ -25,8 +25,12 @@ _dtype_to_bytes = {"uint8": 1, "int16": 2, "int32": 4}
 
 
 class Wave(Backend):
-    def __init__(self, file: Any, sample_rate: int, dtype: Optional[Dtype] = None):
-        super().__init__(file, sample_rate, dtype)
+    def __init__(self, file: Any, sample_rate: int, dtype: Optional[Dtype] = None, format: str = "WAV"):
+        # "int24": packed 24-bit samples, written from the upper bytes of full scale int32 samples
+        self.sampwidth = None
+        if isinstance(dtype, str) and dtype == "int24":
+            dtype, self.sampwidth = np.int32, 3
+        super().__init__(file, sample_rate, dtype, format)
         self.wave = None
         self.num_channels = None
 
@@ -34,8 +38,9 @@ class Wave(Backend):
         self.wave = wave.open(self.file, "w")
         self.wave.setframerate(self.sample_rate)
         self.wave.setnchannels(self.num_channels)
-        sampwidth = _dtype_to_bytes[self.dtype.name]
-        self.wave.setsampwidth(sampwidth)
+        if self.sampwidth is None:
+            self.sampwidth = _dtype_to_bytes[self.dtype.name]
+        self.wave.setsampwidth(self.sampwidth)
 
     def write(self, frame: np.ndarray):
         if self.dtype is None:
@@ -45,7 +50,11 @@ class Wave(Backend):
             self.num_channels = frame.shape[0]
         if self.wave is None:
             self.open()
-        self.wave.writeframes(frame.tobytes())
+        # (num_channels, num_samples) => (num_samples, num_channels), interleaved
+        frame = frame.T
+        if self.sampwidth == 3:
+            frame = pack_int24(frame)
+        self.wave.writeframes(np.ascontiguousarray(frame).reshape(-1).view(np.uint8))
 
     def close(self):
         if self.wave is not None and not self.is_closed:
@@ -18,12 +18,18 @@ import numpy as np
 import soundfile as sf
 
 from audiolab.av.typing import Dtype
-from audiolab.writer.backend import pyav, soundfile
+from audiolab.writer.backend import pyav, soundfile, wave
 
 
 class Writer:
     def __init__(self, file: Any, rate: int, dtype: Optional[Dtype] = None, format: str = "WAV"):
-        backend = soundfile if format.upper() in sf.available_formats() else pyav
+        if isinstance(dtype, str) and dtype == "int24":
+            # packed 24-bit samples, which have no numpy dtype
+            if format.upper() != "WAV":
+                raise ValueError("int24 is only supported for WAV")
+            backend = wave
+        else:
+            backend = soundfile if format.upper() in sf.available_formats() else pyav
         self.backend = backend(file, rate, dtype, format)
 
     def write(self, frame: np.ndarray):
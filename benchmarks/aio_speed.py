@@ -0,0 +1,90 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import tempfile
+import time
+from typing import Awaitable, Callable, Tuple
+
+import click
+from decode_speed import generate_fixture
+
+from audiolab import aio, load_audio
+
+FIXTURES = {
+    "wav": ("pcm_s16le", "s16", 16000),
+    "flac": ("flac", "s16", 16000),
+}
+
+SETTINGS = {
+    "blocking (on the event loop)": lambda path: _blocking(path),
+    "asyncio.to_thread (baseline)": lambda path: asyncio.to_thread(load_audio, path),
+    "aio.load_audio": lambda path: aio.load_audio(path),
+}
+
+
+async def _blocking(path: str):
+    return load_audio(path)
+
+
+async def measure(
+    path: str, request: Callable[[str], Awaitable], num_requests: int, concurrency: int
+) -> Tuple[float, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    done = asyncio.Event()
+    max_lag = 0.0
+
+    async def handle():
+        async with semaphore:
+            await request(path)
+
+    async def tick(interval: float = 0.001):
+        # the responsiveness of the event loop to the other requests (e.g. health checks)
+        nonlocal max_lag
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            max_lag = max(max_lag, time.perf_counter() - start - interval)
+
+    ticker = asyncio.create_task(tick())
+    start = time.perf_counter()
+    await asyncio.gather(*[handle() for _ in range(num_requests)])
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticker
+    return num_requests / elapsed, max_lag * 1000
+
+
+@click.command()
+@click.option("-d", "--duration", default=5.0, help="Duration of the fixtures in seconds")
+@click.option("-n", "--num-requests", default=500, help="Number of requests per setting")
+@click.option("-c", "--concurrency", default=64, help="Number of concurrent requests")
+def main(duration: float, num_requests: int, concurrency: int):
+    """
+    Measure the requests/sec of concurrent load_audio calls in an asyncio application, and the maximum lag of the
+    event loop while serving them.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, (codec, format, rate) in FIXTURES.items():
+            path = os.path.join(tmpdir, f"fixture.{name}")
+            generate_fixture(path, codec, format, rate, duration)
+            for setting, request in SETTINGS.items():
+                requests_per_sec, max_lag = asyncio.run(measure(path, request, num_requests, concurrency))
+                print(f"{name:<4} {setting:<30}: {requests_per_sec:10.1f} requests/sec, max loop lag {max_lag:8.1f} ms")
+    aio.shutdown()
+
+
+if __name__ == "__main__":
+    main()
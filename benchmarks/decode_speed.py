@@ -0,0 +1,78 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import time
+from typing import Callable, Optional
+
+import av
+import click
+import numpy as np
+
+from audiolab.av.utils import generate_audio, generate_ndarray
+from audiolab.reader.backend import pyav
+
+FIXTURES = {
+    "flac": ("flac", "s16", 44100),
+    "mp3": ("libmp3lame", "fltp", 44100),
+    "opus": ("libopus", "s16", 48000),
+}
+
+
+def generate_fixture(path: str, codec: str, format: str, rate: int, duration: float):
+    ndarray = generate_ndarray(2, int(rate * duration), np.float32) / 2
+    generate_audio(path, codec, ndarray, rate, format)
+
+
+def read_per_call(backend: pyav) -> Optional[av.AudioFrame]:
+    # the previous implementation: a new decoding generator for every frame
+    try:
+        return next(backend.container.decode(backend.stream))
+    except (av.error.EOFError, StopIteration):
+        return None
+
+
+def measure(path: str, read: Callable[[pyav], Optional[av.AudioFrame]], threads: Optional[int]) -> float:
+    backend = pyav(path, threads=threads)
+    num_frames = 0
+    start = time.perf_counter()
+    while read(backend) is not None:
+        num_frames += 1
+    return num_frames / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option("-d", "--duration", default=60.0, help="Duration of the fixtures in seconds")
+@click.option("-n", "--repeat", default=3, help="Number of runs per setting, the best is reported")
+def main(duration: float, repeat: int):
+    """
+    Measure the decoded frames/sec of the PyAV backend on FLAC, MP3 and Opus.
+    """
+    settings = {
+        "per-call generator": (read_per_call, None),
+        "persistent iterator": (pyav.read, None),
+        "persistent, threads=0": (pyav.read, 0),
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, (codec, format, rate) in FIXTURES.items():
+            path = os.path.join(tmpdir, f"fixture.{'ogg' if name == 'opus' else name}")
+            generate_fixture(path, codec, format, rate, duration)
+            for setting, (read, threads) in settings.items():
+                fps = max(measure(path, read, threads) for _ in range(repeat))
+                print(f"{name:<5} {setting:<24}: {fps:12.1f} frames/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import statistics
+import subprocess
+import sys
+
+import click
+
+STATEMENTS = {
+    "import audiolab": "import audiolab",
+    "import audiolab.info": "import audiolab; audiolab.info",
+    "import audiolab.save_audio": "import audiolab; audiolab.save_audio",
+    "import audiolab.load_audio": "import audiolab; audiolab.load_audio",
+    "first access of decodecs": "import audiolab.av; audiolab.av.decodecs",
+}
+
+
+def measure(statement: str) -> float:
+    code = f"import time; start = time.perf_counter(); {statement}; print(time.perf_counter() - start)"
+    output = subprocess.check_output([sys.executable, "-c", code])
+    return float(output)
+
+
+@click.command()
+@click.option("-n", "--repeat", default=10, help="Number of fresh interpreters per statement")
+def main(repeat: int):
+    """
+    Measure the wall time of importing audiolab in fresh interpreters.
+    """
+    for name, statement in STATEMENTS.items():
+        times = [measure(statement) for _ in range(repeat)]
+        print(f"{name:<32}: median {statistics.median(times) * 1000:8.2f} ms, min {min(times) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import time
+from typing import Callable
+
+import click
+import numpy as np
+
+from audiolab.av.frame import pack_int24, unpack_int24
+from audiolab.av.utils import generate_ndarray
+from audiolab.reader import load_audio
+from audiolab.writer import save_audio
+
+
+def unpack_bytewise(buffer: bytes) -> np.ndarray:
+    # the previous implementation: three strided copies, shifts and a masked subtract
+    frames = np.frombuffer(buffer, np.uint8)
+    frames = (
+        (frames[2::3].astype(np.int32) << 16) | (frames[1::3].astype(np.int32) << 8) | frames[0::3].astype(np.int32)
+    )
+    frames[frames > 0x7FFFFF] -= 0x1000000
+    return frames
+
+
+def measure(func: Callable, num_samples: int, repeats: int) -> float:
+    elapsed = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start)
+    return num_samples / min(elapsed) / 1e6
+
+
+@click.command()
+@click.option("-c", "--channels", default=2, help="Number of channels")
+@click.option("-r", "--rate", default=48000, help="Sample rate")
+@click.option("-d", "--duration", default=60.0, help="Duration of the audio in seconds")
+@click.option("-n", "--repeats", default=5, help="Number of repeats per setting, the fastest is reported")
+def main(channels: int, rate: int, duration: float, repeats: int):
+    """
+    Measure the throughput (million samples/sec) of packing and unpacking 24-bit PCM.
+    """
+    ndarray = generate_ndarray(channels, int(rate * duration), np.int32) & np.int32(-256)
+    num_samples = ndarray.size
+    buffer = pack_int24(ndarray.T).tobytes()
+
+    settings = {
+        "unpack bytewise (previous)": lambda: unpack_bytewise(buffer),
+        "unpack_int24 int32": lambda: unpack_int24(buffer),
+        "unpack_int24 float32": lambda: unpack_int24(buffer, np.float32),
+        "pack_int24": lambda: pack_int24(ndarray.T),
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "audio.wav")
+        settings["save_audio int24 (wave)"] = lambda: save_audio(path, ndarray, rate, dtype="int24")
+        settings["load_audio int32 (wave)"] = lambda: load_audio(path, backends=["wave"])
+        settings["load_audio int32 (soundfile)"] = lambda: load_audio(path, backends=["soundfile"])
+        for setting, func in settings.items():
+            print(f"{setting:<30}: {measure(func, num_samples, repeats):8.1f} M samples/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import time
+from typing import Callable
+
+import click
+from decode_speed import generate_fixture
+
+from audiolab.reader import info
+
+FIXTURES = {
+    "wav": ("pcm_s16le", "s16", 16000),
+    "flac": ("flac", "s16", 44100),
+    "mp3": ("libmp3lame", "fltp", 44100),
+    "opus": ("libopus", "s16", 48000),
+}
+
+PROBES = {
+    "soundfile, pyav (default)": lambda file: info(file),
+    "pyav (audi)": lambda file: info(file, backends=["pyav"]),
+    "header (fast=True)": lambda file: info(file, fast=True),
+}
+
+
+def measure(path: str, probe: Callable, num_files: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num_files):
+        # the number of frames is lazy, which is part of the probing
+        _ = probe(path).num_frames
+    return num_files / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option("-d", "--duration", default=10.0, help="Duration of the fixtures in seconds")
+@click.option("-n", "--num-files", default=1000, help="Number of probes per setting")
+def main(duration: float, num_files: int):
+    """
+    Measure the files/sec of audiolab.info with and without the header-only probe.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, (codec, format, rate) in FIXTURES.items():
+            path = os.path.join(tmpdir, f"fixture.{'ogg' if name == 'opus' else name}")
+            generate_fixture(path, codec, format, rate, duration)
+            for setting, probe in PROBES.items():
+                print(f"{name:<5} {setting:<26}: {measure(path, probe, num_files):10.1f} files/sec")
+
+
+if __name__ == "__main__":
+    main()
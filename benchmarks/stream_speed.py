@@ -0,0 +1,60 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from io import BytesIO
+
+import click
+import numpy as np
+
+from audiolab.av.utils import generate_ndarray
+from audiolab.reader import StreamReader
+from audiolab.writer import save_audio
+
+
+@click.command()
+@click.option("-f", "--format", default="webm", help="Container format of the stream")
+@click.option("-r", "--rate", default=16000, help="Sample rate")
+@click.option("-d", "--duration", default=600.0, help="Duration of the stream in seconds")
+@click.option("-c", "--chunk-duration", default=0.1, help="Duration of each pushed chunk in seconds")
+def main(format: str, rate: int, duration: float, chunk_duration: float):
+    """
+    Measure the time per pull of StreamReader over a long stream, which should not grow with the stream length.
+    """
+    ndarray = generate_ndarray(1, int(rate * duration), np.int16)
+    bytes_io = BytesIO()
+    save_audio(
+        bytes_io, ndarray if format in ("WAV", "FLAC") else (ndarray / 32768).astype(np.float32), rate, format=format
+    )
+    data = bytes_io.getvalue()
+    chunk_size = max(int(len(data) * chunk_duration / duration), 1)
+
+    stream_reader = StreamReader()
+    num_chunks = -(-len(data) // chunk_size)
+    elapsed, seconds = [], 0.0
+    for idx in range(0, len(data), chunk_size):
+        start = time.perf_counter()
+        stream_reader.push(data[idx : idx + chunk_size])
+        seconds += sum(frame.shape[-1] / _rate for frame, _rate in stream_reader.pull())
+        elapsed.append(time.perf_counter() - start)
+    seconds += sum(frame.shape[-1] / _rate for frame, _rate in stream_reader.pull(partial=True))
+
+    print(f"pulls: {num_chunks}, decoded: {seconds:.2f} / {duration:.2f} seconds")
+    for name, part in (("first 10%", elapsed[: num_chunks // 10]), ("last 10%", elapsed[-(num_chunks // 10) :])):
+        print(f"{name:<10}: {np.mean(part) * 1e3:8.3f} ms/pull")
+    print(f"{'total':<10}: {sum(elapsed):8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
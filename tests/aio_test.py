@@ -0,0 +1,67 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from io import BytesIO
+
+import numpy as np
+
+from audiolab import StreamReader, aio, info, load_audio
+from audiolab.av.utils import generate_ndarray
+
+
+class TestAio:
+    def test_aio(self, tmp_path, rate=16000):
+        paths = [str(tmp_path / f"audio{idx}.flac") for idx in range(8)]
+        ndarrays = [generate_ndarray(1, rate, np.int16) for _ in paths]
+
+        async def main():
+            await asyncio.gather(
+                *[aio.save_audio(path, ndarrays[idx], rate, format="FLAC") for idx, path in enumerate(paths)]
+            )
+            infos = await asyncio.gather(*[aio.info(path) for path in paths])
+            audios = await asyncio.gather(*[aio.load_audio(path, offset=0.5) for path in paths])
+            frames = [frame async for frame, _ in aio.Reader(paths[0], frame_size=1000)]
+            return infos, audios, frames
+
+        infos, audios, frames = asyncio.run(main())
+        for idx, path in enumerate(paths):
+            _info, (audio, _rate), ndarray = infos[idx], audios[idx], ndarrays[idx]
+            assert _info.duration == info(path).duration == 1
+            assert _rate == rate
+            assert np.array_equal(audio, ndarray[:, rate // 2 :])
+        assert np.array_equal(np.concatenate(frames, axis=1)[:, :rate], load_audio(paths[0])[0])
+
+    def test_stream_reader(self, rate=16000):
+        bytes_io = BytesIO()
+        asyncio.run(aio.save_audio(bytes_io, generate_ndarray(1, rate, np.int16), rate, format="webm"))
+        data = bytes_io.getvalue()
+        chunks = [data[idx : idx + 1024] for idx in range(0, len(data), 1024)]
+
+        async def generate():
+            for chunk in chunks:
+                yield chunk
+
+        async def main():
+            return [frame async for frame, _ in aio.StreamReader().decode(generate())]
+
+        stream_reader = StreamReader()
+        expected = []
+        for chunk in chunks:
+            stream_reader.push(chunk)
+            expected.extend(frame for frame, _ in stream_reader.pull())
+        expected.extend(frame for frame, _ in stream_reader.pull(partial=True))
+        frames = asyncio.run(main())
+        assert len(frames) == len(expected) > 0
+        assert all(np.array_equal(frame, expected[idx]) for idx, frame in enumerate(frames))
@@ -0,0 +1,36 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from audiolab.av.capabilities import get_capabilities, get_index_path, probe_capabilities
+
+
+class TestCapabilities:
+    def test_capabilities(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("AUDIOLAB_CACHE_DIR", str(tmp_path))
+        get_capabilities.cache_clear()
+        try:
+            capabilities = get_capabilities()
+            path = get_index_path()
+            assert tmp_path in path.parents
+            with open(path) as f:
+                assert json.load(f) == capabilities
+            # written through a temporary file, which is renamed
+            assert list(path.parent.iterdir()) == [path]
+            assert capabilities == probe_capabilities()
+            assert "wav" in capabilities["containers"]
+            assert "s16" in capabilities["codecs"]["r"]["pcm_s16le"]["formats"]
+        finally:
+            get_capabilities.cache_clear()
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
+import sys
+
 import pytest
 
 from audiolab.av.codec import Decodec, Encodec, decodecs, encodecs
@@ -27,6 +30,7 @@ class TestCodec:
         assert _codec.mode == "r"
         assert _codec.type == "audio"
         assert _codec.audio_formats is not None
+        assert _codec.__doc__.startswith(codec.canonical_name)
         for format in _codec.audio_formats:
             assert _codec.name in get_codecs(format.name, "r")
 
@@ -38,5 +42,10 @@ class TestCodec:
         assert _codec.mode == "w"
         assert _codec.type == "audio"
         assert _codec.audio_formats is not None
+        assert _codec.__doc__.startswith(codec.canonical_name)
         for format in _codec.audio_formats:
             assert _codec.name in get_codecs(format.name, "w")
+
+    def test_lazy_codecs(self):
+        code = "import audiolab, audiolab.av.codec as codec; assert not codec._codec_manager._initialized"
+        subprocess.check_call([sys.executable, "-c", code])
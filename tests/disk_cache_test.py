@@ -0,0 +1,108 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+
+from audiolab.av.disk_cache import DiskCache, get_hash
+from audiolab.av.lhotse import AudioCache, get_audio_cache, load_url
+
+
+class TestDiskCache:
+    def test_disk_cache(self, tmp_path):
+        cache = DiskCache(tmp_path, max_bytes=1000)
+        assert cache.get("a") is None
+        cache.put("a", b"0" * 300)
+        cache.put("b", b"0" * 300)
+        # content-addressed: the same bytes are stored once
+        assert cache.num_bytes == 300
+        assert cache.get("b") == b"0" * 300
+
+        # the modification time is the last access, the least recently used values are evicted first
+        for idx, key in enumerate("bcdef"):
+            if key != "b":
+                cache.put(key, bytes([idx]) * 300)
+            os.utime(cache.object_path(cache.key_path(key).read_text()), (idx + 1, idx + 1))
+        # the keys of the evicted values are removed by the eviction
+        assert not cache.key_path("c").exists()
+        assert cache.get("a") is None
+        assert cache.get("c") is None
+        assert cache.get("f") == bytes([4]) * 300
+        assert cache.num_bytes <= 1000 * 0.9
+
+        # corrupted files are cache misses
+        cache.object_path(cache.key_path("f").read_text()).write_bytes(b"1" * 10)
+        assert cache.get("f") is None
+        cache.clear()
+        assert cache.num_bytes == 0
+
+    def test_put_cached(self, tmp_path, monkeypatch):
+        cache = DiskCache(tmp_path)
+        cache.put("a", b"0" * 300)
+        hashed = []
+        monkeypatch.setattr("audiolab.av.disk_cache.get_hash", lambda data: hashed.append(data) or get_hash(data))
+        # the cached keys are not hashed again
+        cache.put("a", b"0" * 300)
+        assert hashed == ["a"]
+        assert cache.get("a") == b"0" * 300
+
+    def test_multiprocess(self, tmp_path):
+        code = f"from audiolab.av.disk_cache import DiskCache; DiskCache({str(tmp_path)!r}).put('key', b'value')"
+        subprocess.check_call([sys.executable, "-c", code])
+        assert DiskCache(tmp_path).get("key") == b"value"
+
+    def test_audio_cache(self, tmp_path):
+        path = tmp_path / "audio.bin"
+        path.write_bytes(os.urandom(1000))
+        url = path.as_uri()
+        cache = AudioCache()
+        cache.setup_disk_cache(tmp_path / "cache")
+        assert load_url(url, cache=cache).getvalue() == path.read_bytes()
+        cache.clear_cache()
+        # the disk tier is checked before the network
+        expected = path.read_bytes()
+        path.unlink()
+        assert load_url(url, cache=cache).getvalue() == expected
+        assert cache.try_cache(url) == expected
+        assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "bytes": 1000, "entries": 1}
+
+    def test_lru(self):
+        cache = AudioCache(max_cache_memory=1000, max_cache_elements=3)
+        for key in "abc":
+            cache.add_to_cache(key, b"0" * 100)
+        # the recently used elements are kept
+        assert cache.try_cache("a") is not None
+        cache.add_to_cache("d", b"0" * 100)
+        assert cache.try_cache("b") is None
+        assert cache.cache_memory == 300
+        cache.add_to_cache("e", b"0" * 250)
+        cache.add_to_cache("f", b"0" * 250)
+        cache.add_to_cache("g", b"0" * 250)
+        assert cache.try_cache("e") is not None
+        assert cache.try_cache("a") is None
+        # the elements larger than max_element_memory are not admitted
+        cache.add_to_cache("h", b"0" * 251)
+        assert cache.try_cache("h") is None
+        assert cache.stats() == {"hits": 2, "misses": 3, "evictions": 4, "bytes": 750, "entries": 3}
+        cache.clear_cache()
+        assert cache.cache_memory == 0
+        assert get_audio_cache() is get_audio_cache()
+
+        # the methods called on the class use the shared cache
+        AudioCache.add_to_cache("key", b"value")
+        assert AudioCache.try_cache("key") == b"value"
+        assert get_audio_cache().cache_dict["key"] == b"value"
+        AudioCache.clear_cache()
+        assert get_audio_cache().try_cache("key") is None
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
+import sys
+
 import numpy as np
 import pytest
-from av.filter import filters_available
+from av.filter import Filter, filters_available
 
 from audiolab.av import aformat, filter
 from audiolab.av.format import format_dtypes, get_format
@@ -27,6 +30,16 @@ class TestFilter:
         assert _name == name
         assert args is None
         assert kwargs == {}
+        assert getattr(filter, name).__doc__.startswith(Filter(name).description)
+
+    def test_lazy_filter(self):
+        code = (
+            "from audiolab.av import aformat, filter;"
+            "aformat(rate=16000);"
+            "assert filter._filter_manager._filter_data == {};"
+            "assert not filter._filter_manager._initialized"
+        )
+        subprocess.check_call([sys.executable, "-c", code])
 
     def test_aformat(self):
         for is_planar in (True, False):
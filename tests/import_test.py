@@ -0,0 +1,38 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pytest
+
+import audiolab
+
+
+def imported_modules(statement: str):
+    modules = ("av", "humanize", "jinja2", "requests", "smart_open", "soundfile")
+    code = f"import sys; {statement}; print(' '.join(m for m in {modules} if m in sys.modules))"
+    return subprocess.check_output([sys.executable, "-c", code], text=True).split()
+
+
+class TestImport:
+    @pytest.mark.parametrize("name", audiolab.__all__)
+    def test_public_names(self, name):
+        assert getattr(audiolab, name) is not None
+        assert name in dir(audiolab)
+
+    def test_lazy_import(self):
+        assert imported_modules("import audiolab") == []
+        assert imported_modules("import audiolab; audiolab.info") == ["av", "soundfile"]
+        assert imported_modules("import audiolab; audiolab.save_audio") == ["av", "soundfile"]
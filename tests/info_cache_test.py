@@ -0,0 +1,82 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from audiolab.av.utils import generate_ndarray
+from audiolab.reader import info
+from audiolab.reader.backend import Backend
+from audiolab.reader.info_cache import CachedInfo, InfoCache
+from audiolab.writer import save_audio
+
+
+class TestInfoCache:
+    def test_info_cache(self, tmp_path):
+        path = str(tmp_path / "audio.flac")
+        save_audio(path, generate_ndarray(2, 16000, np.int16), 16000, format="FLAC")
+        cache = InfoCache(tmp_path / "info.sqlite")
+
+        _info = info(path, cache=cache)
+        assert not isinstance(_info.backend, CachedInfo)
+        cached = info(path, cache=cache)
+        assert isinstance(cached.backend, CachedInfo)
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1}
+        for field in ("rate", "channels", "num_frames", "duration", "codec", "format", "bit_rate", "dtype"):
+            assert getattr(cached, field) == getattr(_info, field)
+        assert str(cached) == str(_info)
+        # the cached information is not a backend, which reads the audio
+        assert not isinstance(cached.backend, Backend)
+
+        # the duration of forced decoding is not served by an entry without it
+        assert not isinstance(info(path, forced_decoding=True, cache=cache).backend, CachedInfo)
+        assert isinstance(info(path, forced_decoding=True, cache=cache).backend, CachedInfo)
+        assert isinstance(info(path, cache=cache).backend, CachedInfo)
+
+        # modified files are probed again
+        save_audio(path, generate_ndarray(1, 8000, np.int16), 8000, format="FLAC")
+        _info = info(path, cache=cache)
+        assert not isinstance(_info.backend, CachedInfo)
+        assert _info.rate == 8000
+
+    def test_eviction(self, tmp_path):
+        cache = InfoCache(tmp_path / "info.sqlite", max_entries=2)
+        paths = []
+        for idx in range(4):
+            paths.append(str(tmp_path / f"audio{idx}.wav"))
+            save_audio(paths[-1], generate_ndarray(1, 1600, np.int16), 16000)
+            info(paths[-1], cache=cache)
+        assert len(cache) == 2
+        assert cache.evictions == 2
+        # the least recently used entries are evicted
+        assert cache.get(paths[0]) is None
+        assert cache.get(paths[-1]) is not None
+
+    def test_backends(self, tmp_path):
+        path = str(tmp_path / "audio.flac")
+        save_audio(path, generate_ndarray(2, 16000, np.int16), 16000, format="FLAC")
+        cache = InfoCache(tmp_path / "info.sqlite")
+
+        # the header backend has no tags, and PyAV names the formats and codecs differently from soundfile
+        fast = info(path, fast=True, cache=cache)
+        _info = info(path, cache=cache)
+        assert not isinstance(_info.backend, CachedInfo)
+        _pyav = info(path, backends=["pyav"], cache=cache)
+        assert not isinstance(_pyav.backend, CachedInfo)
+        assert len(cache) == 3
+        for expected in (fast, _info, _pyav):
+            kwargs = {"fast": True} if expected is fast else {}
+            backends = ["pyav"] if expected is _pyav else None
+            cached = info(path, backends=backends, cache=cache, **kwargs)
+            assert isinstance(cached.backend, CachedInfo)
+            assert str(cached) == str(expected)
@@ -0,0 +1,70 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+from audiolab.av.utils import generate_ndarray
+from audiolab.reader import Reader
+from audiolab.reader.prefetch import prefetch
+from audiolab.writer import save_audio
+
+
+def prefetch_threads():
+    return [thread for thread in threading.enumerate() if thread.name == "audiolab-prefetch"]
+
+
+class TestPrefetch:
+    def test_prefetch(self):
+        assert list(prefetch(range(100), 4)) == list(range(100))
+        assert list(prefetch([], 4)) == []
+
+    def test_exception(self):
+        def generate():
+            yield 1
+            raise ValueError("corrupted")
+
+        iterator = prefetch(generate(), 4)
+        assert next(iterator) == 1
+        with pytest.raises(ValueError, match="corrupted"):
+            next(iterator)
+        assert prefetch_threads() == []
+
+    def test_close(self):
+        closed = threading.Event()
+
+        def generate():
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.set()
+
+        iterator = prefetch(generate(), 2)
+        assert next(iterator) == 1
+        iterator.close()
+        assert closed.is_set()
+        assert prefetch_threads() == []
+
+    def test_reader(self):
+        bytes_io = BytesIO()
+        save_audio(bytes_io, generate_ndarray(2, 16000, np.int16), 16000)
+        frames = [frame for frame, _ in Reader(BytesIO(bytes_io.getvalue()), frame_size=1024, rate=8000)]
+        prefetched = [frame for frame, _ in Reader(bytes_io, frame_size=1024, rate=8000, prefetch=4)]
+        assert len(frames) == len(prefetched)
+        for idx, frame in enumerate(frames):
+            assert np.array_equal(frame, prefetched[idx])
@@ -14,12 +14,17 @@
 
 from io import BytesIO
 
+import av
 import numpy as np
 import pytest
+import soundfile as sf
 
 from audiolab.av.filter import aresample, atempo
-from audiolab.av.utils import generate_ndarray
-from audiolab.reader import Reader, aformat, load_audio
+from audiolab.av.utils import generate_audio, generate_ndarray
+from audiolab.reader import Reader, aformat, info, load_audio, load_audio_batch
+from audiolab.reader.backend import header
+from audiolab.reader.info import Info
+from audiolab.reader.pcm_cache import PCMCache
 from audiolab.writer import save_audio
 
 
@@ -94,3 +99,252 @@ class TestReader:
         assert audio.dtype == np.float32
         assert audio.shape == (1, int(rate * duration))
         assert rate == 8000
+
+    @pytest.mark.parametrize(
+        "codec, extension",
+        [
+            ("flac", "flac"),
+            ("libmp3lame", "mp3"),
+            ("libopus", "ogg"),
+            ("aac", "adts"),
+            ("aac", "m4a"),
+            ("libopus", "webm"),
+        ],
+    )
+    def test_forced_decoding(self, tmp_path, codec, extension):
+        rate = 48000
+        path = str(tmp_path / f"audio.{extension}")
+        generate_audio(path, codec, generate_ndarray(1, rate + 123, np.float32), rate, frame_size=960)
+
+        with av.open(path) as container:
+            num_frames = sum(frame.samples for frame in container.decode(audio=0))
+        _info = Info(path, forced_decoding=True, backends=["pyav"])
+        assert _info.num_frames == num_frames
+        # counted by demuxing only, except for the containers with timestamps in milliseconds or edit lists
+        num_samples = Info(path, backends=["pyav"]).backend.count_samples()
+        assert num_samples == (None if extension in ("m4a", "webm") else num_frames)
+
+    @pytest.mark.parametrize(
+        "codec, format, extension",
+        [("flac", "s16", "flac"), ("libmp3lame", "fltp", "mp3"), ("libopus", "s16", "ogg"), ("aac", "fltp", "adts")],
+    )
+    def test_header_backend(self, tmp_path, codec, format, extension):
+        rate = 48000
+        path = str(tmp_path / f"audio.{extension}")
+        ndarray = generate_ndarray(2, rate, np.int16 if format == "s16" else np.float32)
+        generate_audio(path, codec, ndarray, rate, format, frame_size=960)
+
+        decoded = info(path, forced_decoding=True, backends=["pyav"])
+        with open(path, "rb") as f:
+            bytes_io = BytesIO(f.read())
+        for file in (path, bytes_io):
+            _info = info(file, fast=True)
+            if extension == "adts":
+                # not parsed by the header backend
+                assert not isinstance(_info.backend, header)
+                continue
+            assert isinstance(_info.backend, header)
+            assert _info.rate == decoded.rate
+            assert _info.channels == decoded.channels
+            assert _info.codec == decoded.codec
+            assert _info.num_frames == decoded.num_frames
+            assert not isinstance(file, BytesIO) or file.tell() == 0
+
+        with pytest.raises(ValueError):
+            Info(BytesIO(b"\x00" * 1024), backends=["header"])
+        # the header backend does not read the audio frames
+        with pytest.raises(ValueError):
+            Reader(path, backends=["header"])
+
+    @pytest.mark.parametrize("backend", ["soundfile", "pyav", "wave", "memmap"])
+    def test_segments(self, tmp_path, rate, backend):
+        path = str(tmp_path / "audio.wav")
+        save_audio(path, generate_ndarray(2, rate * 5, np.int16), rate)
+        ranges = [(2.0, 3.0), (0.5, 1.0), (0.8, 1.5), (1.5, 2.0), (4.0, None), (0, 0.25)]
+        segments = list(Reader(path, backends=[backend]).segments(ranges))
+        assert len(segments) == len(ranges)
+        for idx, (segment, _rate) in enumerate(segments):
+            start, end = ranges[idx]
+            duration = None if end is None else end - start
+            audio, _ = load_audio(path, offset=start, duration=duration, backends=[backend])
+            assert _rate == rate
+            assert np.array_equal(audio, segment)
+
+        for idx, (segment, _rate) in enumerate(Reader(path, rate=8000).segments(ranges)):
+            start, end = ranges[idx]
+            assert _rate == 8000
+            assert segment.shape == (2, int((5 if end is None else end) * 8000) - int(start * 8000))
+
+        # the spans at 0 rewind the readers which are read already
+        expected, _ = load_audio(path, duration=1.0, backends=[backend])
+        for consume in (lambda reader: list(reader.segments([(0, 1.0)])), Reader.read, list):
+            reader = Reader(path, backends=[backend])
+            consume(reader)
+            ((segment, _),) = reader.segments([(0, 1.0)])
+            assert np.array_equal(segment, expected)
+
+    @pytest.mark.parametrize("subtype", ["PCM_S8", "PCM_U8"])
+    def test_native_dtype(self, tmp_path, rate, subtype):
+        path = str(tmp_path / ("audio.aiff" if subtype == "PCM_S8" else "audio.wav"))
+        ndarray = np.random.randint(-128, 128, (rate, 2)).astype(np.int8)
+        sf.write(path, ndarray.astype(np.int16) << 8, rate, subtype=subtype)
+        # 8-bit samples are read exactly, without float intermediates
+        expected = ndarray if subtype == "PCM_S8" else ndarray.view(np.uint8) ^ 0x80
+        audio, _ = load_audio(path, backends=["soundfile"])
+        assert audio.dtype == expected.dtype
+        assert np.array_equal(audio, expected.T)
+
+        # FFmpeg has no signed 8-bit sample format, so the frames are read without a filter graph
+        frames = [frame for frame, _ in Reader(path, backends=["soundfile"], channels_last=True)]
+        assert all(frame.shape[1] == 2 and frame.flags.c_contiguous for frame in frames)
+        assert np.array_equal(np.concatenate(frames), expected)
+
+    def test_threads(self, tmp_path, rate, duration):
+        path = str(tmp_path / "audio.flac")
+        save_audio(path, generate_ndarray(2, int(rate * duration), np.int16), rate, format="FLAC")
+        audio, _ = load_audio(path, backends=["pyav"])
+        for threads in (0, 1, 2):
+            reader = Reader(path, backends=["pyav"], threads=threads)
+            assert reader.backend.stream.codec_context.thread_count == threads
+            assert np.array_equal(audio, np.concatenate([frame for frame, _ in reader], axis=1))
+
+    @pytest.mark.parametrize("nb_channels", [1, 2])
+    @pytest.mark.parametrize("backend", ["soundfile", "pyav", "memmap"])
+    def test_read_into(self, tmp_path, nb_channels, rate, duration, backend):
+        path = str(tmp_path / "audio.wav")
+        save_audio(path, generate_ndarray(nb_channels, int(rate * duration), np.int16), rate)
+        for kwargs in ({}, {"offset": 0.1, "duration": 0.2}, {"rate": 8000}, {"to_mono": True, "dtype": np.float32}):
+            audio, _rate = load_audio(path, backends=[backend], **kwargs)
+            out, __rate = Reader(path, backends=[backend], **kwargs).read()
+            assert _rate == __rate
+            assert out.dtype == audio.dtype
+            assert np.array_equal(audio, out)
+
+            reader = Reader(path, backends=[backend], **kwargs)
+            out = np.zeros((reader.out_channels, audio.shape[1] + 100), reader.out_dtype)
+            num_frames = 0
+            while True:
+                # read in uneven chunks which split the decoded frames
+                frames = reader.read_into(out[:, : num_frames + 777], num_frames)
+                if frames == 0:
+                    break
+                num_frames += frames
+            assert num_frames == audio.shape[1]
+            assert np.array_equal(audio, out[:, :num_frames])
+
+    @pytest.mark.parametrize("subtype", ["PCM_U8", "PCM_16", "PCM_24", "PCM_32", "FLOAT", "DOUBLE"])
+    @pytest.mark.parametrize("format", ["WAV", "RF64"])
+    def test_memmap_backend(self, tmp_path, rate, duration, subtype, format):
+        path = str(tmp_path / "audio.wav")
+        sf.write(path, generate_ndarray(2, int(rate * duration), np.float32).T, rate, subtype, format=format)
+
+        reader = Reader(path, backends=["memmap"])
+        assert reader.backend.__class__.__name__ == "MemMap"
+        assert reader.channels == 2
+        assert reader.rate == rate
+        assert reader.num_frames == int(rate * duration)
+        for offset, _duration in ((0, None), (0.1, 0.2)):
+            expected, _ = load_audio(path, offset=offset, duration=_duration, backends=["pyav"])
+            audio, _ = load_audio(path, offset=offset, duration=_duration, backends=["memmap"])
+            assert audio.dtype == expected.dtype
+            assert np.array_equal(audio, expected)
+
+    def test_seek_index(self, tmp_path, rate):
+        path = str(tmp_path / "audio.aac")
+        generate_audio(path, "aac", generate_ndarray(1, rate * 10, np.float32) * 0.5, rate, container_format="adts")
+
+        audio, _ = load_audio(path)
+        for offset in (1.5, 4.0, 8.25):
+            segment, _ = load_audio(path, offset=offset, duration=1.0, seek_index=tmp_path)
+            start = int(offset * rate)
+            assert segment.shape == (1, rate)
+            assert np.allclose(segment, audio[:, start : start + rate], atol=1e-4)
+        assert len(list(tmp_path.glob("audio.aac.*.npz"))) == 1
+
+        reader = Reader(path, seek_index=tmp_path)
+        assert reader.backend.seek_index is not None
+        ranges = [(1.5, 2.5), (8.25, 9.25)]
+        for idx, (segment, _) in enumerate(reader.segments(ranges)):
+            start = int(ranges[idx][0] * rate)
+            assert np.allclose(segment, audio[:, start : start + rate], atol=1e-4)
+        # the index is kept unless seeking by bytes fails
+        assert reader.backend.seek_index is not None
+
+    def test_load_audio_batch(self, nb_channels, rate, duration):
+        files = []
+        for idx in range(4):
+            bytes_io = BytesIO()
+            save_audio(bytes_io, generate_ndarray(nb_channels, int(rate * duration) * (idx + 1), np.int16), rate)
+            files.append(bytes_io.getvalue())
+        files.insert(2, b"corrupted")
+
+        for executor in ("thread", "process"):
+            results = load_audio_batch(files, num_workers=2, executor=executor)
+            assert isinstance(results[2], Exception)
+            for idx in (0, 1, 3, 4):
+                audio, _rate = load_audio(files[idx])
+                assert _rate == results[idx][1]
+                assert np.array_equal(audio, results[idx][0])
+
+        audios, lengths, _rate, errors = load_audio_batch(files, padded=True, rate=8000)
+        assert _rate == 8000
+        assert audios.shape == (5, nb_channels, int(8000 * duration) * 4)
+        assert lengths.tolist() == [int(8000 * duration) * n for n in (1, 2, 0, 3, 4)]
+        assert [error is None for error in errors] == [True, True, False, True, True]
+        for idx, audio in enumerate(audios):
+            assert not audio[:, lengths[idx] :].any()
+
+        # the audios which can't be stacked with the first loaded one fail, the others are kept
+        bytes_io = BytesIO()
+        save_audio(bytes_io, generate_ndarray(nb_channels, rate, np.int16), rate * 2)
+        files.append(bytes_io.getvalue())
+        audios, lengths, _rate, errors = load_audio_batch(files, padded=True)
+        assert _rate == rate
+        assert lengths.tolist() == [int(rate * duration) * n for n in (1, 2, 0, 3, 4)] + [0]
+        assert [error is None for error in errors] == [True, True, False, True, True, False]
+        assert isinstance(errors[-1], ValueError)
+
+    def test_pcm_cache(self, tmp_path, rate, duration, monkeypatch):
+        path = str(tmp_path / "audio.flac")
+        save_audio(path, generate_ndarray(2, int(rate * duration), np.int16), rate, format="FLAC")
+        cache = PCMCache()
+        kwargs = {"offset": 0.1, "rate": 8000, "to_mono": True, "dtype": np.float32}
+        expected, _ = load_audio(path, **kwargs)
+        audio, _rate = load_audio(path, cache=cache, **kwargs)
+        assert _rate == 8000 and np.array_equal(audio, expected)
+        assert not audio.flags.writeable
+
+        # the hits do not open the file
+        monkeypatch.setattr("audiolab.reader.Reader", None)
+        audio, _ = load_audio(path, cache=cache, always_2d=False, **kwargs)
+        assert np.array_equal(audio, expected[0])
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "bytes": expected.nbytes, "entries": 1}
+        monkeypatch.undo()
+
+        # the other parameters and the modified files are misses
+        load_audio(path, cache=cache, **{**kwargs, "rate": 16000})
+        save_audio(path, generate_ndarray(2, int(rate * duration) * 2, np.int16), rate, format="FLAC")
+        audio, _ = load_audio(path, cache=cache, **kwargs)
+        assert np.array_equal(audio, load_audio(path, **kwargs)[0])
+        assert cache.stats()["misses"] == 3
+
+        cache = PCMCache(max_bytes=audio.nbytes * 2)
+        for offset in (0.1, 0.2, 0.3):
+            load_audio(path, cache=cache, **{**kwargs, "offset": offset})
+        assert len(cache) == 2 and cache.stats()["evictions"] == 1
+
+    def test_pcm_cache_backends(self, tmp_path):
+        rate = 48000
+        path = str(tmp_path / "audio.mp3")
+        generate_audio(path, "libmp3lame", generate_ndarray(1, rate, np.float32) / 2, rate, frame_size=1152)
+
+        cache = PCMCache()
+        audios = []
+        for backend in ("soundfile", "pyav"):
+            audio, _ = load_audio(path, backends=[backend], cache=cache)
+            expected, _ = load_audio(path, backends=[backend])
+            assert audio.dtype == expected.dtype and np.array_equal(audio, expected)
+            audios.append(audio)
+        # the backends decode differently, so each one is a cache miss
+        assert audios[0] is not audios[1]
+        assert cache.stats()["misses"] == 2 and len(cache) == 2
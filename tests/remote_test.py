@@ -0,0 +1,134 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from audiolab.av.lhotse import HTTPSession
+from audiolab.av.remote import RemoteFile
+from audiolab.av.utils import generate_ndarray
+from audiolab.reader import info, load_audio
+from audiolab.writer import save_audio
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    # http.server does not support range requests, nor keep-alive connections with HTTP/1.0
+    protocol_version = "HTTP/1.1"
+    num_bytes = 0
+    accept_ranges = True
+    clients = set()
+
+    def do_GET(self):
+        type(self).clients.add(self.client_address)
+        if self.path.startswith("/redirect/"):
+            self.send_response(302)
+            self.send_header("Location", self.path[len("/redirect") :])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        path = self.translate_path(self.path)
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if not self.accept_ranges or match is None:
+            data = open(path, "rb").read()
+            self.send_response(200)
+        else:
+            size = os.path.getsize(path)
+            start = int(match.group(1))
+            end = min(int(match.group(2) or size - 1), size - 1)
+            with open(path, "rb") as f:
+                f.seek(start)
+                data = f.read(end - start + 1)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        type(self).num_bytes += len(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestRemoteFile:
+    @pytest.fixture
+    def server(self, tmp_path):
+        handler = type("Handler", (RangeRequestHandler,), {"clients": set()})
+        server = ThreadingHTTPServer(("127.0.0.1", 0), partial(handler, directory=str(tmp_path)))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}", handler
+        server.shutdown()
+        server.server_close()
+        # drop the keep-alive connections, which are still served by the handler threads of the closed server
+        HTTPSession.setup()
+
+    def test_remote_file(self, tmp_path, server):
+        url, handler = server
+        data = os.urandom(1000_000)
+        (tmp_path / "data.bin").write_bytes(data)
+        f = RemoteFile(f"{url}/data.bin", block_size=4096, max_blocks=8, max_read_ahead=4)
+        assert f.size == len(data)
+        assert f.read(10) == data[:10]
+        f.seek(500_000)
+        assert f.read(10000) == data[500_000:510_000]
+        f.seek(-100, os.SEEK_END)
+        assert f.read() == data[-100:]
+        assert f.read(10) == b""
+        assert len(f.blocks) <= 8
+        assert handler.num_bytes < 40000
+
+        handler.accept_ranges = False
+        f = RemoteFile(f"{url}/data.bin", block_size=4096)
+        f.seek(500_000)
+        assert f.read(10000) == data[500_000:510_000]
+        assert f.num_requests == 1
+
+    def test_partial_read(self, tmp_path, server, rate=16000):
+        url, handler = server
+        path = str(tmp_path / "audio.wav")
+        save_audio(path, generate_ndarray(1, rate * 600, np.int16), rate)
+
+        _info = info(f"{url}/audio.wav")
+        assert isinstance(_info.file, RemoteFile)
+        assert _info.duration == 600
+        assert _info.size == os.path.getsize(path)
+        assert handler.num_bytes < 100_000
+
+        for backend in ("soundfile", "pyav"):
+            handler.num_bytes = 0
+            audio, _ = load_audio(f"{url}/audio.wav", offset=300, duration=10, backends=[backend])
+            expected, _ = load_audio(path, offset=300, duration=10, backends=[backend])
+            assert np.array_equal(audio, expected)
+            # 10 seconds (320 KB), the headers, the probing of FFmpeg and the read-ahead, instead of 600 seconds
+            assert handler.num_bytes < os.path.getsize(path) / 10
+
+    def test_http_session(self, tmp_path, server, rate=16000):
+        url, handler = server
+        path = str(tmp_path / "audio.wav")
+        save_audio(path, generate_ndarray(1, rate, np.int16), rate)
+        expected, _ = load_audio(path)
+        for _ in range(4):
+            # the redirects are followed by the GET requests
+            for kwargs in ({}, {"offset": 0.5}, {"cache_url": True}):
+                audio, _ = load_audio(f"{url}/redirect/audio.wav", **kwargs)
+                assert np.array_equal(audio, expected[:, int(kwargs.get("offset", 0) * rate) :])
+        # the keep-alive connections are reused
+        assert len(handler.clients) == 1
+        assert HTTPSession.get() is HTTPSession.get()
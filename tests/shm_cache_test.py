@@ -0,0 +1,99 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from audiolab.av.utils import generate_ndarray
+from audiolab.reader import load_audio
+from audiolab.reader.shm_cache import SharedPCMCache
+from audiolab.writer import save_audio
+
+
+class TestSharedPCMCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = SharedPCMCache(tmp_path / "index.sqlite", max_bytes=100_000)
+        yield cache
+        cache.clear()
+
+    def test_shared(self, tmp_path, cache, rate=16000):
+        path = str(tmp_path / "audio.flac")
+        save_audio(path, generate_ndarray(2, rate, np.int16), rate, format="FLAC")
+        expected, _ = load_audio(path, to_mono=True)
+        audio, _rate = load_audio(path, to_mono=True, cache=cache)
+        _audio, _ = load_audio(path, to_mono=True, cache=cache)
+        assert _rate == rate and np.array_equal(audio, expected)
+        # zero-copy read-only views of the same segment
+        assert np.shares_memory(audio, _audio)
+        assert not _audio.flags.writeable
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "bytes": expected.nbytes, "entries": 1}
+
+        # the other processes attach to the segment instead of decoding
+        code = (
+            "import numpy as np; from audiolab.reader import load_audio, SharedPCMCache; "
+            f"cache = SharedPCMCache({str(cache.path)!r}); "
+            f"audio, _ = load_audio({path!r}, to_mono=True, cache=cache); "
+            "assert cache.stats()['hits'] == 1; print(int(audio.astype(np.int64).sum()))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert int(output) == int(expected.astype(np.int64).sum())
+
+    def test_hits(self, cache):
+        cache.put(("a",), np.ones((1, 1000), np.float32), 16000)
+        refs = "SELECT COUNT(*) FROM refs WHERE name = ?"
+        name = cache.get_name(("a",))
+        connection = cache.connect()
+        gc.collect()
+        cache.flush()
+        assert connection.execute(refs, (name,)).fetchone()[0] == 0
+
+        # the first hit references the segment, the next hits and the releases do not write the index
+        audio, _ = cache.get(("a",))
+        num_changes = connection.total_changes
+        for _ in range(10):
+            _audio, _ = cache.get(("a",))
+            del _audio
+        del audio
+        gc.collect()
+        assert connection.total_changes == num_changes
+        assert connection.execute(refs, (name,)).fetchone()[0] == 1
+        cache.flush()
+        assert connection.execute(refs, (name,)).fetchone()[0] == 0
+
+    def test_eviction(self, cache):
+        audios = [np.full((1, 10_000), idx, np.float32) for idx in range(3)]
+        audio, _ = cache.put(("a",), audios[0], 16000)
+        _audio, _ = cache.put(("b",), audios[1], 16000)
+        # the referenced segments are not evicted, and the audios are not admitted if they don't fit
+        assert cache.put(("c",), audios[2], 16000)[0] is audios[2]
+        assert cache.get(("c",)) is None and len(cache) == 2
+        del _audio
+        gc.collect()
+
+        # a crashed process does not hold its references
+        code = (
+            "import os; from audiolab.reader import SharedPCMCache; "
+            f"audio, _ = SharedPCMCache({str(cache.path)!r}).get(('b',)); os._exit(0)"
+        )
+        subprocess.check_call([sys.executable, "-c", code])
+        _audio, _ = cache.put(("c",), audios[2], 16000)
+        assert np.array_equal(_audio, audios[2]) and _audio is not audios[2]
+        assert cache.get(("b",)) is None
+        assert np.array_equal(cache.get(("a",))[0], audio)
+        assert cache.stats()["evictions"] == 1
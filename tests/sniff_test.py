@@ -0,0 +1,59 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from io import BytesIO
+
+import numpy as np
+import pytest
+
+from audiolab.av.utils import generate_audio, generate_ndarray
+from audiolab.reader.backend import pyav
+from audiolab.reader.info import Info
+from audiolab.reader.sniff import get_soundfile_formats, sniff_backends, sniff_format
+
+
+class TestSniff:
+    @pytest.mark.parametrize(
+        "codec, extension, format",
+        [
+            ("pcm_s16le", "wav", "WAV"),
+            ("flac", "flac", "FLAC"),
+            ("libopus", "ogg", "OGG"),
+            ("libmp3lame", "mp3", "MP3"),
+            ("aac", "m4a", ""),
+            ("aac", "adts", ""),
+            ("libopus", "webm", ""),
+        ],
+    )
+    def test_sniff(self, tmp_path, codec, extension, format):
+        path = str(tmp_path / f"audio.{extension}")
+        generate_audio(path, codec, generate_ndarray(1, 48000, np.float32), 48000, frame_size=960)
+
+        with open(path, "rb") as f:
+            bytes_io = BytesIO(f.read())
+        for file in (path, bytes_io):
+            backends = sniff_backends(file)
+            assert bytes_io.tell() == 0
+            if format in get_soundfile_formats():
+                assert backends == ["soundfile", "pyav"]
+            else:
+                assert backends == ["pyav"]
+                assert isinstance(Info(file).backend, pyav)
+
+    def test_sniff_format(self):
+        assert sniff_format(b"RIFF\x00\x00\x00\x00WAVEfmt ") == "WAV"
+        assert sniff_format(b"RIFF\x00\x00\x00\x00AVI LIST") is None
+        assert sniff_format(b"\x00\x00\x00\x20ftypM4A ") == ""
+        assert sniff_format(b"\x00" * 64) is None
+        assert sniff_backends(b"not a file") == ["soundfile", "pyav"]
@@ -0,0 +1,94 @@
+# Copyright (c) 2025 Zhendong Peng (pzd17@tsinghua.org.cn)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from io import BytesIO
+
+import av
+import numpy as np
+import pytest
+
+from audiolab.av.utils import generate_ndarray
+from audiolab.reader import StreamReader, load_audio
+from audiolab.writer import save_audio
+
+
+class TestStreamReader:
+    @pytest.mark.parametrize("format", ["WAV", "FLAC", "webm"])
+    @pytest.mark.parametrize("chunk_size", [100, 4096])
+    def test_stream_reader(self, format, chunk_size, rate=16000):
+        bytes_io = BytesIO()
+        ndarray = generate_ndarray(2, rate * 5, np.int16)
+        save_audio(bytes_io, ndarray if format != "webm" else (ndarray / 32768).astype(np.float32), rate, format=format)
+        data = bytes_io.getvalue()
+        expected, _ = load_audio(BytesIO(data))
+
+        stream_reader = StreamReader(frame_size=1024)
+        frames = []
+        for idx in range(0, len(data), chunk_size):
+            stream_reader.push(data[idx : idx + chunk_size])
+            frames.extend(frame for frame, _ in stream_reader.pull())
+        # the frames are decoded as the bytes are pushed, not at the end
+        assert len(frames) > 0
+        frames.extend(frame for frame, _ in stream_reader.pull(partial=True))
+        assert all(frame.shape[1] == 1024 for frame in frames[:-1])
+        assert np.array_equal(np.concatenate(frames, axis=1), expected)
+        # each byte is demuxed once, and dropped afterwards
+        assert stream_reader.decoder.input.num_bytes == len(data)
+        assert len(stream_reader.decoder.input.buffer) == 0
+
+        stream_reader.reset()
+        stream_reader.push(data)
+        audio = np.concatenate([frame for frame, _ in stream_reader.pull(partial=True)], axis=1)
+        assert np.array_equal(audio, expected)
+
+    def test_filters(self, rate=16000):
+        bytes_io = BytesIO()
+        save_audio(bytes_io, generate_ndarray(2, rate * 2, np.int16), rate, format="FLAC")
+        data = bytes_io.getvalue()
+        stream_reader = StreamReader(dtype=np.float32, rate=8000, to_mono=True, frame_size=None)
+        for idx in range(0, len(data), 1024):
+            stream_reader.push(data[idx : idx + 1024])
+        frames = list(stream_reader.pull(partial=True))
+        assert all(_rate == 8000 for _, _rate in frames)
+        audio = np.concatenate([frame for frame, _ in frames], axis=1)
+        expected, _ = load_audio(BytesIO(data), dtype=np.float32, rate=8000, to_mono=True)
+        assert audio.shape == expected.shape
+        assert np.allclose(audio, expected, atol=1e-4)
+
+    def test_push_after_flush(self, rate=16000):
+        bytes_io = BytesIO()
+        save_audio(bytes_io, generate_ndarray(1, rate, np.int16), rate, format="FLAC")
+        data = bytes_io.getvalue()
+        stream_reader = StreamReader()
+        for _ in range(2):
+            stream_reader.push(data)
+            audio = np.concatenate([frame for frame, _ in stream_reader.pull(partial=True)], axis=1)
+            assert audio.shape == (1, rate)
+
+    def test_seeking_formats(self, tmp_path, rate=16000):
+        # the index of MP4 is after the audio data, which can't be demuxed without seeking
+        path = str(tmp_path / "audio.mp4")
+        save_audio(path, generate_ndarray(2, rate * 5, np.float32) / 2, rate, format="mp4")
+        data = open(path, "rb").read()
+        expected, _ = load_audio(path)
+        stream_reader = StreamReader(frame_size=None)
+        for idx in range(0, len(data), 4096):
+            stream_reader.push(data[idx : idx + 4096])
+            assert len(list(stream_reader.pull())) == 0
+        audio = np.concatenate([frame for frame, _ in stream_reader.pull(partial=True)], axis=1)
+        assert np.array_equal(audio, expected)
+
+        stream_reader.push(b"invalid" * 1000)
+        with pytest.raises(av.InvalidDataError):
+            list(stream_reader.pull(partial=True))
@@ -18,7 +18,7 @@ import numpy as np
 import pytest
 
 from audiolab.av.utils import generate_ndarray
-from audiolab.reader import info
+from audiolab.reader import info, load_audio
 from audiolab.writer import save_audio
 
 
@@ -63,3 +63,22 @@ class TestWriter:
             assert np.isclose(_info.duration, duration + 0.014, atol=0.001)  # Pre-skip / Encoder Delay for opus
             assert _info.precision == 32  # always float32 for opus
             assert _info.rate == 48000  # always 48k for opus
+
+    @pytest.mark.parametrize("nb_channels", [1, 2])
+    def test_int24(self, tmp_path, nb_channels, rate):
+        path = str(tmp_path / "audio.wav")
+        ndarray = generate_ndarray(nb_channels, rate, np.int32) & np.int32(-256)
+        save_audio(path, ndarray, rate, dtype="int24")
+        _info = info(path)
+        assert _info.bits_per_sample == 24
+        assert _info.channels == nb_channels
+        # 24-bit samples are read as full scale int32 by all the backends
+        for backend in ("wave", "soundfile", "pyav", "memmap"):
+            audio, _ = load_audio(path, backends=[backend])
+            assert audio.dtype == np.int32
+            assert np.array_equal(audio, ndarray)
+        audio, _ = load_audio(path, dtype=np.float32, backends=["wave"])
+        expected, _ = load_audio(path, dtype=np.float32, backends=["soundfile"])
+        assert np.array_equal(audio, expected)
+        with pytest.raises(ValueError):
+            save_audio(str(tmp_path / "audio.flac"), ndarray, rate, dtype="int24", format="FLAC")